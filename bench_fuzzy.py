@@ -0,0 +1,35 @@
+import random
+import sys
+import timeit
+from fuzzy import FuzzyIndex
+from index import CompactKeywordIndex
+
+# Micro-benchmark of fuzzy keyword lookups over a synthetic vocabulary.
+#
+#   python bench_fuzzy.py [vocabulary size]
+#
+# Builds a FuzzyIndex over random keywords and times lookup() of terms one
+# deletion, one substitution and one transposition away from a keyword.
+
+def _typos(rng, keyword):
+  position = rng.randrange(len(keyword) - 1)
+  return [keyword[:-1],
+          keyword[:position] + rng.choice('abcdefghijklmnopqrstuvwxyz') + keyword[position + 1:],
+          keyword[:position] + keyword[position + 1] + keyword[position] + keyword[position + 2:]]
+
+def main():
+  size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+  rng = random.Random(9)
+  letters = 'abcdefghijklmnopqrstuvwxyz'
+  vocabulary = set(''.join(rng.choice(letters) for _ in range(rng.randint(4, 12))) for _ in range(size))
+  build = timeit.default_timer()
+  index = FuzzyIndex(CompactKeywordIndex({keyword: ['doc'] for keyword in vocabulary}))
+  print('{} keywords, index built in {:.2f} s'.format(len(vocabulary), timeit.default_timer() - build))
+
+  terms = [typo for keyword in rng.sample(sorted(vocabulary), 100) for typo in _typos(rng, keyword)]
+  for max_distance in [1, 2]:
+    elapsed = min(timeit.repeat(lambda: [index.lookup(term, max_distance) for term in terms], number=1, repeat=3))
+    print('max distance {}: {:8.3f} ms per lookup'.format(max_distance, elapsed / len(terms) * 1000))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,49 @@
+import json
+import os
+import sys
+import timeit
+from wiki import articles, extract_keywords, fetch_extracts, _find_keywords
+from wiki_tests import _find_keywords_reference
+
+# Micro-benchmark of keyword extraction on the article extracts of articles().
+#
+#   python bench_keywords.py [extracts.json]
+#
+# Extracts are fetched from Wikipedia once and cached in the given JSON file
+# (bench_extracts.json by default) so later runs time only the extraction.
+
+def _load_extracts(cache):
+  if os.path.exists(cache):
+    with open(cache) as f:
+      return json.load(f)
+  extracts, missing = fetch_extracts([article.get('id') for article in articles()])
+  if missing:
+    print('Could not fetch {} of {} articles'.format(len(missing), len(articles())))
+  if not extracts:
+    sys.exit('No extracts to benchmark, pass a JSON file mapping article ID to extract')
+  with open(cache, 'w') as f:
+    json.dump(extracts, f)
+  return extracts
+
+def main():
+  cache = sys.argv[1] if len(sys.argv) > 1 else 'bench_extracts.json'
+  extracts = list(_load_extracts(cache).values())
+  for extract in extracts:
+    assert _find_keywords(extract) == _find_keywords_reference(extract)
+
+  characters = sum(map(len, extracts))
+  print('{} extracts, {} characters'.format(len(extracts), characters))
+  timings = {}
+  for name, function in [('reference', _find_keywords_reference), ('_find_keywords', _find_keywords)]:
+    timings[name] = min(timeit.repeat(lambda: [function(extract) for extract in extracts], number=5, repeat=5)) / 5
+    print('{:>16}: {:8.2f} ms per pass, {:6.1f} MB/s'.format(name, timings[name] * 1000, characters / timings[name] / 1e6))
+  print('speedup: {:.2f}x'.format(timings['reference'] / timings['_find_keywords']))
+
+  # Multiprocess stage over a corpus large enough to be worth the process startup
+  corpus = extracts * 20
+  for processes in sorted({1, os.cpu_count()}):
+    elapsed = min(timeit.repeat(lambda: extract_keywords(corpus, processes), number=1, repeat=3))
+    print('extract_keywords, {:>2} processes: {:8.2f} ms for {} extracts'.format(processes, elapsed * 1000, len(corpus)))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,33 @@
+import random
+import sys
+import timeit
+from index import CompactKeywordIndex
+from prefix import PrefixIndex
+
+# Micro-benchmark of prefix completion over a synthetic vocabulary.
+#
+#   python bench_prefix.py [vocabulary size]
+#
+# Builds a PrefixIndex over random keywords, each in one of 50 documents, and
+# times complete() for short prefixes (answered from the cache after the first
+# lookup) and longer ones (a bisect and a heap over the matching slice).
+
+PREFIXES = ['a', 'ab', 'abc', 'qwe']
+
+def main():
+  size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+  rng = random.Random(5)
+  letters = 'abcdefghijklmnopqrstuvwxyz'
+  vocabulary = set(''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size))
+  postings = {keyword: ['doc {}'.format(rng.randint(0, 50))] for keyword in vocabulary}
+  prefixes = PrefixIndex(CompactKeywordIndex(postings))
+  print('{} keywords'.format(len(vocabulary)))
+
+  for prefix in PREFIXES:
+    first = timeit.timeit(lambda: prefixes.complete(prefix), number=1)
+    repeated = min(timeit.repeat(lambda: prefixes.complete(prefix), number=100, repeat=5)) / 100
+    print('{:>6}: {:8.3f} ms first lookup, {:8.3f} ms after, {} matches'.format(
+      repr(prefix), first * 1000, repeated * 1000, prefixes.count(prefix)))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,44 @@
+import random
+import sys
+import timeit
+from ranking import RankedIndex
+
+# Micro-benchmark of BM25 top-k strategies on a synthetic Zipf corpus.
+#
+#   python bench_ranking.py [number of docs]
+#
+# Every doc draws 30 keywords from a 2000 word vocabulary with Zipf weights, so
+# t0, t1, ... are head terms found in most docs and t500 and later are rare.
+# Each query is timed with exhaustive top_k(), max_score_top_k() and
+# planned_top_k(), which ranked_search() uses.
+
+QUERIES = [
+  ('head', ['t0 t1', 't0 t1 t2', 't1 t3 t5', 't2 t4']),
+  ('mid', ['t20 t30', 't50 t60 t70']),
+  ('mixed', ['t0 t500', 't1 t50 t900', 't0 t1 t1500', 't3 t200']),
+]
+
+def _corpus(num_docs):
+  rng = random.Random(1)
+  vocabulary = ['t{}'.format(i) for i in range(2000)]
+  weights = [1 / (i + 1) for i in range(len(vocabulary))]
+  records = []
+  for doc in range(num_docs):
+    keywords = set(rng.choices(vocabulary, weights, k=30))
+    records.append({'title': 'doc {}'.format(doc), 'num_characters': rng.randint(500, 20000), 'keywords': list(keywords),
+                    'term_counts': {keyword: rng.randint(6, 40) for keyword in keywords}})
+  return records
+
+def main():
+  num_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+  index = RankedIndex.from_records(_corpus(num_docs))
+  print('{} docs, k=10, ms per query'.format(num_docs))
+  print('{:>6} {:>14} {:>8} {:>9} {:>8}'.format('', 'query', 'top_k', 'maxscore', 'planned'))
+  for kind, queries in QUERIES:
+    for query in queries:
+      timings = [min(timeit.repeat(lambda: function(query, 10), number=3, repeat=3)) / 3 * 1000
+                 for function in [index.top_k, index.max_score_top_k, index.planned_top_k]]
+      print('{:>6} {:>14} {:8.2f} {:9.2f} {:8.2f}'.format(kind, query, *timings))
+
+if __name__ == '__main__':
+  main()
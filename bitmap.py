@@ -0,0 +1,156 @@
+from array import array
+from bisect import bisect_left
+
+# Compressed bitmap of doc IDs in the style of Roaring bitmaps.
+#
+# Doc IDs are split by their high 16 bits into chunks of 65536. A chunk holding
+# up to ARRAY_LIMIT IDs is stored as a sorted array('H') of the low 16 bits; a
+# denser chunk is stored as a Python int used as a 65536 bit set, so AND, OR
+# and ANDNOT of two dense chunks are single big int operations running a
+# machine word at a time. Chunks that end up empty are dropped.
+
+ARRAY_LIMIT = 4096
+
+def _array_to_bits(values):
+  bits = bytearray(8192)
+  for value in values:
+    bits[value >> 3] |= 1 << (value & 7)
+  return int.from_bytes(bits, 'little')
+
+# Positions of the set bits of every byte value
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+def _bits_to_array(bits):
+  values = array('H')
+  for position, byte in enumerate(bits.to_bytes(8192, 'little')):
+    if byte:
+      values.extend(position << 3 | bit for bit in _BYTE_BITS[byte])
+  return values
+
+def _in_bits(values, bits, keep):
+  """ Returns the values whose bit in bits is set when keep is True, or unset when keep is False
+  """
+  data = bits.to_bytes(8192, 'little')
+  return array('H', (value for value in values if bool(data[value >> 3] >> (value & 7) & 1) is keep))
+
+def _cardinality(container):
+  return container.bit_count() if isinstance(container, int) else len(container)
+
+def _normalize(container):
+  """ Returns the container in its cheaper form, or None when it is empty
+  """
+  if isinstance(container, int):
+    if not container:
+      return None
+    return _bits_to_array(container) if container.bit_count() <= ARRAY_LIMIT else container
+  if not container:
+    return None
+  return _array_to_bits(container) if len(container) > ARRAY_LIMIT else container
+
+def _contains(values, value):
+  position = bisect_left(values, value)
+  return position < len(values) and values[position] == value
+
+def _and(first, second):
+  if isinstance(first, int) and isinstance(second, int):
+    return first & second
+  if isinstance(first, int):
+    first, second = second, first
+  if isinstance(second, int):
+    return _in_bits(first, second, True)
+  if len(first) > len(second):
+    first, second = second, first
+  return array('H', (value for value in first if _contains(second, value)))
+
+def _or(first, second):
+  if isinstance(first, int) or isinstance(second, int):
+    if not isinstance(first, int):
+      first = _array_to_bits(first)
+    if not isinstance(second, int):
+      second = _array_to_bits(second)
+    return first | second
+  return array('H', sorted(set(first).union(second)))
+
+def _andnot(first, second):
+  if isinstance(first, int):
+    if not isinstance(second, int):
+      second = _array_to_bits(second)
+    return first & ~second
+  if isinstance(second, int):
+    return _in_bits(first, second, False)
+  excluded = set(second)
+  return array('H', (value for value in first if value not in excluded))
+
+class Bitmap:
+  """Set of doc IDs supporting fast &, |, - and len()
+
+  Iterating yields doc IDs in ascending order, so a Bitmap can be passed
+  anywhere a sorted posting list is expected.
+  """
+
+  def __init__(self, doc_ids=()):
+    """
+    Args:
+      doc_ids - doc IDs in any order, duplicates are ignored
+    """
+    self._chunks = {}
+    chunks = {}
+    for doc_id in doc_ids:
+      chunks.setdefault(doc_id >> 16, set()).add(doc_id & 0xFFFF)
+    for key, values in chunks.items():
+      self._chunks[key] = _normalize(array('H', sorted(values)))
+
+  @classmethod
+  def _from_chunks(cls, chunks):
+    bitmap = cls()
+    bitmap._chunks = {key: container for key, container in chunks.items() if container is not None}
+    return bitmap
+
+  def __len__(self):
+    return sum(map(_cardinality, self._chunks.values()))
+
+  def __bool__(self):
+    return bool(self._chunks)
+
+  def __contains__(self, doc_id):
+    container = self._chunks.get(doc_id >> 16)
+    if container is None:
+      return False
+    if isinstance(container, int):
+      return bool(container >> (doc_id & 0xFFFF) & 1)
+    return _contains(container, doc_id & 0xFFFF)
+
+  def __iter__(self):
+    for key in sorted(self._chunks):
+      container = self._chunks[key]
+      values = _bits_to_array(container) if isinstance(container, int) else container
+      base = key << 16
+      for value in values:
+        yield base + value
+
+  def __eq__(self, other):
+    return isinstance(other, Bitmap) and self._chunks == other._chunks
+
+  def __repr__(self):
+    return 'Bitmap({})'.format(list(self))
+
+  def __and__(self, other):
+    return Bitmap._from_chunks({key: _normalize(_and(container, other._chunks[key]))
+                                for key, container in self._chunks.items() if key in other._chunks})
+
+  def __or__(self, other):
+    chunks = dict(self._chunks)
+    for key, container in other._chunks.items():
+      chunks[key] = _normalize(_or(chunks[key], container)) if key in chunks else container
+    return Bitmap._from_chunks(chunks)
+
+  def __sub__(self, other):
+    chunks = {}
+    for key, container in self._chunks.items():
+      chunks[key] = _normalize(_andnot(container, other._chunks[key])) if key in other._chunks else container
+    return Bitmap._from_chunks(chunks)
+
+  def to_array(self):
+    """ Returns the doc IDs as a sorted array('I')
+    """
+    return array('I', self)
@@ -0,0 +1,62 @@
+import random
+from bitmap import Bitmap, ARRAY_LIMIT
+from index import default_compact_index
+from search import combined_search, search, _keyword_bitmap, _author_bitmap
+from wiki import title_to_info_map
+
+TITLE_TO_INFO = title_to_info_map()
+
+def test_bitmap_operations():
+    first = Bitmap([5, 1, 70000, 3, 1])
+    assert list(first) == [1, 3, 5, 70000]
+    assert len(first) == 4
+    assert 70000 in first and 2 not in first and 200000 not in first
+    second = Bitmap([3, 4, 70000])
+    assert list(first & second) == [3, 70000]
+    assert list(first | second) == [1, 3, 4, 5, 70000]
+    assert list(first - second) == [1, 5]
+    assert not (first & Bitmap([2]))
+    assert list(Bitmap()) == []
+    assert (first | second).to_array().typecode == 'I'
+
+    # Sparse and dense chunks, crossing chunk boundaries
+    rng = random.Random(11)
+    for _ in range(10):
+        sets = []
+        for size in [rng.randint(0, 50), rng.randint(ARRAY_LIMIT, 3 * ARRAY_LIMIT), rng.randint(0, 2 * ARRAY_LIMIT)]:
+            sets.append(set(rng.sample(range(200000), size)))
+        for one in sets:
+            for other in sets:
+                assert list(Bitmap(one) & Bitmap(other)) == sorted(one & other)
+                assert list(Bitmap(one) | Bitmap(other)) == sorted(one | other)
+                assert list(Bitmap(one) - Bitmap(other)) == sorted(one - other)
+                assert len(Bitmap(one) | Bitmap(other)) == len(one | other)
+                assert Bitmap(one) & Bitmap(other) == Bitmap(one & other)
+
+def test_combined_search():
+    assert combined_search('dog') == search('dog')
+    assert combined_search('dog', max_length=8000) == ['Mexican dog-faced bat', 'Guide dog']
+    assert combined_search('dog', author='J. Spencer') == ['Dalmatian (dog)']
+    assert set(combined_search('dog', other_keyword='soccer')) == set(search('dog') + search('soccer'))
+
+    expected = [title for title in search('music')
+                if TITLE_TO_INFO[title]['length'] <= 30000 and 1170000000 <= TITLE_TO_INFO[title]['timestamp'] <= 1230000000]
+    assert combined_search('music', max_length=30000, start=1170000000, end=1230000000) == expected
+    assert combined_search('not a keyword', max_length=30000) == []
+
+    # A range smaller than the keyword's postings is ANDed in as a bitmap
+    expected = [title for title in search('the') if TITLE_TO_INFO[title]['length'] <= 1000]
+    assert expected and combined_search('the', max_length=1000) == expected
+
+def test_bitmaps_are_reused():
+    assert _keyword_bitmap('DOG') is _keyword_bitmap('dog')
+    assert list(_keyword_bitmap('dog')) == list(default_compact_index().postings('dog'))
+    assert _author_bitmap('J. Spencer') is _author_bitmap('J. Spencer')
+    combined_search('dog', other_keyword='soccer', author='J. Spencer')
+    assert list(_keyword_bitmap('dog')) == list(default_compact_index().postings('dog'))
+
+
+if __name__ == "__main__":
+    test_bitmap_operations()
+    test_combined_search()
+    test_bitmaps_are_reused()
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+import time
+from index import index_version
+
+class QueryCache:
+  """Bounded LRU cache of query results with an optional time to live
+
+  Entries are keyed on a normalized query plus its options. The cache
+  remembers index_version() when it fills and empties itself as soon as the
+  version changes, so results computed from an older corpus are never served.
+  The version changes when index.use_index_file() switches to a re-ingested
+  index file or when invalidate_indexes() is called, see invalidate_indexes().
+  """
+
+  def __init__(self, maxsize=1024, ttl=None, version=index_version, clock=time.monotonic):
+    """
+    Args:
+      maxsize - most entries kept, the least recently used one is evicted first
+      ttl - seconds an entry stays valid, None keeps entries until evicted
+      version - function returning the current index version; a cache over an
+                IncrementalIndex or SegmentIndex passes lambda: index.version
+                so it empties as soon as that index changes
+      clock - function returning the current time in seconds
+    """
+    self.maxsize = maxsize
+    self.ttl = ttl
+    self._version = version
+    self._clock = clock
+    self._entries = OrderedDict()
+    self._entries_version = version()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.invalidations = 0
+
+  def __len__(self):
+    return len(self._entries)
+
+  def _check_version(self):
+    current = self._version()
+    if current != self._entries_version:
+      self._entries.clear()
+      self._entries_version = current
+      self.invalidations += 1
+
+  def get(self, key, compute):
+    """Returns the cached result for key, calling compute() and caching its result on a miss
+
+    Args:
+      key - hashable normalized query and options
+      compute - function with no arguments returning the result
+    """
+    self._check_version()
+    entry = self._entries.get(key)
+    if entry is not None and (entry[0] is None or entry[0] > self._clock()):
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry[1]
+
+    self.misses += 1
+    value = compute()
+    self._entries[key] = (None if self.ttl is None else self._clock() + self.ttl, value)
+    self._entries.move_to_end(key)
+    while len(self._entries) > self.maxsize:
+      self._entries.popitem(last=False)
+      self.evictions += 1
+    return value
+
+  def clear(self):
+    self._entries.clear()
+
+  def stats(self):
+    """ Returns dictionary of hits, misses, evictions, invalidations and current size
+    """
+    return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'invalidations': self.invalidations, 'size': len(self._entries)}
@@ -0,0 +1,116 @@
+from cache import QueryCache
+import os
+import tempfile
+from index import default_index, index_version, invalidate_indexes, use_index_file
+from storage import write_index
+from incremental import IncrementalIndex
+from search import search, ranked_search, combined_search, boolean_keywords, query_cache_stats
+from search_tests_helper import DOG
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+def test_lru():
+    cache = QueryCache(maxsize=2)
+    calls = []
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.get('a', lambda: compute(1)) == 1
+    assert cache.get('b', lambda: compute(2)) == 2
+    assert cache.get('a', lambda: compute(3)) == 1
+    # b is the least recently used entry and gets evicted
+    assert cache.get('c', lambda: compute(4)) == 4
+    assert cache.get('b', lambda: compute(5)) == 5
+    assert calls == [1, 2, 4, 5]
+    assert cache.stats() == {'hits': 1, 'misses': 4, 'evictions': 2, 'invalidations': 0, 'size': 2}
+
+def test_ttl():
+    clock = FakeClock()
+    cache = QueryCache(ttl=10, clock=clock)
+    assert cache.get('a', lambda: 1) == 1
+    clock.now = 9
+    assert cache.get('a', lambda: 2) == 1
+    clock.now = 10
+    assert cache.get('a', lambda: 3) == 3
+    assert cache.hits == 1 and cache.misses == 2
+
+def test_version_invalidation():
+    version = [0]
+    cache = QueryCache(version=lambda: version[0])
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('a', lambda: 2) == 1
+    version[0] += 1
+    assert cache.get('a', lambda: 3) == 3
+    assert cache.invalidations == 1
+
+def test_search_cache():
+    before = query_cache_stats()
+    assert search('dog') == DOG
+    assert search('DOG') == DOG
+    assert ranked_search('music  Canada') == ranked_search('music canada')
+    assert combined_search('dog', max_length=8000) == combined_search('Dog', max_length=8000)
+    after = query_cache_stats()
+    assert after['hits'] - before['hits'] >= 3
+
+    # Rebuilding the shared indexes empties the cache
+    old_index = default_index()
+    version = index_version()
+    invalidate_indexes()
+    assert index_version() == version + 1
+    assert search('dog') == DOG
+    assert default_index() is not old_index
+    assert query_cache_stats()['invalidations'] == after['invalidations'] + 1
+
+def test_results_are_copies():
+    # Changing a returned list does not change the cached result
+    result = boolean_keywords('dog')
+    result.append('BOGUS')
+    assert boolean_keywords('dog') == DOG
+    ranked = ranked_search('music', 3)
+    ranked.clear()
+    assert len(ranked_search('music', 3)) == 3
+    search('dog').clear()
+    assert search('dog') == DOG
+
+def test_live_index_version():
+    index = IncrementalIndex.from_records([{'id': 1, 'title': 'dogs', 'keywords': ['dog']}])
+    cache = QueryCache(version=lambda: index.version)
+    assert cache.get('dog', lambda: index.search('dog')) == ['dogs']
+    index.add({'id': 2, 'title': 'more dogs', 'keywords': ['dog']})
+    assert cache.get('dog', lambda: index.search('dog')) == ['dogs', 'more dogs']
+    index.delete(1)
+    assert cache.get('dog', lambda: index.search('dog')) == ['more dogs']
+    assert cache.invalidations == 2
+
+def test_reingested_index_file():
+    assert search('dog') == DOG
+    before = query_cache_stats()['invalidations']
+    reingested = [['Dog show', 'andrea', 1234567890, 103, ['dog', 'show']],
+                  ['Sun dog', 'helloworld', 987123456, 8029, ['dog', 'sun']]]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.bin')
+        write_index(path, reingested)
+        # Switching to the new file is enough, no invalidate_indexes() call
+        use_index_file(path)
+        try:
+            assert search('dog') == ['Dog show', 'Sun dog']
+            assert query_cache_stats()['invalidations'] == before + 1
+        finally:
+            use_index_file(None)
+    assert search('dog') == DOG
+
+
+if __name__ == "__main__":
+    test_lru()
+    test_ttl()
+    test_version_invalidation()
+    test_search_cache()
+    test_results_are_copies()
+    test_live_index_version()
+    test_reingested_index_file()
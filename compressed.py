@@ -0,0 +1,188 @@
+from array import array
+from bisect import bisect_left
+from index import CompactKeywordIndex, _normalize
+
+# Posting lists compressed in blocks of delta and variable byte encoded doc IDs.
+#
+# A posting list is cut into blocks of BLOCK_SIZE doc IDs. Inside a block each
+# doc ID is stored as its gap to the one before (the first one as its gap to
+# the last doc ID of the previous block), and every gap is written with the
+# fewest 7 bit groups it needs, least significant first, the high bit of a
+# byte marking that more bytes follow. Dense lists of frequent keywords have
+# small gaps and shrink to about one byte per doc instead of four.
+#
+# Skip metadata keeps the last doc ID and the byte offset of every block, so a
+# lookup bisects the block ends and decodes just the one block that can hold
+# the wanted doc ID. Intersections therefore only decode the blocks their
+# candidates fall in.
+
+BLOCK_SIZE = 128
+
+def encode_vbyte(values):
+  """ Returns bytes of the variable byte encoding of non-negative integers
+  """
+  data = bytearray()
+  for value in values:
+    while value >= 0x80:
+      data.append(value & 0x7F | 0x80)
+      value >>= 7
+    data.append(value)
+  return bytes(data)
+
+def decode_vbyte(data, start=0, end=None):
+  """ Returns list of the integers variable byte encoded in data[start:end]
+  """
+  values = []
+  value = shift = 0
+  for byte in data[start:end]:
+    value |= (byte & 0x7F) << shift
+    if byte & 0x80:
+      shift += 7
+    else:
+      values.append(value)
+      value = shift = 0
+  return values
+
+class CompressedPostings:
+  """ Sorted doc IDs stored as delta and variable byte encoded blocks with skip metadata
+  """
+
+  def __init__(self, doc_ids, block_size=BLOCK_SIZE):
+    """
+    Args:
+      doc_ids - sorted distinct doc IDs
+      block_size - number of doc IDs per block
+    """
+    self.block_size = block_size
+    self.block_last = array('I')
+    self.block_offsets = array('I', [0])
+    self._length = len(doc_ids)
+    data = bytearray()
+    previous = 0
+    for start in range(0, len(doc_ids), block_size):
+      block = doc_ids[start:start + block_size]
+      data += encode_vbyte([doc_id - before for doc_id, before in zip(block, [previous] + list(block[:-1]))])
+      previous = block[-1]
+      self.block_last.append(previous)
+      self.block_offsets.append(len(data))
+    self.data = bytes(data)
+
+  def __len__(self):
+    return self._length
+
+  @property
+  def num_blocks(self):
+    return len(self.block_last)
+
+  @property
+  def nbytes(self):
+    """ Bytes used by the encoded doc IDs and the skip metadata
+    """
+    return len(self.data) + self.block_last.itemsize * len(self.block_last) + self.block_offsets.itemsize * len(self.block_offsets)
+
+  def block(self, position):
+    """ Returns sorted array('I') of the doc IDs in one block
+    """
+    doc_id = self.block_last[position - 1] if position else 0
+    result = array('I')
+    for gap in decode_vbyte(self.data, self.block_offsets[position], self.block_offsets[position + 1]):
+      doc_id += gap
+      result.append(doc_id)
+    return result
+
+  def __iter__(self):
+    for position in range(self.num_blocks):
+      yield from self.block(position)
+
+  def to_array(self):
+    """ Returns every doc ID as a sorted array('I')
+    """
+    result = array('I')
+    for position in range(self.num_blocks):
+      result.extend(self.block(position))
+    return result
+
+  def __contains__(self, doc_id):
+    position = bisect_left(self.block_last, doc_id)
+    if position == self.num_blocks:
+      return False
+    block = self.block(position)
+    index = bisect_left(block, doc_id)
+    return index < len(block) and block[index] == doc_id
+
+  def intersect(self, doc_ids):
+    """Returns sorted array('I') of the given doc IDs that are also in these postings
+
+    Args:
+      doc_ids - sorted doc IDs, ideally fewer than these postings; only blocks
+                that could hold one of them are decoded
+    """
+    result = array('I')
+    current = -1
+    block = array('I')
+    for doc_id in doc_ids:
+      position = bisect_left(self.block_last, doc_id, max(current, 0))
+      if position == self.num_blocks:
+        break
+      if position != current:
+        current = position
+        block = self.block(position)
+      index = bisect_left(block, doc_id)
+      if index < len(block) and block[index] == doc_id:
+        result.append(doc_id)
+    return result
+
+def intersect_compressed(lists):
+  """Returns sorted array('I') of the doc IDs found in every CompressedPostings
+
+  Lists are intersected shortest first: the shortest is decoded in full and
+  each following list only decodes the blocks the running result falls in.
+  """
+  if not lists:
+    return array('I')
+  lists = sorted(lists, key=len)
+  result = lists[0].to_array()
+  for postings in lists[1:]:
+    if not result:
+      break
+    result = postings.intersect(result)
+  return result
+
+class CompressedKeywordIndex(CompactKeywordIndex):
+  """CompactKeywordIndex keeping every posting list as CompressedPostings
+
+  postings() decodes a whole list for callers expecting an array, while
+  compressed_postings() and intersect() work on the blocks directly.
+  """
+
+  def __init__(self, keyword_to_titles, titles=None, block_size=BLOCK_SIZE):
+    """
+    Args:
+      keyword_to_titles - dictionary mapping keyword to list of titles with
+                          articles containing the keyword
+      titles - list of all article titles in corpus order
+      block_size - number of doc IDs per block
+    """
+    CompactKeywordIndex.__init__(self, keyword_to_titles, titles)
+    self._postings = {keyword: CompressedPostings(postings, block_size) for keyword, postings in self._postings.items()}
+
+  def compressed_postings(self, keyword):
+    """ Returns the CompressedPostings of a keyword, empty if it is not indexed
+    """
+    compressed = self._postings.get(_normalize(keyword))
+    return CompressedPostings([]) if compressed is None else compressed
+
+  def postings(self, keyword):
+    """ Returns the sorted array of doc IDs of articles containing the keyword, decoded from its blocks
+    """
+    return self.compressed_postings(keyword).to_array()
+
+  def intersect(self, keywords):
+    """ Returns sorted array of the doc IDs of articles containing every keyword
+    """
+    return intersect_compressed([self.compressed_postings(keyword) for keyword in keywords])
+
+  def nbytes(self):
+    """ Returns the bytes used by every compressed posting list
+    """
+    return sum(compressed.nbytes for compressed in self._postings.values())
@@ -0,0 +1,64 @@
+import random
+from array import array
+from compressed import CompressedPostings, CompressedKeywordIndex, encode_vbyte, decode_vbyte, intersect_compressed
+from index import CompactKeywordIndex
+from postings import intersect_all
+from query import boolean_search
+from search_tests_helper import DOG, METADATA
+
+def test_vbyte():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 2 ** 32 - 1]
+    data = encode_vbyte(values)
+    assert decode_vbyte(data) == values
+    assert len(encode_vbyte([127])) == 1 and len(encode_vbyte([128])) == 2
+    assert decode_vbyte(b'') == []
+
+def test_blocks():
+    rng = random.Random(13)
+    doc_ids = array('I', sorted(rng.sample(range(100000), 1000)))
+    postings = CompressedPostings(doc_ids, block_size=128)
+    assert len(postings) == 1000
+    assert postings.num_blocks == 8
+    assert list(postings.block_last) == [doc_ids[min(i + 127, 999)] for i in range(0, 1000, 128)]
+    assert postings.to_array() == doc_ids
+    assert list(postings) == list(doc_ids)
+    assert doc_ids[500] in postings and 100001 not in postings
+    assert postings.nbytes < doc_ids.itemsize * len(doc_ids)
+
+    dense = CompressedPostings(array('I', range(0, 20000, 3)))
+    assert len(dense.data) == len(dense)
+
+    empty = CompressedPostings([])
+    assert empty.to_array() == array('I') and 5 not in empty and empty.intersect([1, 2]) == array('I')
+
+def test_intersect():
+    rng = random.Random(17)
+    for _ in range(50):
+        lists = [array('I', sorted(rng.sample(range(5000), rng.randint(0, 2000)))) for _ in range(rng.randint(1, 4))]
+        compressed = [CompressedPostings(doc_ids, block_size=rng.choice([4, 128])) for doc_ids in lists]
+        assert intersect_compressed(compressed) == intersect_all(lists)
+    assert intersect_compressed([]) == array('I')
+
+def test_compressed_index():
+    compact = CompactKeywordIndex.from_metadata(METADATA)
+    index = CompressedKeywordIndex.from_metadata(METADATA)
+    assert len(index) == len(compact)
+    for keyword in compact.keywords():
+        assert index.postings(keyword) == compact.postings(keyword)
+    assert index.search('DOG') == DOG
+    assert index.search('not a keyword') == []
+    assert index.intersect(['music', 'canada']) == intersect_all([compact.postings('music'), compact.postings('canada')])
+    assert boolean_search('music AND canada NOT jazz', index) == boolean_search('music AND canada NOT jazz', compact)
+    # Frequent keywords take well under the four bytes per doc of an array('I')
+    frequent = [keyword for keyword in compact.keywords() if len(compact.postings(keyword)) >= 30]
+    assert frequent
+    for keyword in frequent:
+        assert index.compressed_postings(keyword).nbytes < 2 * len(compact.postings(keyword))
+    assert index.nbytes() > 0
+
+
+if __name__ == "__main__":
+    test_vbyte()
+    test_blocks()
+    test_intersect()
+    test_compressed_index()
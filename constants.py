@@ -1,7 +1,3 @@
-import json
-import re
-import requests
-
 ADVANCED = \
   "Any advanced searches?\n" \
   "1. Article information\n" \
@@ -23,708 +19,15 @@ ADVANCED_TO_QUESTION = {
 
 BASIC = "What are you searching for? "
 
-WIKI_API = "https://en.wikipedia.org/w/api.php?action=query&format=json&prop=extracts&pageids={}&formatversion=2&explaintext=1"
-
-# List of random Wikipedia page IDs
-ARTICLES = [
-  {
-    "title": "List of Canadian musicians",
-    "contributor_username": "Bearcat",
-    "id": "102873",
-    "timestamp": "1181623340",
-    "num_characters": "21023"
-  },
-  {
-    "title": "French pop music",
-    "contributor_username": "Brandon",
-    "id": "6180884",
-    "timestamp": "1172208041",
-    "num_characters": "5569"
-  },
-  {
-    "title": "Edogawa, Tokyo",
-    "contributor_username": "Ciphers",
-    "id": "335972",
-    "timestamp": "1222607041",
-    "num_characters": "4526"
-  },
-  {
-    "title": "Noise (music)",
-    "contributor_username": "Epbr123",
-    "id": "87595",
-    "timestamp": "1194207604",
-    "num_characters": "15641"
-  },
-  {
-    "title": "1922 in music",
-    "contributor_username": "Jafeluv",
-    "id": "163737",
-    "timestamp": "1242717698",
-    "num_characters": "11576"
-  },
-  {
-    "title": "Ken Kennedy (computer scientist)",
-    "contributor_username": "Jlalbee",
-    "id": "9416375",
-    "timestamp": "1246308670",
-    "num_characters": "4144"
-  },
-  {
-    "title": "1986 in music",
-    "contributor_username": "Michael",
-    "id": "160792",
-    "timestamp": "1048918054",
-    "num_characters": "6632"
-  },
-  {
-    "title": "Spain national beach soccer team",
-    "contributor_username": "Pegship",
-    "id": "15103011",
-    "timestamp": "1233458894",
-    "num_characters": "1526"
-  },
-  {
-    "title": "Kevin Cadogan",
-    "contributor_username": "Renesis",
-    "id": "1570956",
-    "timestamp": "1144136316",
-    "num_characters": "3917"
-  },
-  {
-    "title": "Endogenous cannabinoid",
-    "contributor_username": "RussBot",
-    "id": "8016606",
-    "timestamp": "1168971903",
-    "num_characters": "26"
-  },
-  {
-    "title": "2009 in music",
-    "contributor_username": "SE KinG",
-    "id": "18696414",
-    "timestamp": "1235133583",
-    "num_characters": "69451"
-  },
-  {
-    "title": "Rock music",
-    "contributor_username": "Sabrebd",
-    "id": "25423",
-    "timestamp": "1258069053",
-    "num_characters": "119498"
-  },
-  {
-    "title": "Medical value travel",
-    "contributor_username": "Argon233",
-    "id": "3189956",
-    "timestamp": "1153157342",
-    "num_characters": "4149"
-  },
-  {
-    "title": "Lights (musician)",
-    "contributor_username": "Espo3699",
-    "id": "15801404",
-    "timestamp": "1213914297",
-    "num_characters": "5898"
-  },
-  {
-    "title": "List of soul musicians",
-    "contributor_username": "Ghmyrtle",
-    "id": "170098",
-    "timestamp": "1175455921",
-    "num_characters": "4878"
-  },
-  {
-    "title": "Human computer",
-    "contributor_username": "Giftlite",
-    "id": "3833695",
-    "timestamp": "1248275178",
-    "num_characters": "4750"
-  },
-  {
-    "title": "Aube (musician)",
-    "contributor_username": "Nihonjoe",
-    "id": "2258925",
-    "timestamp": "1145410600",
-    "num_characters": "3152"
-  },
-  {
-    "title": "List of overtone musicians",
-    "contributor_username": "Sborsody",
-    "id": "10759510",
-    "timestamp": "1176928050",
-    "num_characters": "2299"
-  },
-  {
-    "title": "Black dog (ghost)",
-    "contributor_username": "SmackBot",
-    "id": "7137314",
-    "timestamp": "1220471117",
-    "num_characters": "14746"
-  },
-  {
-    "title": "USC Trojans volleyball",
-    "contributor_username": "Smuckers",
-    "id": "5769756",
-    "timestamp": "1218049435",
-    "num_characters": "5525"
-  },
-  {
-    "title": "Tim Arnold (musician)",
-    "contributor_username": "Sohohobo",
-    "id": "11484209",
-    "timestamp": "1181480380",
-    "num_characters": "4551"
-  },
-  {
-    "title": "2007 Bulldogs RLFC season",
-    "contributor_username": "Timmah86",
-    "id": "7916044",
-    "timestamp": "1177410119",
-    "num_characters": "11116"
-  },
-  {
-    "title": "Peter Brown (music industry)",
-    "contributor_username": "Zephyrad",
-    "id": "5777260",
-    "timestamp": "1240235639",
-    "num_characters": "2837"
-  },
-  {
-    "title": "Mexican dog-faced bat",
-    "contributor_username": "AnomieBOT",
-    "id": "24555375",
-    "timestamp": "1255316429",
-    "num_characters": "1138"
-  },
-  {
-    "title": "Embryo drawing",
-    "contributor_username": "AxelBoldt",
-    "id": "10273",
-    "timestamp": "1034459202",
-    "num_characters": "1712"
-  },
-  {
-    "title": "Old-time music",
-    "contributor_username": "Badagnani",
-    "id": "479513",
-    "timestamp": "1124771619",
-    "num_characters": "12755"
-  },
-  {
-    "title": "Arabic music",
-    "contributor_username": "Badagnani",
-    "id": "251740",
-    "timestamp": "1209417864",
-    "num_characters": "25114"
-  },
-  {
-    "title": "C Sharp (programming language)",
-    "contributor_username": "Eaglizard",
-    "id": "2356196",
-    "timestamp": "1232492672",
-    "num_characters": "52364"
-  },
-  {
-    "title": "List of Saturday Night Live musical sketches",
-    "contributor_username": "Gary King",
-    "id": "3181362",
-    "timestamp": "1134966249",
-    "num_characters": "13287"
-  },
-  {
-    "title": "Joe Becker (musician)",
-    "contributor_username": "Gary King",
-    "id": "12255566",
-    "timestamp": "1203234507",
-    "num_characters": "5842"
-  },
-  {
-    "title": "Will Johnson (soccer)",
-    "contributor_username": "Mayumashu",
-    "id": "3964439",
-    "timestamp": "1218489712",
-    "num_characters": "3562"
-  },
-  {
-    "title": "Aco (musician)",
-    "contributor_username": "Noodleboy",
-    "id": "1018822",
-    "timestamp": "1132546632",
-    "num_characters": "3129"
-  },
-  {
-    "title": "Geoff Smith (British musician)",
-    "contributor_username": "Richardrj",
-    "id": "4306585",
-    "timestamp": "1194687509",
-    "num_characters": "2043"
-  },
-  {
-    "title": "Fiskerton, Lincolnshire",
-    "contributor_username": "Snigbrook",
-    "id": "4744436",
-    "timestamp": "1259869948",
-    "num_characters": "5853"
-  },
-  {
-    "title": "Reflection-oriented programming",
-    "contributor_username": "Soumyasch",
-    "id": "4520792",
-    "timestamp": "1143366937",
-    "num_characters": "38"
-  },
-  {
-    "title": "B (programming language)",
-    "contributor_username": "Uvaphdman",
-    "id": "4475",
-    "timestamp": "1196622610",
-    "num_characters": "5482"
-  },
-  {
-    "title": "Richard Wright (musician)",
-    "contributor_username": "Bdubiscool",
-    "id": "19332171",
-    "timestamp": "1189536295",
-    "num_characters": "16185"
-  },
-  {
-    "title": "Voice classification in non-classical music",
-    "contributor_username": "Iridescent",
-    "id": "14597488",
-    "timestamp": "1198092852",
-    "num_characters": "11280"
-  },
-  {
-    "title": "Dalmatian (dog)",
-    "contributor_username": "J. Spencer",
-    "id": "19255892",
-    "timestamp": "1207793294",
-    "num_characters": "26582"
-  },
-  {
-    "title": "1936 in music",
-    "contributor_username": "JohnRogers",
-    "id": "163570",
-    "timestamp": "1243745950",
-    "num_characters": "23417"
-  },
-  {
-    "title": "Guide dog",
-    "contributor_username": "Sarranduin",
-    "id": "76885",
-    "timestamp": "1165601603",
-    "num_characters": "7339"
-  },
-  {
-    "title": "1962 in country music",
-    "contributor_username": "Briguy52748",
-    "id": "2068000",
-    "timestamp": "1249862464",
-    "num_characters": "7954"
-  },
-  {
-    "title": "List of dystopian music, TV programs, and games",
-    "contributor_username": "Notinasnaid",
-    "id": "1899265",
-    "timestamp": "1165317338",
-    "num_characters": "13458"
-  },
-  {
-    "title": "Steven Cohen (soccer)",
-    "contributor_username": "Scouselad10",
-    "id": "5317001",
-    "timestamp": "1237669593",
-    "num_characters": "2117"
-  },
-  {
-    "title": "Steve Perry (musician)",
-    "contributor_username": "Woohookitty",
-    "id": "1010610",
-    "timestamp": "1254812045",
-    "num_characters": "22204"
-  },
-  {
-    "title": "2009 Louisiana Tech Bulldogs football team",
-    "contributor_username": "AllisonFoley",
-    "id": "23281761",
-    "timestamp": "1245796406",
-    "num_characters": "22410"
-  },
-  {
-    "title": "David Gray (musician)",
-    "contributor_username": "RattleandHum",
-    "id": "876542",
-    "timestamp": "1159841492",
-    "num_characters": "7203"
-  },
-  {
-    "title": "Craig Martin (soccer)",
-    "contributor_username": "Darius Dhlomo",
-    "id": "10118827",
-    "timestamp": "1174203493",
-    "num_characters": "709"
-  },
-  {
-    "title": "Georgia Bulldogs football",
-    "contributor_username": "Davidscharoun",
-    "id": "2517159",
-    "timestamp": "1166567889",
-    "num_characters": "43718"
-  },
-  {
-    "title": "Time travel",
-    "contributor_username": "Thug outlaw69",
-    "id": "31591",
-    "timestamp": "1140826049",
-    "num_characters": "35170"
-  },
-  {
-    "title": "Fisk University",
-    "contributor_username": "NerdyScienceDude",
-    "id": "189946",
-    "timestamp": "1263393671",
-    "num_characters": "16246"
-  },
-  {
-    "title": "Annie (musical)",
-    "contributor_username": "Piano non troppo",
-    "id": "357505",
-    "timestamp": "1223619626",
-    "num_characters": "27558"
-  },
-  {
-    "title": "Alex Turner (musician)",
-    "contributor_username": "CambridgeBayWeather",
-    "id": "3003683",
-    "timestamp": "1187010135",
-    "num_characters": "9718"
-  },
-  {
-    "title": "Python (programming language)",
-    "contributor_username": "Lulu of the Lotus-Eaters",
-    "id": "23862",
-    "timestamp": "1137530195",
-    "num_characters": "41571"
-  },
-  {
-    "title": "List of gospel musicians",
-    "contributor_username": "Absolon",
-    "id": "179191",
-    "timestamp": "1197658845",
-    "num_characters": "3805"
-  },
-  {
-    "title": "Tom Hooper (musician)",
-    "contributor_username": "Bearcat",
-    "id": "1283174",
-    "timestamp": "1204967541",
-    "num_characters": "1441"
-  },
-  {
-    "title": "Endoglin",
-    "contributor_username": "DOI bot",
-    "id": "6732448",
-    "timestamp": "1212259031",
-    "num_characters": "6778"
-  },
-  {
-    "title": "Indian classical music",
-    "contributor_username": "Davydog",
-    "id": "223014",
-    "timestamp": "1222543238",
-    "num_characters": "9503"
-  },
-  {
-    "title": "Sun dog",
-    "contributor_username": "Hellbus",
-    "id": "323221",
-    "timestamp": "1208969289",
-    "num_characters": "18050"
-  },
-  {
-    "title": "1996 in music",
-    "contributor_username": "Kharker",
-    "id": "160807",
-    "timestamp": "1148585201",
-    "num_characters": "21688"
-  },
-  {
-    "title": "Lua (programming language)",
-    "contributor_username": "Makkuro",
-    "id": "46150",
-    "timestamp": "1113957128",
-    "num_characters": "0"
-  },
-  {
-    "title": "Single-board computer",
-    "contributor_username": "Nathael",
-    "id": "194424",
-    "timestamp": "1220260601",
-    "num_characters": "8271"
-  },
-  {
-    "title": "Mets de Guaynabo (volleyball)",
-    "contributor_username": "Osplace",
-    "id": "21895213",
-    "timestamp": "1239156764",
-    "num_characters": "2091"
-  },
-  {
-    "title": "United States men's national soccer team 2009 results",
-    "contributor_username": "Rebajc3",
-    "id": "24259281",
-    "timestamp": "1252384026",
-    "num_characters": "79089"
-  },
-  {
-    "title": "Joseph Williams (musician)",
-    "contributor_username": "RussBot",
-    "id": "3439709",
-    "timestamp": "1140752684",
-    "num_characters": "4253"
-  },
-  {
-    "title": "The Hunchback of Notre Dame (musical)",
-    "contributor_username": "RussBot",
-    "id": "10251273",
-    "timestamp": "1192176615",
-    "num_characters": "42"
-  },
-  {
-    "title": "China national soccer team",
-    "contributor_username": "Seedbot",
-    "id": "12231335",
-    "timestamp": "1199103839",
-    "num_characters": "45"
-  },
-  {
-    "title": "Covariance and contravariance (computer science)",
-    "contributor_username": "Wakapop",
-    "id": "1104704",
-    "timestamp": "1167547364",
-    "num_characters": "7453"
-  },
-  {
-    "title": "English folk music (1500–1899)",
-    "contributor_username": "Ashley Y",
-    "id": "1138211",
-    "timestamp": "1177634764",
-    "num_characters": "2073"
-  },
-  {
-    "title": "Personal computer",
-    "contributor_username": "Darklock",
-    "id": "18457137",
-    "timestamp": "1220391790",
-    "num_characters": "45663"
-  },
-  {
-    "title": "The Mandogs",
-    "contributor_username": "DerHexer",
-    "id": "12746175",
-    "timestamp": "1205282029",
-    "num_characters": "3968"
-  },
-  {
-    "title": "David Levi (musician)",
-    "contributor_username": "DumZiBoT",
-    "id": "9659487",
-    "timestamp": "1212260237",
-    "num_characters": "3949"
-  },
-  {
-    "title": "Scores (computer virus)",
-    "contributor_username": "LilHelpa",
-    "id": "7970552",
-    "timestamp": "1235850703",
-    "num_characters": "2706"
-  },
-  {
-    "title": "Digital photography",
-    "contributor_username": "Mintleaf",
-    "id": "3616597",
-    "timestamp": "1095727840",
-    "num_characters": "18093"
-  },
-  {
-    "title": "George Crum (musician)",
-    "contributor_username": "SmackBot",
-    "id": "13703703",
-    "timestamp": "1252996687",
-    "num_characters": "3848"
-  },
-  {
-    "title": "Solver (computer science)",
-    "contributor_username": "SmackBot",
-    "id": "19125134",
-    "timestamp": "1253282654",
-    "num_characters": "1861"
-  },
-  {
-    "title": "Georgia Bulldogs football under Robert Winston",
-    "contributor_username": "Tlmclain",
-    "id": "8422002",
-    "timestamp": "1166046122",
-    "num_characters": "1989"
-  },
-  {
-    "title": "Wildlife photography",
-    "contributor_username": "Zargulon",
-    "id": "3957571",
-    "timestamp": "1165248747",
-    "num_characters": "1410"
-  },
-  {
-    "title": "Traditional Thai musical instruments",
-    "contributor_username": "Badagnani",
-    "id": "13619511",
-    "timestamp": "1191830919",
-    "num_characters": "6775"
-  },
-  {
-    "title": "Landseer (dog)",
-    "contributor_username": "Birdgirl5",
-    "id": "1379724",
-    "timestamp": "1231438650",
-    "num_characters": "2006"
-  },
-  {
-    "title": "Charles McPherson (musician)",
-    "contributor_username": "Cosprings",
-    "id": "11095669",
-    "timestamp": "1255183865",
-    "num_characters": "3007"
-  },
-  {
-    "title": "Comparison of programming languages (basic instructions)",
-    "contributor_username": "IanOsgood",
-    "id": "14513019",
-    "timestamp": "1238781354",
-    "num_characters": "61644"
-  },
-  {
-    "title": "Les Cousins (music club)",
-    "contributor_username": "Rodparkes",
-    "id": "7691512",
-    "timestamp": "1187072433",
-    "num_characters": "4926"
-  },
-  {
-    "title": "Paul Carr (musician)",
-    "contributor_username": "Snalwibma",
-    "id": "18516531",
-    "timestamp": "1254142018",
-    "num_characters": "5716"
-  },
-  {
-    "title": "2006 in music",
-    "contributor_username": "Suduser85",
-    "id": "1570433",
-    "timestamp": "1171547747",
-    "num_characters": "105280"
-  },
-  {
-    "title": "Spawning (computer gaming)",
-    "contributor_username": "Vendettax",
-    "id": "1196080",
-    "timestamp": "1176750529",
-    "num_characters": "3413"
-  },
-  {
-    "title": "Sean Delaney (musician)",
-    "contributor_username": "Bestcellar",
-    "id": "16023479",
-    "timestamp": "1204328174",
-    "num_characters": "5638"
-  },
-  {
-    "title": "Tony Kaye (musician)",
-    "contributor_username": "Bondegezou",
-    "id": "447066",
-    "timestamp": "1141489894",
-    "num_characters": "8419"
-  },
-  {
-    "title": "Danja (musician)",
-    "contributor_username": "Crusoe8181",
-    "id": "7549507",
-    "timestamp": "1257155543",
-    "num_characters": "6925"
-  },
-  {
-    "title": "Ruby (programming language)",
-    "contributor_username": "Hervegirod",
-    "id": "25768",
-    "timestamp": "1193928035",
-    "num_characters": "30284"
-  },
-  {
-    "title": "Texture (music)",
-    "contributor_username": "J Lorraine",
-    "id": "410850",
-    "timestamp": "1161070178",
-    "num_characters": "3626"
-  },
-  {
-    "title": "List of computer role-playing games",
-    "contributor_username": "Lllockwood",
-    "id": "6217026",
-    "timestamp": "1179441080",
-    "num_characters": "43088"
-  },
-  {
-    "title": "Register (music)",
-    "contributor_username": "Hyacinth",
-    "id": "612508",
-    "timestamp": "1082665179",
-    "num_characters": "598"
-  },
-  {
-    "title": "Mode (computer interface)",
-    "contributor_username": "Donreed",
-    "id": "2311336",
-    "timestamp": "1182732608",
-    "num_characters": "2991"
-  },
-  {
-    "title": "2007 in music",
-    "contributor_username": "Squilly",
-    "id": "6459333",
-    "timestamp": "1169248845",
-    "num_characters": "45652"
-  },
-  {
-    "title": "List of video games with time travel",
-    "contributor_username": "Rockfang",
-    "id": "21437409",
-    "timestamp": "1234110556",
-    "num_characters": "2344"
-  },
-  {
-    "title": "2008 in music",
-    "contributor_username": "Ba11innnn",
-    "id": "8785767",
-    "timestamp": "1217641857",
-    "num_characters": "107605"
-  },
-  {
-    "title": "Semaphore (programming)",
-    "contributor_username": "Edcolins",
-    "id": "164557",
-    "timestamp": "1144850850",
-    "num_characters": "7616"
-  },
-  {
-    "title": "Wake Forest Demon Deacons men's soccer",
-    "contributor_username": "Rebajc3",
-    "id": "25057749",
-    "timestamp": "1260577388",
-    "num_characters": "26745"
-  }
-]
-
-METADATA = [['List of Canadian musicians', 'Bearcat', 1181623340, 21023, ['canadian', 'canada', 'lee', 'jazz', 'and', 'rock', 'singer', 'songwriter', 'also', 'known', 'hip', 'hop', 'musician', 'folk', 'pop', 'composer', 'drummer', 'player', 'rapper', 'john', 'don', 'guitarist', 'the', 'andrew', 'country', 'indie', 'charlie', 'alternative', 'paul', 'matt', 'james', 'blues', 'bassist', 'cellist', 'pianist', 'artist', 'marie', 'dance', 'winner', 'idol', 'mike', 'keyboardist', 'jason', 'music', 'tim', 'kim', 'soprano', 'kevin', 'martin', 'violinist', 'dan', 'blue', 'new', 'daniel', 'producer', 'punk', 'conductor', 'gospel', 'dave', 'big', 'band', 'george', 'brian', 'bill', 'classical', 'david', 'operatic', 'michael', 'film', 'jon', 'soul', 'billy', 'record', 'jim', 'member', 'broken', 'social', 'scene', 'musical', 'theatre', 'actress', 'actor', 'peter', 'ian', 'electronic', 'rhythm', 'taylor', 'vocalist', 'jesse', 'radio', 'personality', 'for', 'andy', 'former', 'solo', 'chris', 'ryan', 'mark', 'scott', 'kate', 'multi', 'formerly', 'mother', 'instrumentalist', 'johnson', 'white', 'smith']], ['French pop music', 'Brandon', 1172208041, 5569, ['french', 'pop', 'music', 'the', 'france', 'and', 'radio']], ['Edogawa, Tokyo', 'Ciphers', 1222607041, 4526, ['edogawa', 'the', 'with', 'and', 'koiwa', 'kasai', 'player', 'high', 'school']], ['Noise (music)', 'Epbr123', 1194207604, 15641, ['noise', 'music', 'that', 'the', 'use', 'musical', 'this', 'made', 'and', 'sound', 'based', 'some', 'can', 'instruments', 'may', 'machine', 'sounds', 'audio', 'recordings', 'recording', 'other', 'produced', 'electronic', 'such', 'also', 'more', 'with', 'art', 'was', 'for', 'aesthetic', 'example', 'being', 'fluxus', 'artists', 'composition', 'early', 'young', 'rock', 'wave', 'industrial', 'works', 'his', 'from', 'one', 'not', 'signal', 'what', 'any', 'have', 'time', 'like', 'paul', 'hegarty', 'work', 'these', 'john', 'cage', 'which', 'all', 'japanese', 'genre', 'but', 'russolo', 'used', 'white', 'same', 'track', 'artist', 'first', 'had', 'found', 'called', 'created', 'paris', 'sirens', 'piece', 'using', 'percussion', 'tape', 'musique', 'concrète', 'group', 'recorded', 'various', '1960', 'album', 'cassette', 'ubuweb', 'com', 'ubu']], ['1922 in music', 'Jafeluv', 1242717698, 11576, ['music', 'the', '1922', 'january', 'first', 'may', 'orchestra', 'radio', 'october', 'and', 'for', 'paul', 'walter', 'george', 'billy', 'harry', 'you', 'march', 'april', 'production', 'opened', 'theatre', 'september', 'ran', 'performances', 'august', 'american', 'singer', 'actress', 'composer', 'june']], ['Ken Kennedy (computer scientist)', 'Jlalbee', 1246308670, 4144, ['kennedy', 'was', 'computer', 'and', 'the', 'for', 'award']], ['1986 in music', 'Michael', 1048918054, 6632, ['music', 'the', '1986', 'british', 'jazz', 'january', 'and', 'february', 'for', 'record', 'artist', 'may', 'june', 'september', 'october', 'november', 'december', 'musical', 'march', 'april', 'july', 'flute', 'opera', 'london', 'korean', 'singer', 'actor', 'american', 'english', 'guitarist', 'australian', 'musician', 'songwriter', 'composer', 'actress', 'producer', 'dancer']], ['Spain national beach soccer team', 'Pegship', 1233458894, 1526, ['beach', 'soccer', 'fifa']], ['Kevin Cadogan', 'Renesis', 1144136316, 3917, ['cadogan', 'record', 'and', 'the', 'band', 'third', 'eye', 'blind', 'with', 'from', 'their', 'album', 'his', 'jenkins', 'recording', 'elektra', 'records', 'was', 'for', 'california', 'two', 'music', 'that', 'have', 'were']], ['Endogenous cannabinoid', 'RussBot', 1168971903, 26, []], ['2009 in music', 'SE KinG', 1235133583, 69451, ['this', 'and', '2009', 'music', 'american', 'british', 'canadian', 'new', 'rock', 'pop', 'jazz', 'january', 'lady', 'gaga', 'debut', 'single', 'just', 'dance', 'hit', 'number', 'one', 'the', 'billboard', 'hot', '100', 'after', 'weeks', 'second', 'since', 'with', 'november', 'also', 'singles', 'chart', 'three', 'week', 'february', 'day', 'out', 'festival', 'takes', 'place', 'are', 'all', 'concert', 'held', 'beyoncé', 'shakira', 'taylor', 'songs', 'performed', 'had', 'album', 'including', 'jay', 'for', 'kelly', 'clarkson', 'record', 'her', 'life', 'would', 'you', 'from', '000', 'first', 'release', 'announces', 'that', 'she', 'tour', 'run', 'july', 'top', 'five', 'time', 'show', 'awards', 'which', 'win', 'their', 'year', 'wins', 'best', 'song', 'two', 'artist', 'blink', '182', 'rihanna', 'announced', 'was', 'live', '2008', 'sold', 'releases', 'third', 'female', 'only', 'his', 'last', 'years', 'march', 'john', '2003', 'million', 'britney', 'spears', 'world', 'michael', 'jackson', 'concerts', 'death', 'name', 'selling', 'ever', 'singer', 'studio', 'face', 'becomes', 'rapper', 'april', 'paul', '2002', 'black', 'band', 'featuring', 'bass', 'musical', 'have', 'may', 'december', '2004', 'hiatus', '2005', 'june', 'stage', 'september', 'august', 'eyed', 'peas', 'west', 'kanye', 'girls', 'october', 'hits', 'touring', '2001', 'drummer', 'love', 'boom', 'guitarist', 'musician', 'composer', 'songwriter']], ['Rock music', 'Sabrebd', 1258069053, 119498, ['rock', 'music', 'genre', 'popular', 'that', 'and', 'roll', 'the', 'united', 'states', 'late', 'early', '1950s', 'developed', 'into', 'range', 'different', 'styles', 'mid', '1960s', 'later', 'particularly', 'kingdom', 'has', 'its', 'style', 'which', 'from', 'genres', 'blues', 'rhythm', 'country', 'also', 'number', 'other', 'such', 'electric', 'folk', 'incorporated', 'influences', 'jazz', 'musical', 'for', 'instrumentation', 'guitar', 'usually', 'part', 'group', 'with', 'drums', 'one', 'more', 'song', 'based', 'time', 'using', 'form', 'but', 'become', 'diverse', 'like', 'pop', 'lyrics', 'often', 'variety', 'themes', 'are', 'social', 'political', 'period', 'distinct', 'subgenres', 'had', 'emerged', 'including', 'southern', 'many', 'development', 'psychedelic', 'was', 'influenced', 'scene', 'new', 'included', 'progressive', 'elements', 'glam', 'subgenre', 'heavy', 'metal', 'power', 'second', '1970s', 'punk', 'down', 'influence', '1980s', 'wave', 'post', 'alternative', '1990s', 'began', 'mainstream', 'grunge', 'britpop', 'indie', 'have', 'since', 'electronic', 'rap', 'well', 'history', 'garage', '2000s', 'saw', 'decline', 'popularity', 'cultural', 'hip', 'hop', 'most', 'leading', 'major', 'out', 'culture', 'emo', 'been', 'associated', 'sex', 'use', 'seen', 'youth', 'against', 'sound', 'sounds', 'pioneered', 'same', 'era', 'produced', 'this', 'instruments', 'derived', 'band', 'lead', 'musicians', 'between', 'members', 'whose', 'guitarist', 'simple', 'beat', 'two', 'four', 'common', 'used', 'there', 'considerable', 'forms', 'rebellion', 'these', 'were', 'christgau', 'cool', 'white', 'male', 'black', 'largely', 'audience', 'both', 'some', 'term', 'being', 'emphasis', 'performance', 'than', 'art', 'soul', 'even', 'through', 'much', 'his', 'all', 'record', 'singer', 'boys', 'their', 'during', 'world', 'playing', 'first', 'describe', 'recorded', 'records', 'around', 'became', 'top', 'billboard', 'airplay', 'charts', 'worldwide', 'single', 'artists', 'hits', 'soon', 'american', 'who', 'dominated', 'decade', 'played', 'commercial', 'success', 'would', 'hurricane', 'along', 'brothers', 'they', 'traditional', 'vocal', 'gained', 'groups', 'acts', 'songs', 'among', 'successful', 'link', 'brought', 'britain', 'hit', 'helped', 'john', 'moved', 'figures', 'end', 'instrumental', 'general', 'about', '1967', 'increasingly', 'albums', 'existing', 'trends', 'not', 'while', 'performers', 'female', 'can', 'british', 'recording', 'significant', 'led', 'becoming', 'pursued', 'careers', 'singles', 'recordings', 'santana', '1969', 'album', 'surf', 'distinctive', 'regional', 'following', 'bands', 'formed', 'california', 'ten', 'national', '1963', 'known', 'achieved', 'work', 'them', 'reached', 'make', 'invasion', 'what', 'beatles', 'rolling', 'stones', 'yardbirds', 'directly', 'high', 'tended', 'less', 'however', 'followed', 'selling', 'subsequent', 'international', 'america', 'scenes', 'greater', 'labels', 'commercially', '1968', 'college', 'psychedelia', 'although', 'taken', 'inspired', 'acoustic', 'adopted', 'after', 'key', 'green', 'off', 'jimi', 'hendrix', 'away', 'hard', 'continued', 'revival', 'movement', 'dylan', 'byrds', 'took', 'york', 'peak', 'sometimes', 'mixed', 'beside', 'label', 'oriented', 'came', '1970', 'radio', '1976', 'christian', 'independent', 'hardcore', 'heartland', '2001', 'women']], ['Medical value travel', 'Argon233', 1153157342, 4149, []], ['Lights (musician)', 'Espo3699', 1213914297, 5898, ['lights', 'april', 'canadian', 'and', 'from', 'she', 'for', 'second', 'was', 'the', '2009', 'new', 'music', 'her', 'released', 'september', '2008', 'which', 'release', 'first', 'album', 'listening', 'siberia', 'october', 'canada', 'little', 'machines', '2014', 'skin', 'earth', '2017', 'with', 'acoustic', 'songs', 'early', 'one', 'song', 'track', 'band', 'august', 'july', 'single', 'had', 'video', 'its', 'their', 'tour', 'received', 'that', 'were']], ['List of soul musicians', 'Ghmyrtle', 1175455921, 4878, ['the']], ['Human computer', 'Giftlite', 1248275178, 4750, ['the', 'computer', 'from', 'first', 'one', 'who', 'mathematical', 'calculations', 'computers', 'human', 'often', 'women', 'were', 'used', 'and', 'work', 'was', 'that', 'this', 'also', 'with', 'for', 'computing', 'tables', 'project', 'his', 'had', 'worked', 'data', 'harvard', 'committee', 'pearson', 'humans', 'world', 'war']], ['Aube (musician)', 'Nihonjoe', 1145410600, 3152, ['akifumi', 'his', 'aube', 'was', 'and', 'the', 'with']], ['List of overtone musicians', 'Sborsody', 1176928050, 2299, ['and', 'overtone', 'singing', 'the', 'with', 'from', 'musician', 'singer']], ['Black dog (ghost)', 'SmackBot', 1220471117, 14746, ['black', 'dog', 'found', 'the', 'folklore', 'some', 'and', 'often', 'said', 'with', 'devil', 'described', 'its', 'was', 'death', 'has', 'large', 'eyes', 'sometimes', 'such', 'shuck', 'also', 'are', 'dogs', 'have', 'been', 'this', 'were', 'way', 'that', 'barghest', 'they', 'may', 'for', 'known', 'night', 'them', 'from', 'other', 'padfoot', 'skriker', 'church', 'grim', 'not', 'can', 'form', 'england', 'being', 'who', 'his', 'when', 'hounds', 'appeared', 'around', 'ghostly', 'story', 'hound', 'near', 'haunted', 'named', 'which', 'area', 'haunt', 'heard', 'omen', 'seen', 'haunts', 'had', 'name', 'but', 'man', 'village', 'would', 'one', 'there', 'home', 'any', 'where', 'through', 'old', 'legend', 'before', 'their', 'people', 'another', 'like', 'then', 'usually', 'local', 'will']], ['USC Trojans volleyball', 'Smuckers', 1218049435, 5525, ['the', 'usc', 'women', 'volleyball', 'team', 'first', 'ncaa', 'national', 'and', 'final', '2008', 'indoor', 'troy', 'season', 'olympian']], ['Tim Arnold (musician)', 'Sohohobo', 1181480380, 4551, ['arnold', 'and', 'london', 'his', 'music', 'the', 'with', 'also', 'for', 'soho', 'released', 'album', 'was', 'solo', 'would', 'song', 'love']], ['2007 Bulldogs RLFC season', 'Timmah86', 1177410119, 11116, ['the', '2007', 'bulldogs', 'season', 'was', 'telstra', 'and', 'against', 'stadium', 'game', 'for', 'down', 'one', 'comeback', 'saw', 'week', 'their', 'first', 'win', 'front', 'round', 'with', 'match', 'points', 'dogs', 'from', 'another', 'top', 'publishing', 'isbn', 'rugby', 'league']], ['Peter Brown (music industry)', 'Zephyrad', 1240235639, 2837, ['brown', 'epstein', 'the', 'beatles', 'and', 'member']], ['Mexican dog-faced bat', 'AnomieBOT', 1255316429, 1138, ['the', 'dog', 'faced', 'bat', 'and']], ['Embryo drawing', 'AxelBoldt', 1034459202, 1712, ['embryo', 'the', 'embryos', 'developmental', 'and', 'animals', 'from', 'that', 'form', 'which', 'early', 'different', 'species', 'this', 'drawings', 'are', 'biology', 'embryonic', 'stages', 'between', 'evolution', 'has', 'both', 'ernst', 'haeckel', 'vertebrate', 'recapitulation', 'theory', 'development', 'evolutionary', 'work', 'comparative', 'anatomy', 'into', 'embryology', 'more', 'were', 'similar', 'for', 'but', 'although', 'his', 'biogenetic', 'law', 'certain', 'von', 'baer', 'wilhelm', 'not', 'gould', 'other', 'richardson', 'university', 'was', 'laws', 'series', 'most', 'one', 'with', 'phylogenetic', 'history', 'through', 'argues', 'features', 'general', 'than', 'human', 'rather', 'specifically', 'comparison', 'science', 'darwin']], ['Old-time music', 'Badagnani', 1124771619, 12755, ['old', 'time', 'music', 'north', 'american', 'folk', 'developed', 'with', 'such', 'dancing', 'and', 'played', 'instruments', 'generally', 'fiddle', 'string', 'most', 'often', 'the', 'banjo', 'guitar', 'that', 'are', 'traditional', 'some', 'also', 'prominent', 'while', 'many', 'dance', 'tunes', 'other', 'native', 'one', 'first', 'recordings', 'country', 'for', 'which', 'appalachian', 'southern', 'style', 'but', 'were', 'these', 'mountain', '19th', 'early', 'styles', 'united', 'states', 'century', 'region', 'include', 'new', 'city', 'musicians', 'their', 'band', 'was', 'well', 'tradition', 'particularly', 'from', 'bluegrass', 'players', 'there', 'finger', 'three', 'have', 'been', 'more', 'this', 'dulcimer', 'regional', 'appalachia', 'its', 'own', 'songs', 'has', 'canada', 'traditions', 'west', 'carolina', 'virginia', 'family', 'tennessee', 'festival', 'bands', 'established', 'schools', 'directed']], ['Arabic music', 'Badagnani', 1209417864, 25114, ['arabic', 'music', 'arab', 'the', 'world', 'with', 'all', 'styles', 'and', 'genres', 'have', 'many', 'also', 'region', 'traditional', 'has', 'other', 'musical', 'that', 'islamic', 'arabian', 'was', 'middle', 'most', 'there', 'between', 'century', 'used', 'notes', 'would', 'not', 'these', 'some', 'instruments', 'such', 'songs', 'were', 'singer', 'maqam', 'notable', 'from', 'which', 'early', 'both', 'are', 'system', 'can', 'several', 'like', 'oud', 'theory', 'including', 'tones', 'scale', 'modern', 'his', 'tone', 'form', 'western', 'for', 'first', 'european', 'egypt', 'cairo', 'singers', 'this', 'been', 'popular', 'later', 'artists', 'use', 'pop', 'rock', 'east', 'quarter', 'genre', 'guitar', 'known', 'scholars', 'but', 'morocco', 'jazz', 'ajnas']], ['C Sharp (programming language)', 'Eaglizard', 1232492672, 52364, ['sharp', 'like', 'the', 'but', 'with', 'number', 'programming', 'language', 'functional', 'object', 'class', 'and', 'was', 'microsoft', 'its', 'net', 'standard', 'ecma', 'iso', 'mono', 'name', 'open', 'source', 'project', 'compiler', 'runtime', 'for', 'languages', 'common', 'infrastructure', 'cli', 'most', 'which', 'design', 'support', 'such', 'type', 'use', 'variables', 'garbage', 'are', 'very', 'code', 'programmers', 'both', 'from', 'that', 'functions', 'memory', 'not', 'framework', 'libraries', 'using', 'system', 'called', 'time', 'been', 'has', 'java', 'have', 'similar', 'two', 'can', 'used', 'any', 'other', 'features', 'linq', 'expressions', 'methods', 'types', 'through', 'data', 'program', 'this', 'also', 'specification', 'implementation', 'into', 'classes', 'value', 'some', 'does', 'specific', 'implicit', 'keyword', 'only', 'default', 'defined', 'unlike', 'all', 'static', 'method', 'each', 'they', 'namespace', 'same', 'reference', 'instance', 'example', 'console']], ['List of Saturday Night Live musical sketches', 'Gary King', 1134966249, 13287, ['saturday', 'night', 'live', 'the', 'chris']], ['Joe Becker (musician)', 'Gary King', 1203234507, 5842, ['becker', 'and', 'guitar', 'the', 'joe', 'music', 'records', 'film', 'soundtrack', 'horror', 'released', 'performed']], ['Will Johnson (soccer)', 'Mayumashu', 1218489712, 3562, ['johnson', 'canadian', 'soccer', 'player', 'played', 'for', 'league', 'canada', 'was', 'the', 'his', 'and', 'team', 'season', 'after', 'year', 'mls', 'first', 'scored', 'goal', 'with', 'december', '2008', 'real', 'salt', 'lake', 'against', 'cup', '2013', '2016']], ['Aco (musician)', 'Noodleboy', 1132546632, 3129, ['the']], ['Geoff Smith (British musician)', 'Richardrj', 1194687509, 2043, ['smith', 'was', 'the', 'film']], ['Fiskerton, Lincolnshire', 'Snigbrook', 1259869948, 5853, ['fiskerton', 'village', 'and', 'the', 'was', 'which', 'that', 'been']], ['Reflection-oriented programming', 'Soumyasch', 1143366937, 38, []], ['B (programming language)', 'Uvaphdman', 1196622610, 5482, ['language', 'the', 'thompson', 'ritchie', 'was', 'from', 'bcpl', 'and', 'that', 'for', 'pdp', 'version', 'this']], ['Richard Wright (musician)', 'Bdubiscool', 1189536295, 16185, ['wright', 'was', 'and', 'member', 'the', 'band', 'pink', 'floyd', 'all', 'but', 'one', 'playing', 'end', 'waters', 'mason', 'while', 'after', 'joined', 'barrett', 'group', 'him', 'gilmour', 'with', 'later', 'touring', 'wall', 'for', 'became', 'full', 'time', 'division', 'bell', 'sessions', 'during', 'were', 'released', 'album', 'from', 'two', 'solo', 'including', 'broken', 'live', 'part', 'lead', 'such', 'his', 'farfisa', 'hammond', 'took', 'early', 'play', 'guitar', 'piano', 'mother', 'musical', 'music', 'which', 'not', 'had', 'london', 'organ', 'through', 'first', 'that', 'vocals', 'played', 'keyboards', 'would', 'concert', 'been', 'more', 'some', 'tour', 'said', 'used', 'using']], ['Voice classification in non-classical music', 'Iridescent', 1198092852, 11280, ['system', 'voice', 'classification', 'non', 'classical', 'music', 'are', 'used', 'not', 'vocal', 'but', 'range', 'these', 'with', 'singers', 'and', 'that', 'the', 'term', 'systems', 'type', 'for', 'voices', 'within', 'singing', 'this', 'two', 'one', 'opera', 'choral', 'other', 'men', 'women', 'soprano', 'mezzo', 'contralto', 'tenor', 'categories', 'alto', 'male', 'sing', 'female', 'singer', 'would', 'have', 'line', 'middle', 'however', 'below', 'list']], ['Dalmatian (dog)', 'J. Spencer', 1207793294, 26582, ['the', 'dalmatian', 'breed', 'dog', 'for', 'its', 'with', 'liver', 'spots', 'and', 'used', 'can', 'that', 'were', 'breeds', 'dalmatians', 'kennel', 'club', 'well', 'akc', 'standard', 'from', 'both', 'but', 'not', 'are', 'usually', 'color', 'blue', 'dogs', 'other', 'puppies', 'their', 'first', 'they', 'have', 'may', 'which', 'often', 'health', 'deafness', 'hearing', 'years', 'was', 'this', 'also', 'been', 'hyperuricemia', 'uric', 'acid', 'backcross', 'project', 'horses', 'fire']], ['1936 in music', 'JohnRogers', 1243745950, 23417, ['music', 'the', '1936', 'country', 'january', 'march', 'symphony', 'orchestra', 'april', 'concerto', 'may', 'and', 'little', 'time', 'december', 'film', 'opera', 'cole', 'with', 'his', 'conductor', 'introduced', 'shirley', 'dorothy', 'fields', 'jerome', 'kern', 'fred', 'astaire', 'swing', 'your', 'for', 'musical', 'love', 'dance', 'billy', 'harry', 'you', 'ginger', 'rogers', 'irving', 'berlin', 'follow', 'fleet', 'richard', 'johnny', 'rhythm', 'bing', 'crosby', 'sing', 'singer', 'jack', 'string', 'quartet', 'london', 'production', 'opened', 'theatre', 'ran', 'performances', 'september', 'october', 'starring', 'november', 'featuring', 'composer', 'pianist', 'songwriter', 'february', 'june', 'august']], ['Guide dog', 'Sarranduin', 1165601603, 7339, ['guide', 'dogs', 'the', 'are', 'assistance', 'trained', 'blind', 'and', 'people', 'human', 'training', 'who', 'from', 'dog', 'with', 'most', 'service', 'animals', 'public', 'was', 'that', 'have', 'used', 'for', 'other', 'their', 'first', 'animal', 'were', 'not', 'united', 'states', 'german', 'access', 'breed', 'labrador', 'act', 'general', 'rights', 'more', 'allowed']], ['1962 in country music', 'Briguy52748', 1249862464, 7954, ['country', 'music', 'the', 'and', 'singer']], ['List of dystopian music, TV programs, and games', 'Notinasnaid', 1165317338, 13458, ['this', 'dystopian', 'themes', 'music', 'and', 'games', 'computer', 'role', 'the', 'features', 'rock', 'band', 'black', 'with', 'their', 'american', 'both', 'from', 'which', 'dystopia', 'one', 'most', 'was', 'living', 'various', 'songs', 'society', 'world', 'that', 'life', '2000', 'about', 'future', 'government', 'space', 'many', 'are', 'set', 'based', 'man', 'series', 'against', 'have', 'human', '1984', 'orwell', 'book', 'while', 'video', 'for', 'song', 'album', 'death', '2010', 'concept', 'shooter', 'new', 'after', 'last', 'year', 'four', 'known', 'fighting', 'organization', 'earth', '1987', '2002', 'planet', 'final', 'when', '2007', 'where', 'corporate', 'who', 'two', 'controlled', 'syndicate', 'technology', 'being', 'has', 'around', 'post', 'nuclear', 'apocalyptic', 'utopia', 'between', 'main', 'his', 'they', 'story', 'takes', 'place', 'artificial', 'people', 'end', 'such', 'evil', 'global', 'humanity', 'time', 'point', 'control', 'into', 'group', 'power', 'zero', 'take', 'back', 'alternate', 'alien', 'all', 'first', 'through', 'also', 'citizens', 'police', 'rule', 'protagonist', 'order', 'dark', '2005', '2015', '2008', 'its', 'system', 'ruled', 'city', 'her', 'television', 'present', 'created', 'but', 'only', 'under', 'episode', '2013', 'had', 'united', 'states', 'there', 'war', 'years', '2003', 'bbc', 'century', 'now', 'season', 'universe', 'state', 'out', 'near', 'called', 'taken', 'economic', 'collapse', 'were', 'developed', 'crime', 'left', 'humans', 'oppressive', 'game', 'over', 'america', 'population', 'begins', 'been', 'virus', 'him', 'girls', 'race', 'them', 'prevent', 'player', 'person', 'deus']], ['Steven Cohen (soccer)', 'Scouselad10', 1237669593, 2117, ['cohen', 'the', 'world', 'soccer', 'daily', 'was', 'club', 'his', 'liverpool', 'for', 'and', 'that']], ['Steve Perry (musician)', 'Woohookitty', 1254812045, 22204, ['perry', 'singer', 'and', 'the', 'lead', 'rock', 'band', 'journey', 'during', 'their', 'from', '1998', 'also', 'had', 'solo', 'music', 'time', 'voice', 'has', 'been', 'greatest', 'was', 'california', 'his', 'radio', 'mother', 'then', 'with', 'for', 'song', 'after', 'first', 'that', 'wrote', 'were', 'record', 'album', 'project', 'would', 'never', 'tour', 'former', 'which', 'vocals', 'trial', 'fire', 'songs', 'released', 'sherrie', 'out', 'steve', 'two']], ['2009 Louisiana Tech Bulldogs football team', 'AllisonFoley', 1245796406, 22410, ['the', 'team', 'joe', 'red', 'from', 'quarter', 'pass', 'dennis', 'morris', 'daniel', 'porter', 'run', 'point', 'williams', 'two', '1st', 'aub', 'wes', 'byrum', 'ross', 'jenkins', 'matt', 'nelson', 'kick', 'chris', 'navy', 'return', 'state', 'nev', 'kyle', 'bsu', 'brotzman', 'fres', 'kevin', 'goessling']], ['David Gray (musician)', 'RattleandHum', 1159841492, 7203, ['david', 'gray', 'released', 'his', 'first', 'album', 'and', 'the', 'release', 'white', 'ladder', 'was', 'chart', 'for', 'which', 'two', 'also', 'united', 'best', 'october', 'awards', 'life', 'with', 'had', 'that', 'music', 'sell', 'songs', 'guitar', 'year', 'its', 'single', 'vocals', 'new', 'touring', 'september', 'tour', 'backing']], ['Craig Martin (soccer)', 'Darius Dhlomo', 1174203493, 709, ['the']], ['Georgia Bulldogs football', 'Davidscharoun', 1166567889, 43718, ['the', 'georgia', 'bulldogs', 'football', 'university', 'bowl', 'national', 'athletic', 'and', 'division', 'conference', 'sec', 'they', 'their', 'home', 'games', 'sanford', 'stadium', 'season', 'was', 'uga', 'two', 'championships', '1980', 'have', 'champion', 'has', 'also', 'been', 'one', 'other', '1920', 'won', 'tied', 'for', 'second', 'most', 'history', 'all', 'time', 'team', 'its', 'bulldog', 'over', 'times', 'which', 'were', 'southern', 'first', 'from', 'during', 'years', 'with', 'championship', 'head', 'game', 'against', 'after', 'vince', 'dooley', 'coach', 'are', 'played', 'hall', 'fame', 'inducted', 'fans', 'that', 'used', 'red', 'black', 'since', 'white', 'when', 'silver', 'britches', 'changed', 'uniform', 'pants', 'players', 'helmet', 'jerseys', 'stripe', 'numbers', 'away']], ['Time travel', 'Thug outlaw69', 1140826049, 35170, ['time', 'travel', 'the', 'concept', 'between', 'certain', 'different', 'space', 'object', 'person', 'with', 'known', 'machine', 'and', 'fiction', 'idea', 'was', 'past', 'possible', 'forward', 'special', 'relativity', 'general', 'however', 'one', 'more', 'than', 'another', 'not', 'for', 'backward', 'that', 'allow', 'such', 'traveling', 'point', 'spacetime', 'has', 'physics', 'only', 'quantum', 'mechanics', 'wormholes', 'history', 'some', 'story', 'who', 'when', 'earth', 'many', 'have', 'first', 'his', 'future', 'where', 'been', 'but', 'science', 'early', 'are', 'through', 'means', 'used', 'these', 'which', 'about', 'from', 'because', 'traveler', 'does', 'present', 'back', 'events', 'real', 'other', 'same', 'example', 'before', 'this', 'may', 'clock', 'might', 'into', 'were', 'physicists', 'possibility', 'closed', 'curves', 'world', 'their', 'own', 'there', 'any', 'theory', 'would', 'causality', 'grandfather', 'paradox', 'what', 'novikov', 'can', 'self', 'principle', 'worlds', 'interpretation', 'faster', 'speed', 'light', 'gravity', 'effects', 'hawking', 'exist', 'also', 'its', 'all', 'wormhole', 'way', 'end', 'dilation', 'either', 'will', 'matter', 'two', 'existence', 'negative', 'energy', 'argued', 'could', 'each', 'violation', 'classical', 'impossible', 'region', 'signal', 'event', 'information', 'they', 'even', 'single', 'travelers', 'experiment', 'photons', 'philosophers', 'presentism']], ['Fisk University', 'NerdyScienceDude', 1263393671, 16246, ['fisk', 'university', 'black', 'nashville', 'the', 'was', 'and', 'its', 'campus', 'historic', 'national', 'first', 'african', 'american', 'association', 'colleges', 'schools', 'for', 'school', 'education', 'that', 'named', 'which', 'with', 'student', 'from', 'during', 'students', 'two', 'became', 'arts', 'college', 'had', 'hall', 'building', 'built', 'president', 'program', 'other', 'stieglitz', 'collection', 'art']], ['Annie (musical)', 'Piano non troppo', 1223619626, 27558, ['annie', 'broadway', 'musical', 'the', 'little', 'orphan', 'with', 'charnin', 'and', 'book', 'meehan', 'original', 'production', 'opened', '1977', 'for', 'theatre', 'now', 'many', 'national', 'tours', 'including', 'songs', 'tomorrow', 'hard', 'knock', 'life', 'are', 'most', 'year', 'old', 'girls', 'orphanage', 'other', 'orphans', 'when', 'molly', 'from', 'she', 'pepper', 'july', 'tells', 'into', 'back', 'then', 'her', 'parents', 'they', 'this', 'maybe', 'but', 'miss', 'hannigan', 'later', 'his', 'after', 'their', 'reprise', 'him', 'where', 'made', 'have', 'like', 'you', 'who', 'been', 'grace', 'farrell', 'oliver', 'warbucks', 'christmas', 'was', 'all', 'new', 'york', 'rooster', 'lily', 'that', 'not', 'one', 'show', 'song', 'never', 'fully', 'dressed', 'without', 'smile', 'about', 'shows', 'two', 'more', 'second', 'produced', 'united', 'first', 'were', 'character', 'version', 'had', 'out', 'novelisation', 'actress', 'play', 'title', 'role', 'producers', 'performances', 'played', 'starred', 'daddy', 'ann', 'also', 'closed', 'january', 'until', '2009', 'touring', 'run', 'there', 'tour', 'company', '1978', 'may', '1979', 'took', 'over', '1981', 'september', 'west', '1982', 'film', 'playing', 'cast', 'end', 'recording', 'performed', 'revival', '1997', 'anniversary', 'nell', 'carter', 'released', '1998', '1999', '2000', '2001', '2010', '2007', '2011', '2005', 'directed', '2012', 'school', 'references', 'episode']], ['Alex Turner (musician)', 'CambridgeBayWeather', 1187010135, 9718, ['david', 'turner', 'english', 'and', 'the', 'rock', 'band', 'arctic', 'monkeys', 'with', 'has', 'released', 'albums', 'also', 'recorded', 'his', 'side', 'last', 'shadow', 'puppets', 'when', 'was', 'three', 'friends', 'their', 'sheffield', 'debut', 'album', 'that', 'what', 'not', 'stone', 'all', 'time', 'studio', '2007', '2011', '2013', 'tranquility', 'base', 'hotel', '2018', 'have', 'music', 'festival', 'both', 'performed', 'during', '2012', 'london', 'summer', 'miles', 'kane', 'two', 'age', '2008', 'you', 'come', '2016', 'for', 'wrote', 'savior', '2017', 'from', 'been', 'times', 'early', 'school', 'said', 'father', 'were', 'played', 'had', 'some', 'years', 'helders', 'they', 'joined', 'other', 'while', 'guitar', 'nicholson', 'him', 'year', 'who', 'than', 'noted', 'too', 'writing', '2004', 'get', 'out', 'one', 'after', 'began', 'mid', 'about', 'songs', 'later', 'would', 'just', 'first', 'york', 'voice', 'song', 'working', 'part', 'richard', 'clarke', 'attention', 'april', 'most', 'single', 'tour', 'james', 'ford', 'lyrics', 'new', 'remarked', 'are', 'petridis', 'guardian', 'described', 'like', 'but', 'love', 'writer', 'pitchfork', 'stage', 'style', 'los', 'angeles', 'more']], ['Python (programming language)', 'Lulu of the Lotus-Eaters', 1137530195, 41571, ['python', 'and', 'programming', 'language', 'van', 'rossum', 'first', 'released', 'design', 'philosophy', 'code', 'with', 'its', 'use', 'object', 'oriented', 'for', 'large', 'multiple', 'including', 'often', 'standard', 'library', 'was', 'the', 'features', 'like', 'list', 'system', 'reference', 'major', 'that', 'not', 'run', 'release', 'more', 'other', 'will', 'are', 'supported', 'available', 'many', 'community', 'cpython', 'implementation', 'software', 'development', 'project', 'from', 'new', 'support', 'version', 'releases', 'include', 'which', 'methods', 'uses', 'also', 'name', 'method', 'variable', 'names', 'program', 'some', 'has', 'functions', 'expressions', 'modules', 'such', 'better', 'than', 'rather', 'all', 'into', 'this', 'applications', 'interpreter', 'syntax', 'while', 'there', 'one', 'can', 'time', 'written', 'languages', 'spam', 'eggs', 'common', 'have', 'style', 'where', 'statements', 'indentation', 'block', 'but', 'most', 'assignment', 'statement', 'value', 'type', 'using', 'same', 'example', 'since', 'may', 'objects', 'types', 'strings', 'data', 'three', 'each', 'used', 'class', 'function', 'before', 'operator', 'import', 'module', 'similar', 'java', 'division', 'integer', 'libraries', 'part', 'expression', 'both', 'number', 'string', 'blah', 'index', 'negative', 'third', 'classes', 'round', 'several', 'scripting', 'processing', 'web', 'implementations', 'package', 'programs', 'compiles', 'been', '2012', 'isbn', '978']], ['List of gospel musicians', 'Absolon', 1197658845, 3805, ['list', 'christian', 'music', 'performers', 'the', 'gospel']], ['Tom Hooper (musician)', 'Bearcat', 1204967541, 1441, ['hooper', 'and', 'the']], ['Endoglin', 'DOI bot', 1212259031, 6778, ['endoglin', 'cell', 'and', 'the', 'tgf', 'beta', 'receptor', 'complex', 'has', 'role', 'for', 'tumor', 'growth', 'cancer', 'cells', 'other', 'gene', 'expression', 'with', 'this', 'that', 'which', 'are', 'extracellular', 'domain', 'cytoplasmic', 'region', 'bmp', 'can', 'been', 'binding', 'bind', 'cellular', 'its']], ['Indian classical music', 'Davydog', 1222543238, 9503, ['indian', 'classical', 'music', 'the', 'subcontinent', 'which', 'india', 'and', 'most', 'after', 'western', 'has', 'two', 'major', 'traditions', 'north', 'tradition', 'called', 'hindustani', 'while', 'south', 'expression', 'carnatic', 'these', 'were', 'not', 'about', '16th', 'century', 'into', 'forms', 'raga', 'based', 'however', 'systems', 'have', 'more', 'than', 'are', 'found', 'hinduism', 'ancient', 'natyashastra', 'sanskrit', 'text', 'performance', 'both', 'tala', 'notes', 'melodic', 'structure', 'time', 'from', 'with', 'for', 'between', 'such', 'dance', 'form', 'this', 'his', 'one', 'some', 'texts', 'part', 'musical', 'swaras', 'octave', 'song', 'different', 'ragas', 'but', 'example', 'also', 'according', 'that', 'was', 'instruments', 'four', 'their', 'each', 'states', 'system', 'theory', 'talas', 'modern', 'era', 'musicians', 'hindu', 'many', 'other', 'scholars', 'its', 'folk', 'influences', 'persian', 'may', 'performed', 'link', 'scale', 'university', 'press', 'isbn', '978', 'cs1', 'maint', 'ref', 'harv', '2012', 'oxford', 'moutal', 'patrick']], ['Sun dog', 'Hellbus', 1208969289, 18050, ['sun', 'dog', 'parhelia', 'that', 'one', 'the', 'two', 'dogs', 'halo', 'ice', 'crystals', 'light', 'and', 'they', 'can', 'seen', 'are', 'from', 'with', 'their', 'more', 'for', 'which', 'other', 'being', 'suns', 'weather', 'day', 'his', 'was', 'were']], ['1996 in music', 'Kharker', 1148585201, 21688, ['music', 'that', 'the', 'year', '1996', 'country', 'january', 'and', 'madonna', 'american', 'for', 'been', 'are', 'records', 'released', 'song', 'all', 'their', 'dancer', 'singer', 'one', 'from', 'michael', 'february', 'day', 'out', 'new', 'after', 'with', 'musical', 'its', 'first', 'kiss', 'they', 'awards', 'band', 'his', 'releases', 'album', 'september', 'record', 'reunion', 'march', 'john', 'concert', 'tour', 'april', 'mtv', 'video', 'july', 'producer', 'may', 'actress', 'june', 'group', 'single', 'august', 'guitarist', 'david', 'rapper', 'jack', 'october', 'november', 'december', 'concerto', 'broadway', 'songwriter', 'musician', 'actor', 'composer']], ['Lua (programming language)', 'Makkuro', 1113957128, 0, ['lua', 'from', 'programming', 'language', 'for', 'use', 'applications', 'the', 'and', 'api', 'into', 'was', 'software', 'most', 'languages', 'features', 'were', 'not', 'such', 'extension', 'its', 'ierusalimschy', 'tecgraf', 'had', 'that', 'data', 'object', 'any', 'only', 'which', 'syntax', 'scripting', 'new', 'other', 'also', 'example', 'with', 'function', 'table', 'functions', 'are', 'can', 'using', 'first', 'class', 'number', 'values', 'array', 'this', 'loop', 'nil', 'tables', 'key', 'value', 'used', 'stack', 'based', 'game', 'isbn', '978', 'archived', 'original', 'july', '2018']], ['Single-board computer', 'Nathael', 1220260601, 8271, ['single', 'board', 'computer', 'with', 'and', 'computers', 'are', 'for', 'embedded', 'often', 'such', 'more', 'plug', 'backplane', 'system', 'the', 'used', 'sbcs', 'motherboard', 'cards']], ['Mets de Guaynabo (volleyball)', 'Osplace', 1239156764, 2091, []], ["United States men's national soccer team 2009 results", 'Rebajc3', 1252384026, 79089, []], ['Joseph Williams (musician)', 'RussBot', 1140752684, 4253, ['williams', 'and', 'film', 'for', 'his', 'the', 'toto', 'lead', 'from', 'was', 'albums', 'album', 'compilation', '2006', 'vocals', 'solo', 'released', 'project', 'songs', 'song']], ['The Hunchback of Notre Dame (musical)', 'RussBot', 1192176615, 42, ['the', 'hunchback', 'notre', 'dame', 'musical', 'with', 'songs', 'from', 'disney', 'film', 'original', '1999', 'berlin', 'der', 'glöckner', 'von', 'was', 'first', 'premiere', 'for', 'one', 'english', 'had', 'its', 'playhouse', '2014', 'and', 'show', 'new', 'which', 'after', 'that', 'would', 'not', 'broadway', '2017', 'german', 'production', 'stage', 'into', 'received', 'king', 'this', 'version', 'arts', 'cast', 'quasimodo', 'his', 'nominations', 'award']], ['China national soccer team', 'Seedbot', 1199103839, 45, []], ['Covariance and contravariance (computer science)', 'Wakapop', 1167547364, 7453, ['programming', 'language', 'type', 'support', 'subtyping', 'for', 'the', 'cat', 'subtype', 'animal', 'then', 'should', 'used', 'variance', 'how', 'more', 'complex', 'types', 'example', 'list', 'function', 'that', 'constructor', 'may', 'ocaml', 'because', 'covariant', 'this', 'are', 'other', 'from', 'contravariant', 'parameter', 'will', 'consider', 'when', 'rules', 'such', 'arrays', 'inheritance', 'and', 'generic', 'constructors', 'instead', 'invariant', 'programs', 'contravariance', 'runtime', 'can', 'system', 'allow', 'useful', 'would', 'safe', 'could', 'rule', 'which', 'specific', 'both', 'these', 'time', 'not', 'some', 'common', 'ilist', 'interface', 'declared', 'out', 'parameters', 'each', 'compiler', 'with', 'any', 'use', 'above', 'interfaces', 'than', 'one', 'return', 'first', 'class', 'argument', 'only', 'read', 'data', 'write', 'general', 'array', 'have', 'since', 'but', 'possible', 'into', 'also', 'immutable', 'java', 'generics', 'two', 'using', 'object', 'method', 'all', 'functions', 'however', 'covariantly', 'check', 'there', 'error', 'covariance', 'parameterized', 'way', 'languages', 'like', 'need', 'was', 'displaystyle', 'leq', 'must', 'overriding', 'has', 'while', 'scala', 'methods', 'where', 'been', 'objects', 'compareto', 'comparable', 'provide', 'multiple', 'dispatch', 'most', 'programmer', 'declaration', 'site', 'annotations', 'ienumerator', 'valid', 'contravariantly', 'classes', 'structure', 'they', 'wildcards', 'wildcard', 'extends', 'capture']], ['English folk music (1500–1899)', 'Ashley Y', 1177634764, 2073, ['and', 'english']], ['Personal computer', 'Darklock', 1220391790, 45663, ['personal', 'computer', 'capabilities', 'and', 'price', 'for', 'use', 'computers', 'are', 'directly', 'end', 'user', 'than', 'large', 'time', 'many', 'people', 'the', 'same', 'not', 'used', 'with', 'had', 'their', 'any', 'machines', 'while', 'users', 'may', 'applications', 'usually', 'these', 'systems', 'run', 'software', 'which', 'most', 'often', 'form', 'developed', 'from', 'hardware', 'operating', 'system', 'programming', 'still', 'this', 'mobile', 'only', 'available', 'through', 'since', 'early', 'microsoft', 'intel', 'market', 'first', 'windows', 'share', 'include', 'apple', 'such', 'linux', 'digital', 'have', 'all', 'ibm', 'its', 'but', 'term', 'some', 'were', 'they', 'one', 'computing', 'could', 'single', 'connected', 'research', 'would', 'been', 'expensive', 'was', 'made', 'integrated', 'later', 'based', 'small', 'called', 'that', 'word', 'video', 'mouse', 'required', 'business', 'generally', 'sold', 'kit', 'panel', 'displays', 'disk', 'drives', 'units', '1973', 'portable', 'scamp', 'apl', 'machine', 'processor', 'drive', 'keyboard', 'desktop', 'performance', 'other', 'about', 'another', 'shipped', 'also', 'introduced', 'display', 'storage', 'designed', 'standard', 'power', 'case', 'mass', '1977', 'however', 'year', 'over', '000', 'more', 'card', 'memory', 'high', 'cost', 'home', 'graphics', 'text', 'million', 'unit', 'sound', 'processors', 'laptop', 'internet', 'tasks', 'pcs', 'can', 'components', 'motherboard', 'external', 'monitor', 'screen', 'into', 'usb', 'gaming', 'input', 'devices', 'laptops', '2008', 'cards', 'netbooks', 'data', 'tablet', 'using', 'pocket', 'expansion', 'provide', 'application', 'how', 'according', 'billion', 'sales', 'shipments', 'quarter', 'decline', 'selling']], ['The Mandogs', 'DerHexer', 1205282029, 3968, ['the', 'mandogs', 'was', 'show', 'hosts', 'and', '2012', 'for', 'has', 'other', 'his', 'jay']], ['David Levi (musician)', 'DumZiBoT', 1212260237, 3949, ['the', 'naked', 'brothers', 'band']], ['Scores (computer virus)', 'LilHelpa', 1235850703, 2706, ['scores', 'virus', '1988', 'and', 'the', 'system']], ['Digital photography', 'Mintleaf', 1095727840, 18093, ['digital', 'photography', 'cameras', 'images', 'lens', 'photographic', 'film', 'the', 'are', 'and', 'stored', 'computer', 'file', 'for', 'processing', 'such', 'technology', 'photographs', 'were', 'which', 'was', 'image', 'typically', 'without', 'first', 'consumer', 'when', 'their', 'professional', 'using', 'than', 'social', 'media', 'since', 'have', 'also', 'from', 'camera', 'format', 'quality', 'but', 'many', 'advanced', 'while', 'has', 'only', 'its', 'later', 'produced', 'semiconductor', 'development', 'sensors', 'device', 'ccd', 'sensor', 'they', 'that', 'one', 'used', 'taken', 'with', 'not', 'this', 'color', 'picture', 'jpeg', 'most', 'kodak', 'had', 'resolution', 'megapixels', 'pixels', 'capture', 'single', 'nikon', 'available', 'pictures', 'photographers', 'more', 'use', 'number', 'photos', 'memory', 'space', 'raw', 'pixel', 'some', 'end', 'card', 'may', 'can', 'take', 'cards', 'same', 'all', 'similar', 'however', 'print', 'different', 'these', 'dynamic', 'range', 'high', 'other', 'photo', 'prints', 'gamut', 'ratio', 'aspect']], ['George Crum (musician)', 'SmackBot', 1252996687, 3848, ['george', 'crum', 'was', 'the', 'national', 'ballet', 'and', 'with', 'also', 'his', 'opera', 'conducted']], ['Solver (computer science)', 'SmackBot', 1253282654, 1861, ['solver', 'the', 'that', 'problem', 'problems', 'with', 'solvers', 'linear', 'equations', 'systems', 'for']], ['Georgia Bulldogs football under Robert Winston', 'Tlmclain', 1166046122, 1989, []], ['Wildlife photography', 'Zargulon', 1165248747, 1410, ['wildlife', 'photography', 'with', 'for', 'and', 'the', 'photos']], ['Traditional Thai musical instruments', 'Badagnani', 1191830919, 6775, ['traditional', 'thai', 'musical', 'instruments', 'are', 'the', 'used', 'and', 'music', 'thailand', 'string', 'percussion', 'played', 'plucked', 'also', 'region', 'with', 'three', 'two', 'made', 'from', 'isan', 'northern', 'set', 'saw', 'hardwood', 'northeast', 'bamboo', 'drum', 'hands', 'piphat', 'ensemble', 'large', 'klong', 'pair', 'frame', 'southern', 'nora', 'tuned', 'gong', 'khong', 'small', 'bossed', 'gongs', 'ranat', 'instrument', 'called', 'wooden', 'khlui', 'reed', 'glong']], ['Landseer (dog)', 'Birdgirl5', 1231438650, 2006, ['the', 'landseer', 'black', 'and', 'newfoundland', 'dogs', 'with']], ['Charles McPherson (musician)', 'Cosprings', 1255183865, 3007, ['charles', 'mcpherson', 'jazz', 'with', 'mingus', 'the', 'prestige', 'xanadu', '1980']], ['Comparison of programming languages (basic instructions)', 'IanOsgood', 1238781354, 61644, ['languages', 'are', 'this', 'the', 'statements', 'with', 'type', 'standard', 'constants', 'int', 'and', 'can', 'used', 'short', 'long', 'size', 'max', 'for', 'not', 'width', 'integer', 'types', 'required', 'bits', 'array', 'have', 'floating', 'point', 'strings', 'has', 'precision', 'value', 'function', 'run', 'time', 'number', 'variable', 'same', 'real', 'only', 'instead', 'there', 'may', 'std']], ['Les Cousins (music club)', 'Rodparkes', 1187072433, 4926, ['les', 'cousins', 'was', 'and', 'club', 'the', 'john']], ['Paul Carr (musician)', 'Snalwibma', 1254142018, 5716, ['carr', 'the', 'and']], ['2006 in music', 'Suduser85', 1171547747, 105280, ['music', 'that', 'place', 'the', 'year', '2006', 'british', 'country', 'jazz', 'january', 'releases', 'album', 'and', 'begins', 'with', 'new', 'band', 'composer', 'held', 'usa', 'her', 'tour', 'after', 'five', 'years', 'announces', 'their', 'was', 'february', 'day', 'out', 'festival', 'australia', 'studio', 'also', 'from', 'all', 'for', 'american', 'show', 'may', 'drummer', 'paul', 'records', 'opera', 'have', 'his', 'awards', 'are', 'madonna', 'third', 'time', 'rock', 'win', 'song', 'you', 'wins', 'record', 'john', 'artist', 'three', 'first', 'since', 'james', 'one', 'include', 'brown', 'debut', 'march', 'second', 'single', 'number', 'hot', 'weeks', 'hit', 'group', 'film', 'world', 'top', 'billboard', '100', 'release', 'lead', 'singer', 'april', 'original', 'released', 'its', 'week', 'love', 'don', 'taylor', 'television', 'june', 'selling', '000', 'shakira', 'nelly', 'furtado', 'july', 'orchestra', 'justin', 'timberlake', 'songwriter', 'featuring', 'video', 'august', 'mtv', 'september', 'beyoncé', 'solo', 'singles', 'bass', 'english', 'october', 'guitarist', 'december', 'which', 'november', 'musician', 'broadway', 'performances', 'pianist']], ['Spawning (computer gaming)', 'Vendettax', 1176750529, 3413, ['games', 'the', 'its', 'game', 'player', 'spawn', 'some', 'and', 'points', 'players', 'for', 'team', 'enemies']], ['Sean Delaney (musician)', 'Bestcellar', 1204328174, 5638, ['delaney', 'sean', 'was', 'and', 'for', 'his', 'work', 'with', 'the', 'rock', 'band', 'kiss', 'from', 'early', 'their', 'wrote', 'songs', 'album', 'all', 'also', 'song', 'that', 'solo', 'produced', 'gene', 'simmons', 'peter', 'criss', '1978', 'member', 'after', 'had', 'records', 'bill', 'aucoin', 'were', 'neil', 'casablanca', 'who', 'they', 'have', 'this', 'death', 'while', 'piper', 'released', 'which', 'other', 'skatt', 'bros']], ['Tony Kaye (musician)', 'Bondegezou', 1141489894, 8419, ['kaye', 'and', 'member', 'the', 'rock', 'band', 'yes', 'was', 'music', 'joined', 'his', 'from', '1971', 'played', 'their', 'first', 'then', 'badger', 'after', 'which', 'with', 'david', 'detective', 'badfinger', 'album', 'for', 'left', '1994', 'circa', '2009', 'two', 'also', 'early', 'piano', 'who', 'time', 'had', 'playing', 'but', 'during', 'big', 'led', 'group', 'tour', 'that', 'more', 'this', 'singer', 'new', 'squire', 'some', 'hammond', '1969', 'keyboards', 'all', 'offer', 'one', 'live', 'white', 'various', 'rabin', '90125', 'keyboard', 'tribute', '2007', 'artists']], ['Danja (musician)', 'Crusoe8181', 1257155543, 6925, ['danja', 'and', 'for', 'timbaland', 'produced', 'the', 'his', 'with', 'album', 'also']], ['Ruby (programming language)', 'Hervegirod', 1193928035, 30284, ['ruby', 'programming', 'language', 'was', 'and', 'the', 'matsumoto', 'uses', 'including', 'object', 'oriented', 'perl', 'has', 'that', 'list', 'some', 'with', 'not', 'but', 'like', 'python', 'then', 'features', 'for', 'use', 'one', 'design', 'being', 'its', 'name', 'code', 'been', 'written', 'two', 'were', 'later', 'first', 'release', 'japanese', 'more', 'released', 'which', 'new', 'this', 'many', 'classes', 'exception', 'handling', 'following', 'time', 'than', 'there', 'only', 'standard', 'rails', 'christmas', 'day', 'from', 'changes', 'over', 'block', 'variables', 'are', 'they', 'syntax', 'hash', 'using', 'value', 'string', 'support', 'since', 'will', 'users', 'version', 'added', 'method', 'class', 'array', 'similar', 'also', 'include', 'performance', 'few', 'all', 'can', 'other', 'instance', 'variable', 'come', 'methods', 'programmer', 'machine', 'run', 'principle', 'least', 'such', 'surprise', 'may', 'languages', 'defined', 'example', 'metaprogramming', 'function', 'called', 'interpreter', 'used', 'line', 'java', 'implementation', 'exceptions', 'implementations', 'jruby']], ['Texture (music)', 'J Lorraine', 1161070178, 3626, ['music', 'texture', 'the', 'and', 'are', 'parts', 'musical', 'with']], ['List of computer role-playing games', 'Lllockwood', 1179441080, 43088, []], ['Register (music)', 'Hyacinth', 1082665179, 598, ['register', 'the', 'and', 'vocal']], ['Mode (computer interface)', 'Donreed', 1182732608, 2991, ['user', 'interface', 'design', 'mode', 'computer', 'any', 'which', 'the', 'will', 'different', 'from', 'that', 'other', 'modal', 'lock', 'and', 'keys', 'keyboard', 'into', 'after', 'modes', 'modeless', 'errors', 'action', 'one', 'while', 'for', 'his', 'raskin', 'with', 'when', 'current', 'state', 'not', 'system', 'this', 'change', 'was', 'some', 'where', 'interaction', 'may', 'has', 'have', 'text', 'are', 'can', 'key', 'also', 'command', 'emacs', 'application', 'use', 'window', 'they', 'error', 'such', 'does', 'way', 'used']], ['2007 in music', 'Squilly', 1169248845, 45652, ['music', 'that', 'place', 'the', 'year', '2007', 'british', 'canadian', 'country', 'albums', 'released', 'january', 'for', 'new', 'john', 'and', 'are', 'february', 'festival', 'will', 'tour', 'after', 'years', 'release', 'band', 'annual', 'awards', 'may', 'his', 'single', 'from', 'her', 'album', 'best', 'with', 'producer', 'record', 'song', 'their', 'rock', 'first', 'musical', 'back', 'was', 'american', 'march', 'musician', 'indefinite', 'hiatus', 'announces', 'concert', 'april', 'genesis', 'studio', 'billboard', 'held', 'selling', 'drummer', 'guitarist', 'august', 'since', 'singer', 'linkin', 'park', '000', 'bands', 'june', 'july', 'duran', 'september', 'bassist', 'october', 'conductor', 'electronic', 'november', 'vocalist', 'pianist', 'december', 'soprano', 'tenor', 'jazz', 'composer', 'songwriter']], ['List of video games with time travel', 'Rockfang', 1234110556, 2344, []], ['2008 in music', 'Ba11innnn', 1217641857, 107605, ['and', '2008', 'music', 'year', 'was', 'the', 'record', 'sales', 'united', 'with', 'since', 'british', 'canadian', 'new', 'rock', 'country', 'jazz', 'january', 'her', 'concert', 'pianist', 'concerto', 'violin', 'festival', 'february', 'day', 'australia', 'their', 'first', 'australian', 'years', 'that', 'for', 'wins', 'album', 'best', 'selling', 'producer', 'annual', 'takes', 'place', 'song', 'artist', 'guitarist', 'band', 'his', 'international', 'held', 'march', 'tour', 'musician', 'from', 'after', 'april', 'single', 'number', 'top', 'billboard', 'hot', '100', 'female', 'solo', 'you', 'studio', 'week', 'london', 'may', 'american', 'show', 'june', 'park', 'which', 'released', 'release', 'july', 'september', 'august', 'singer', 'saxophonist', 'dave', 'one', 'vocalist', 'due', 'debut', 'orchestra', 'october', 'november', 'composer', 'last', 'conductor', 'december', 'musical', 'weeks', 'heart', 'attack', 'cancer', 'trumpeter', 'songwriter', 'drummer', 'folk', 'jamaican', 'blues']], ['Semaphore (programming)', 'Edcolins', 1144850850, 7616, ['semaphore', 'variable', 'used', 'resource', 'processes', 'system', 'this', 'critical', 'section', 'and', 'process', 'the', 'that', 'for', 'are', 'available', 'with', 'operations', 'free', 'wait', 'semaphores', 'their', 'use', 'from', 'which', 'called', 'dijkstra', 'when', 'has', 'rooms', 'one', 'student', 'time', 'students', 'room', 'they', 'using', 'only', 'number', 'them', 'can', 'not', 'value', 'empty', 'there', 'waiting', 'resources', 'may', 'release', 'than', 'problem', 'operation', 'its', 'signal', 'queue', 'producer', 'consumer', 'emptycount', 'fullcount', 'usequeue', 'producers', 'mutex', 'task']], ["Wake Forest Demon Deacons men's soccer", 'Rebajc3', 1260577388, 26745, ['the', 'wake', 'forest', 'deacons', 'team', 'ncaa', 'their', '2007', 'all', 'acc', 'first', 'season', 'coach', 'and', '2008', '2009', '2015', '2017', '2016', 'players', 'plays', 'for', 'mls', 'usl', 'united', '2013']]]
-
-TITLE_TO_INFO = {'List of Canadian musicians': {'author': 'Bearcat', 'timestamp': 1181623340, 'length': 21023}, 'French pop music': {'author': 'Brandon', 'timestamp': 1172208041, 'length': 5569}, 'Edogawa, Tokyo': {'author': 'Ciphers', 'timestamp': 1222607041, 'length': 4526}, 'Noise (music)': {'author': 'Epbr123', 'timestamp': 1194207604, 'length': 15641}, '1922 in music': {'author': 'Jafeluv', 'timestamp': 1242717698, 'length': 11576}, 'Ken Kennedy (computer scientist)': {'author': 'Jlalbee', 'timestamp': 1246308670, 'length': 4144}, '1986 in music': {'author': 'Michael', 'timestamp': 1048918054, 'length': 6632}, 'Spain national beach soccer team': {'author': 'Pegship', 'timestamp': 1233458894, 'length': 1526}, 'Kevin Cadogan': {'author': 'Renesis', 'timestamp': 1144136316, 'length': 3917}, 'Endogenous cannabinoid': {'author': 'RussBot', 'timestamp': 1168971903, 'length': 26}, '2009 in music': {'author': 'SE KinG', 'timestamp': 1235133583, 'length': 69451}, 'Rock music': {'author': 'Sabrebd', 'timestamp': 1258069053, 'length': 119498}, 'Medical value travel': {'author': 'Argon233', 'timestamp': 1153157342, 'length': 4149}, 'Lights (musician)': {'author': 'Espo3699', 'timestamp': 1213914297, 'length': 5898}, 'List of soul musicians': {'author': 'Ghmyrtle', 'timestamp': 1175455921, 'length': 4878}, 'Human computer': {'author': 'Giftlite', 'timestamp': 1248275178, 'length': 4750}, 'Aube (musician)': {'author': 'Nihonjoe', 'timestamp': 1145410600, 'length': 3152}, 'List of overtone musicians': {'author': 'Sborsody', 'timestamp': 1176928050, 'length': 2299}, 'Black dog (ghost)': {'author': 'SmackBot', 'timestamp': 1220471117, 'length': 14746}, 'USC Trojans volleyball': {'author': 'Smuckers', 'timestamp': 1218049435, 'length': 5525}, 'Tim Arnold (musician)': {'author': 'Sohohobo', 'timestamp': 1181480380, 'length': 4551}, '2007 Bulldogs RLFC season': {'author': 'Timmah86', 'timestamp': 1177410119, 'length': 11116}, 'Peter Brown (music industry)': {'author': 'Zephyrad', 'timestamp': 1240235639, 'length': 2837}, 'Mexican dog-faced bat': {'author': 'AnomieBOT', 'timestamp': 1255316429, 'length': 1138}, 'Embryo drawing': {'author': 'AxelBoldt', 'timestamp': 1034459202, 'length': 1712}, 'Old-time music': {'author': 'Badagnani', 'timestamp': 1124771619, 'length': 12755}, 'Arabic music': {'author': 'Badagnani', 'timestamp': 1209417864, 'length': 25114}, 'C Sharp (programming language)': {'author': 'Eaglizard', 'timestamp': 1232492672, 'length': 52364}, 'List of Saturday Night Live musical sketches': {'author': 'Gary King', 'timestamp': 1134966249, 'length': 13287}, 'Joe Becker (musician)': {'author': 'Gary King', 'timestamp': 1203234507, 'length': 5842}, 'Will Johnson (soccer)': {'author': 'Mayumashu', 'timestamp': 1218489712, 'length': 3562}, 'Aco (musician)': {'author': 'Noodleboy', 'timestamp': 1132546632, 'length': 3129}, 'Geoff Smith (British musician)': {'author': 'Richardrj', 'timestamp': 1194687509, 'length': 2043}, 'Fiskerton, Lincolnshire': {'author': 'Snigbrook', 'timestamp': 1259869948, 'length': 5853}, 'Reflection-oriented programming': {'author': 'Soumyasch', 'timestamp': 1143366937, 'length': 38}, 'B (programming language)': {'author': 'Uvaphdman', 'timestamp': 1196622610, 'length': 5482}, 'Richard Wright (musician)': {'author': 'Bdubiscool', 'timestamp': 1189536295, 'length': 16185}, 'Voice classification in non-classical music': {'author': 'Iridescent', 'timestamp': 1198092852, 'length': 11280}, 'Dalmatian (dog)': {'author': 'J. Spencer', 'timestamp': 1207793294, 'length': 26582}, '1936 in music': {'author': 'JohnRogers', 'timestamp': 1243745950, 'length': 23417}, 'Guide dog': {'author': 'Sarranduin', 'timestamp': 1165601603, 'length': 7339}, '1962 in country music': {'author': 'Briguy52748', 'timestamp': 1249862464, 'length': 7954}, 'List of dystopian music, TV programs, and games': {'author': 'Notinasnaid', 'timestamp': 1165317338, 'length': 13458}, 'Steven Cohen (soccer)': {'author': 'Scouselad10', 'timestamp': 1237669593, 'length': 2117}, 'Steve Perry (musician)': {'author': 'Woohookitty', 'timestamp': 1254812045, 'length': 22204}, '2009 Louisiana Tech Bulldogs football team': {'author': 'AllisonFoley', 'timestamp': 1245796406, 'length': 22410}, 'David Gray (musician)': {'author': 'RattleandHum', 'timestamp': 1159841492, 'length': 7203}, 'Craig Martin (soccer)': {'author': 'Darius Dhlomo', 'timestamp': 1174203493, 'length': 709}, 'Georgia Bulldogs football': {'author': 'Davidscharoun', 'timestamp': 1166567889, 'length': 43718}, 'Time travel': {'author': 'Thug outlaw69', 'timestamp': 1140826049, 'length': 35170}, 'Fisk University': {'author': 'NerdyScienceDude', 'timestamp': 1263393671, 'length': 16246}, 'Annie (musical)': {'author': 'Piano non troppo', 'timestamp': 1223619626, 'length': 27558}, 'Alex Turner (musician)': {'author': 'CambridgeBayWeather', 'timestamp': 1187010135, 'length': 9718}, 'Python (programming language)': {'author': 'Lulu of the Lotus-Eaters', 'timestamp': 1137530195, 'length': 41571}, 'List of gospel musicians': {'author': 'Absolon', 'timestamp': 1197658845, 'length': 3805}, 'Tom Hooper (musician)': {'author': 'Bearcat', 'timestamp': 1204967541, 'length': 1441}, 'Endoglin': {'author': 'DOI bot', 'timestamp': 1212259031, 'length': 6778}, 'Indian classical music': {'author': 'Davydog', 'timestamp': 1222543238, 'length': 9503}, 'Sun dog': {'author': 'Hellbus', 'timestamp': 1208969289, 'length': 18050}, '1996 in music': {'author': 'Kharker', 'timestamp': 1148585201, 'length': 21688}, 'Lua (programming language)': {'author': 'Makkuro', 'timestamp': 1113957128, 'length': 0}, 'Single-board computer': {'author': 'Nathael', 'timestamp': 1220260601, 'length': 8271}, 'Mets de Guaynabo (volleyball)': {'author': 'Osplace', 'timestamp': 1239156764, 'length': 2091}, "United States men's national soccer team 2009 results": {'author': 'Rebajc3', 'timestamp': 1252384026, 'length': 79089}, 'Joseph Williams (musician)': {'author': 'RussBot', 'timestamp': 1140752684, 'length': 4253}, 'The Hunchback of Notre Dame (musical)': {'author': 'RussBot', 'timestamp': 1192176615, 'length': 42}, 'China national soccer team': {'author': 'Seedbot', 'timestamp': 1199103839, 'length': 45}, 'Covariance and contravariance (computer science)': {'author': 'Wakapop', 'timestamp': 1167547364, 'length': 7453}, 'English folk music (1500–1899)': {'author': 'Ashley Y', 'timestamp': 1177634764, 'length': 2073}, 'Personal computer': {'author': 'Darklock', 'timestamp': 1220391790, 'length': 45663}, 'The Mandogs': {'author': 'DerHexer', 'timestamp': 1205282029, 'length': 3968}, 'David Levi (musician)': {'author': 'DumZiBoT', 'timestamp': 1212260237, 'length': 3949}, 'Scores (computer virus)': {'author': 'LilHelpa', 'timestamp': 1235850703, 'length': 2706}, 'Digital photography': {'author': 'Mintleaf', 'timestamp': 1095727840, 'length': 18093}, 'George Crum (musician)': {'author': 'SmackBot', 'timestamp': 1252996687, 'length': 3848}, 'Solver (computer science)': {'author': 'SmackBot', 'timestamp': 1253282654, 'length': 1861}, 'Georgia Bulldogs football under Robert Winston': {'author': 'Tlmclain', 'timestamp': 1166046122, 'length': 1989}, 'Wildlife photography': {'author': 'Zargulon', 'timestamp': 1165248747, 'length': 1410}, 'Traditional Thai musical instruments': {'author': 'Badagnani', 'timestamp': 1191830919, 'length': 6775}, 'Landseer (dog)': {'author': 'Birdgirl5', 'timestamp': 1231438650, 'length': 2006}, 'Charles McPherson (musician)': {'author': 'Cosprings', 'timestamp': 1255183865, 'length': 3007}, 'Comparison of programming languages (basic instructions)': {'author': 'IanOsgood', 'timestamp': 1238781354, 'length': 61644}, 'Les Cousins (music club)': {'author': 'Rodparkes', 'timestamp': 1187072433, 'length': 4926}, 'Paul Carr (musician)': {'author': 'Snalwibma', 'timestamp': 1254142018, 'length': 5716}, '2006 in music': {'author': 'Suduser85', 'timestamp': 1171547747, 'length': 105280}, 'Spawning (computer gaming)': {'author': 'Vendettax', 'timestamp': 1176750529, 'length': 3413}, 'Sean Delaney (musician)': {'author': 'Bestcellar', 'timestamp': 1204328174, 'length': 5638}, 'Tony Kaye (musician)': {'author': 'Bondegezou', 'timestamp': 1141489894, 'length': 8419}, 'Danja (musician)': {'author': 'Crusoe8181', 'timestamp': 1257155543, 'length': 6925}, 'Ruby (programming language)': {'author': 'Hervegirod', 'timestamp': 1193928035, 'length': 30284}, 'Texture (music)': {'author': 'J Lorraine', 'timestamp': 1161070178, 'length': 3626}, 'List of computer role-playing games': {'author': 'Lllockwood', 'timestamp': 1179441080, 'length': 43088}, 'Register (music)': {'author': 'Hyacinth', 'timestamp': 1082665179, 'length': 598}, 'Mode (computer interface)': {'author': 'Donreed', 'timestamp': 1182732608, 'length': 2991}, '2007 in music': {'author': 'Squilly', 'timestamp': 1169248845, 'length': 45652}, 'List of video games with time travel': {'author': 'Rockfang', 'timestamp': 1234110556, 'length': 2344}, '2008 in music': {'author': 'Ba11innnn', 'timestamp': 1217641857, 'length': 107605}, 'Semaphore (programming)': {'author': 'Edcolins', 'timestamp': 1144850850, 'length': 7616}, "Wake Forest Demon Deacons men's soccer": {'author': 'Rebajc3', 'timestamp': 1260577388, 'length': 26745}}
-
-KEYWORD_TO_TITLES = {'canadian': ['List of Canadian musicians', '2009 in music', 'Lights (musician)', 'Will Johnson (soccer)', '2007 in music', '2008 in music'], 'canada': ['List of Canadian musicians', 'Lights (musician)', 'Old-time music', 'Will Johnson (soccer)'], 'lee': ['List of Canadian musicians'], 'jazz': ['List of Canadian musicians', '1986 in music', '2009 in music', 'Rock music', 'Arabic music', 'Charles McPherson (musician)', '2006 in music', '2007 in music', '2008 in music'], 'and': ['List of Canadian musicians', 'French pop music', 'Edogawa, Tokyo', 'Noise (music)', '1922 in music', 'Ken Kennedy (computer scientist)', '1986 in music', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Aube (musician)', 'List of overtone musicians', 'Black dog (ghost)', 'USC Trojans volleyball', 'Tim Arnold (musician)', '2007 Bulldogs RLFC season', 'Peter Brown (music industry)', 'Mexican dog-faced bat', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Joe Becker (musician)', 'Will Johnson (soccer)', 'Fiskerton, Lincolnshire', 'B (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', '1936 in music', 'Guide dog', '1962 in country music', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Tom Hooper (musician)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Single-board computer', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'English folk music (1500–1899)', 'Personal computer', 'The Mandogs', 'Scores (computer virus)', 'Digital photography', 'George Crum (musician)', 'Wildlife photography', 'Traditional Thai musical instruments', 'Landseer (dog)', 'Comparison of programming languages (basic instructions)', 'Les Cousins (music club)', 'Paul Carr (musician)', '2006 in music', 'Spawning (computer gaming)', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Ruby (programming language)', 'Texture (music)', 'Register (music)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)', "Wake Forest Demon Deacons men's soccer"], 'rock': ['List of Canadian musicians', 'Noise (music)', '2009 in music', 'Rock music', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Alex Turner (musician)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', '2007 in music', '2008 in music'], 'singer': ['List of Canadian musicians', '1922 in music', '1986 in music', '2009 in music', 'Rock music', 'List of overtone musicians', 'Arabic music', 'Voice classification in non-classical music', '1936 in music', '1962 in country music', 'Steve Perry (musician)', '1996 in music', '2006 in music', 'Tony Kaye (musician)', '2007 in music', '2008 in music'], 'songwriter': ['List of Canadian musicians', '1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'also': ['List of Canadian musicians', 'Noise (music)', '2009 in music', 'Rock music', 'Human computer', 'Black dog (ghost)', 'Tim Arnold (musician)', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'George Crum (musician)', 'Traditional Thai musical instruments', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Ruby (programming language)', 'Mode (computer interface)'], 'known': ['List of Canadian musicians', 'Rock music', 'Black dog (ghost)', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Time travel'], 'hip': ['List of Canadian musicians', 'Rock music'], 'hop': ['List of Canadian musicians', 'Rock music'], 'musician': ['List of Canadian musicians', '1986 in music', '2009 in music', 'List of overtone musicians', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'folk': ['List of Canadian musicians', 'Rock music', 'Old-time music', 'Indian classical music', '2008 in music'], 'pop': ['List of Canadian musicians', 'French pop music', '2009 in music', 'Rock music', 'Arabic music'], 'composer': ['List of Canadian musicians', '1922 in music', '1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'drummer': ['List of Canadian musicians', '2009 in music', '2006 in music', '2007 in music', '2008 in music'], 'player': ['List of Canadian musicians', 'Edogawa, Tokyo', 'Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'Spawning (computer gaming)'], 'rapper': ['List of Canadian musicians', '2009 in music', '1996 in music'], 'john': ['List of Canadian musicians', 'Noise (music)', '2009 in music', 'Rock music', '1996 in music', 'Les Cousins (music club)', '2006 in music', '2007 in music'], 'don': ['List of Canadian musicians', '2006 in music'], 'guitarist': ['List of Canadian musicians', '1986 in music', '2009 in music', 'Rock music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'the': ['List of Canadian musicians', 'French pop music', 'Edogawa, Tokyo', 'Noise (music)', '1922 in music', 'Ken Kennedy (computer scientist)', '1986 in music', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'List of soul musicians', 'Human computer', 'Aube (musician)', 'List of overtone musicians', 'Black dog (ghost)', 'USC Trojans volleyball', 'Tim Arnold (musician)', '2007 Bulldogs RLFC season', 'Peter Brown (music industry)', 'Mexican dog-faced bat', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'List of Saturday Night Live musical sketches', 'Joe Becker (musician)', 'Will Johnson (soccer)', 'Aco (musician)', 'Geoff Smith (British musician)', 'Fiskerton, Lincolnshire', 'B (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', '1936 in music', 'Guide dog', '1962 in country music', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', '2009 Louisiana Tech Bulldogs football team', 'David Gray (musician)', 'Craig Martin (soccer)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'List of gospel musicians', 'Tom Hooper (musician)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Single-board computer', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'The Mandogs', 'David Levi (musician)', 'Scores (computer virus)', 'Digital photography', 'George Crum (musician)', 'Solver (computer science)', 'Wildlife photography', 'Traditional Thai musical instruments', 'Landseer (dog)', 'Charles McPherson (musician)', 'Comparison of programming languages (basic instructions)', 'Les Cousins (music club)', 'Paul Carr (musician)', '2006 in music', 'Spawning (computer gaming)', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Ruby (programming language)', 'Texture (music)', 'Register (music)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)', "Wake Forest Demon Deacons men's soccer"], 'andrew': ['List of Canadian musicians'], 'country': ['List of Canadian musicians', 'Rock music', 'Old-time music', '1936 in music', '1962 in country music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'indie': ['List of Canadian musicians', 'Rock music'], 'charlie': ['List of Canadian musicians'], 'alternative': ['List of Canadian musicians', 'Rock music'], 'paul': ['List of Canadian musicians', 'Noise (music)', '1922 in music', '2009 in music', '2006 in music'], 'matt': ['List of Canadian musicians', '2009 Louisiana Tech Bulldogs football team'], 'james': ['List of Canadian musicians', 'Alex Turner (musician)', '2006 in music'], 'blues': ['List of Canadian musicians', 'Rock music', '2008 in music'], 'bassist': ['List of Canadian musicians', '2007 in music'], 'cellist': ['List of Canadian musicians'], 'pianist': ['List of Canadian musicians', '1936 in music', '2006 in music', '2007 in music', '2008 in music'], 'artist': ['List of Canadian musicians', 'Noise (music)', '1986 in music', '2009 in music', '2006 in music', '2008 in music'], 'marie': ['List of Canadian musicians'], 'dance': ['List of Canadian musicians', '2009 in music', 'Old-time music', '1936 in music', 'Indian classical music'], 'winner': ['List of Canadian musicians'], 'idol': ['List of Canadian musicians'], 'mike': ['List of Canadian musicians'], 'keyboardist': ['List of Canadian musicians'], 'jason': ['List of Canadian musicians'], 'music': ['List of Canadian musicians', 'French pop music', 'Noise (music)', '1922 in music', '1986 in music', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Tim Arnold (musician)', 'Old-time music', 'Arabic music', 'Joe Becker (musician)', 'Richard Wright (musician)', 'Voice classification in non-classical music', '1936 in music', '1962 in country music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Alex Turner (musician)', 'List of gospel musicians', 'Indian classical music', '1996 in music', 'Traditional Thai musical instruments', '2006 in music', 'Tony Kaye (musician)', 'Texture (music)', '2007 in music', '2008 in music'], 'tim': ['List of Canadian musicians'], 'kim': ['List of Canadian musicians'], 'soprano': ['List of Canadian musicians', 'Voice classification in non-classical music', '2007 in music'], 'kevin': ['List of Canadian musicians', '2009 Louisiana Tech Bulldogs football team'], 'martin': ['List of Canadian musicians'], 'violinist': ['List of Canadian musicians'], 'dan': ['List of Canadian musicians'], 'blue': ['List of Canadian musicians', 'Dalmatian (dog)'], 'new': ['List of Canadian musicians', '2009 in music', 'Rock music', 'Lights (musician)', 'Old-time music', 'List of dystopian music, TV programs, and games', 'David Gray (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', '1996 in music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', '2006 in music', 'Tony Kaye (musician)', 'Ruby (programming language)', '2007 in music', '2008 in music'], 'daniel': ['List of Canadian musicians', '2009 Louisiana Tech Bulldogs football team'], 'producer': ['List of Canadian musicians', '1986 in music', '1996 in music', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'punk': ['List of Canadian musicians', 'Rock music'], 'conductor': ['List of Canadian musicians', '1936 in music', '2007 in music', '2008 in music'], 'gospel': ['List of Canadian musicians', 'List of gospel musicians'], 'dave': ['List of Canadian musicians', '2008 in music'], 'big': ['List of Canadian musicians', 'Tony Kaye (musician)'], 'band': ['List of Canadian musicians', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Old-time music', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Alex Turner (musician)', '1996 in music', 'David Levi (musician)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', '2007 in music', '2008 in music'], 'george': ['List of Canadian musicians', '1922 in music', 'George Crum (musician)'], 'brian': ['List of Canadian musicians'], 'bill': ['List of Canadian musicians', 'Sean Delaney (musician)'], 'classical': ['List of Canadian musicians', 'Voice classification in non-classical music', 'Time travel', 'Indian classical music'], 'david': ['List of Canadian musicians', 'David Gray (musician)', 'Alex Turner (musician)', '1996 in music', 'Tony Kaye (musician)'], 'operatic': ['List of Canadian musicians'], 'michael': ['List of Canadian musicians', '2009 in music', '1996 in music'], 'film': ['List of Canadian musicians', 'Joe Becker (musician)', 'Geoff Smith (British musician)', '1936 in music', 'Annie (musical)', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Digital photography', '2006 in music'], 'jon': ['List of Canadian musicians'], 'soul': ['List of Canadian musicians', 'Rock music'], 'billy': ['List of Canadian musicians', '1922 in music', '1936 in music'], 'record': ['List of Canadian musicians', '1986 in music', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Steve Perry (musician)', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'jim': ['List of Canadian musicians'], 'member': ['List of Canadian musicians', 'Peter Brown (music industry)', 'Richard Wright (musician)', 'Sean Delaney (musician)', 'Tony Kaye (musician)'], 'broken': ['List of Canadian musicians', 'Richard Wright (musician)'], 'social': ['List of Canadian musicians', 'Rock music', 'Digital photography'], 'scene': ['List of Canadian musicians', 'Rock music'], 'musical': ['List of Canadian musicians', 'Noise (music)', '1986 in music', '2009 in music', 'Rock music', 'Arabic music', 'Richard Wright (musician)', '1936 in music', 'Annie (musical)', 'Indian classical music', '1996 in music', 'The Hunchback of Notre Dame (musical)', 'Traditional Thai musical instruments', 'Texture (music)', '2007 in music', '2008 in music'], 'theatre': ['List of Canadian musicians', '1922 in music', '1936 in music', 'Annie (musical)'], 'actress': ['List of Canadian musicians', '1922 in music', '1986 in music', 'Annie (musical)', '1996 in music'], 'actor': ['List of Canadian musicians', '1986 in music', '1996 in music'], 'peter': ['List of Canadian musicians', 'Sean Delaney (musician)'], 'ian': ['List of Canadian musicians'], 'electronic': ['List of Canadian musicians', 'Noise (music)', 'Rock music', '2007 in music'], 'rhythm': ['List of Canadian musicians', 'Rock music', '1936 in music'], 'taylor': ['List of Canadian musicians', '2009 in music', '2006 in music'], 'vocalist': ['List of Canadian musicians', '2007 in music', '2008 in music'], 'jesse': ['List of Canadian musicians'], 'radio': ['List of Canadian musicians', 'French pop music', '1922 in music', 'Rock music', 'Steve Perry (musician)'], 'personality': ['List of Canadian musicians'], 'for': ['List of Canadian musicians', 'Noise (music)', '1922 in music', 'Ken Kennedy (computer scientist)', '1986 in music', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Black dog (ghost)', 'Tim Arnold (musician)', '2007 Bulldogs RLFC season', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Will Johnson (soccer)', 'B (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', '1936 in music', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Single-board computer', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'The Mandogs', 'Digital photography', 'Solver (computer science)', 'Wildlife photography', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Spawning (computer gaming)', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)', "Wake Forest Demon Deacons men's soccer"], 'andy': ['List of Canadian musicians'], 'former': ['List of Canadian musicians', 'Steve Perry (musician)'], 'solo': ['List of Canadian musicians', 'Tim Arnold (musician)', 'Richard Wright (musician)', 'Steve Perry (musician)', 'Joseph Williams (musician)', '2006 in music', 'Sean Delaney (musician)', '2008 in music'], 'chris': ['List of Canadian musicians', 'List of Saturday Night Live musical sketches', '2009 Louisiana Tech Bulldogs football team'], 'ryan': ['List of Canadian musicians'], 'mark': ['List of Canadian musicians'], 'scott': ['List of Canadian musicians'], 'kate': ['List of Canadian musicians'], 'multi': ['List of Canadian musicians'], 'formerly': ['List of Canadian musicians'], 'mother': ['List of Canadian musicians', 'Richard Wright (musician)', 'Steve Perry (musician)'], 'instrumentalist': ['List of Canadian musicians'], 'johnson': ['List of Canadian musicians', 'Will Johnson (soccer)'], 'white': ['List of Canadian musicians', 'Noise (music)', 'Rock music', 'David Gray (musician)', 'Georgia Bulldogs football', 'Tony Kaye (musician)'], 'smith': ['List of Canadian musicians', 'Geoff Smith (British musician)'], 'french': ['French pop music'], 'france': ['French pop music'], 'edogawa': ['Edogawa, Tokyo'], 'with': ['Edogawa, Tokyo', 'Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Aube (musician)', 'List of overtone musicians', 'Black dog (ghost)', 'Tim Arnold (musician)', '2007 Bulldogs RLFC season', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Will Johnson (soccer)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', '1936 in music', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Single-board computer', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'George Crum (musician)', 'Solver (computer science)', 'Wildlife photography', 'Traditional Thai musical instruments', 'Landseer (dog)', 'Charles McPherson (musician)', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Ruby (programming language)', 'Texture (music)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'koiwa': ['Edogawa, Tokyo'], 'kasai': ['Edogawa, Tokyo'], 'high': ['Edogawa, Tokyo', 'Rock music', 'Personal computer', 'Digital photography'], 'school': ['Edogawa, Tokyo', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)'], 'noise': ['Noise (music)'], 'that': ['Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Fiskerton, Lincolnshire', 'B (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Solver (computer science)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'use': ['Noise (music)', 'Rock music', 'Arabic music', 'C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'this': ['Noise (music)', '2009 in music', 'Rock music', 'Human computer', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'B (programming language)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'made': ['Noise (music)', 'Annie (musical)', 'Personal computer', 'Traditional Thai musical instruments'], 'sound': ['Noise (music)', 'Rock music', 'Personal computer'], 'based': ['Noise (music)', 'Rock music', 'List of dystopian music, TV programs, and games', 'Indian classical music', 'Lua (programming language)', 'Personal computer'], 'some': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Time travel', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Spawning (computer gaming)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)'], 'can': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Arabic music', 'C Sharp (programming language)', 'Dalmatian (dog)', 'Time travel', 'Python (programming language)', 'Endoglin', 'Sun dog', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'instruments': ['Noise (music)', 'Rock music', 'Old-time music', 'Arabic music', 'Indian classical music', 'Traditional Thai musical instruments'], 'may': ['Noise (music)', '1922 in music', '1986 in music', '2009 in music', 'Black dog (ghost)', 'Dalmatian (dog)', '1936 in music', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Indian classical music', '1996 in music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'machine': ['Noise (music)', 'Time travel', 'Personal computer', 'Ruby (programming language)'], 'sounds': ['Noise (music)', 'Rock music'], 'audio': ['Noise (music)'], 'recordings': ['Noise (music)', 'Rock music', 'Old-time music'], 'recording': ['Noise (music)', 'Kevin Cadogan', 'Rock music', 'Annie (musical)'], 'other': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'The Mandogs', 'Digital photography', 'Sean Delaney (musician)', 'Ruby (programming language)', 'Mode (computer interface)'], 'produced': ['Noise (music)', 'Rock music', 'Annie (musical)', 'Digital photography', 'Sean Delaney (musician)', 'Danja (musician)'], 'such': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'Single-board computer', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Ruby (programming language)', 'Mode (computer interface)'], 'more': ['Noise (music)', 'Rock music', 'Embryo drawing', 'Old-time music', 'Richard Wright (musician)', 'Guide dog', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Sun dog', 'Single-board computer', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Tony Kaye (musician)', 'Ruby (programming language)'], 'art': ['Noise (music)', 'Rock music', 'Fisk University'], 'was': ['Noise (music)', 'Ken Kennedy (computer scientist)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Aube (musician)', 'Black dog (ghost)', 'Tim Arnold (musician)', '2007 Bulldogs RLFC season', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Will Johnson (soccer)', 'Geoff Smith (British musician)', 'Fiskerton, Lincolnshire', 'B (programming language)', 'Richard Wright (musician)', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Sun dog', 'Lua (programming language)', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'The Mandogs', 'Digital photography', 'George Crum (musician)', 'Les Cousins (music club)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music', '2008 in music'], 'aesthetic': ['Noise (music)'], 'example': ['Noise (music)', 'C Sharp (programming language)', 'Time travel', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'being': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Sun dog', 'Ruby (programming language)'], 'fluxus': ['Noise (music)'], 'artists': ['Noise (music)', 'Rock music', 'Arabic music', 'Tony Kaye (musician)'], 'composition': ['Noise (music)'], 'early': ['Noise (music)', 'Rock music', 'Lights (musician)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'Richard Wright (musician)', 'Time travel', 'Alex Turner (musician)', 'Personal computer', 'Sean Delaney (musician)', 'Tony Kaye (musician)'], 'young': ['Noise (music)'], 'wave': ['Noise (music)', 'Rock music'], 'industrial': ['Noise (music)'], 'works': ['Noise (music)'], 'his': ['Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Human computer', 'Aube (musician)', 'Black dog (ghost)', 'Tim Arnold (musician)', 'Embryo drawing', 'Arabic music', 'Will Johnson (soccer)', 'Richard Wright (musician)', '1936 in music', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Steve Perry (musician)', 'David Gray (musician)', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', 'Sun dog', '1996 in music', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'The Mandogs', 'George Crum (musician)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', 'Mode (computer interface)', '2007 in music', '2008 in music'], 'from': ['Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'List of overtone musicians', 'Black dog (ghost)', '2007 Bulldogs RLFC season', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'B (programming language)', 'Richard Wright (musician)', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', '2009 Louisiana Tech Bulldogs football team', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Traditional Thai musical instruments', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'one': ['Noise (music)', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Black dog (ghost)', '2007 Bulldogs RLFC season', 'Embryo drawing', 'Old-time music', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Sun dog', '1996 in music', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', '2006 in music', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2008 in music', 'Semaphore (programming)'], 'not': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'signal': ['Noise (music)', 'Time travel', 'Semaphore (programming)'], 'what': ['Noise (music)', 'Rock music', 'Time travel', 'Alex Turner (musician)'], 'any': ['Noise (music)', 'Black dog (ghost)', 'C Sharp (programming language)', 'Time travel', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Mode (computer interface)'], 'have': ['Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Black dog (ghost)', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Sean Delaney (musician)', 'Mode (computer interface)'], 'time': ['Noise (music)', '2009 in music', 'Rock music', 'Old-time music', 'C Sharp (programming language)', 'Richard Wright (musician)', '1936 in music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Time travel', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Semaphore (programming)'], 'like': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Arabic music', 'C Sharp (programming language)', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'hegarty': ['Noise (music)'], 'work': ['Noise (music)', 'Rock music', 'Human computer', 'Embryo drawing', 'Sean Delaney (musician)'], 'these': ['Noise (music)', 'Rock music', 'Old-time music', 'Arabic music', 'Voice classification in non-classical music', 'Time travel', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography'], 'cage': ['Noise (music)'], 'which': ['Noise (music)', '2009 in music', 'Rock music', 'Lights (musician)', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Fiskerton, Lincolnshire', 'Richard Wright (musician)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', 'Mode (computer interface)', '2008 in music', 'Semaphore (programming)'], 'all': ['Noise (music)', '2009 in music', 'Rock music', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', '1996 in music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Ruby (programming language)', "Wake Forest Demon Deacons men's soccer"], 'japanese': ['Noise (music)', 'Ruby (programming language)'], 'genre': ['Noise (music)', 'Rock music', 'Arabic music'], 'but': ['Noise (music)', 'Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Tony Kaye (musician)', 'Ruby (programming language)'], 'russolo': ['Noise (music)'], 'used': ['Noise (music)', 'Rock music', 'Human computer', 'Arabic music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'Georgia Bulldogs football', 'Time travel', 'Python (programming language)', 'Lua (programming language)', 'Single-board computer', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Traditional Thai musical instruments', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'same': ['Noise (music)', 'Rock music', 'C Sharp (programming language)', 'Time travel', 'Python (programming language)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)'], 'track': ['Noise (music)', 'Lights (musician)'], 'first': ['Noise (music)', '1922 in music', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'USC Trojans volleyball', '2007 Bulldogs RLFC season', 'Old-time music', 'Arabic music', 'Will Johnson (soccer)', 'Richard Wright (musician)', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', '1996 in music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', '2006 in music', 'Tony Kaye (musician)', 'Ruby (programming language)', '2007 in music', '2008 in music', "Wake Forest Demon Deacons men's soccer"], 'had': ['Noise (music)', '2009 in music', 'Rock music', 'Lights (musician)', 'Human computer', 'Black dog (ghost)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Personal computer', 'Digital photography', 'Sean Delaney (musician)', 'Tony Kaye (musician)'], 'found': ['Noise (music)', 'Black dog (ghost)', 'Indian classical music'], 'called': ['Noise (music)', 'C Sharp (programming language)', 'List of dystopian music, TV programs, and games', 'Indian classical music', 'Personal computer', 'Traditional Thai musical instruments', 'Ruby (programming language)', 'Semaphore (programming)'], 'created': ['Noise (music)', 'List of dystopian music, TV programs, and games'], 'paris': ['Noise (music)'], 'sirens': ['Noise (music)'], 'piece': ['Noise (music)'], 'using': ['Noise (music)', 'Rock music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Ruby (programming language)', 'Semaphore (programming)'], 'percussion': ['Noise (music)', 'Traditional Thai musical instruments'], 'tape': ['Noise (music)'], 'musique': ['Noise (music)'], 'concrète': ['Noise (music)'], 'group': ['Noise (music)', 'Rock music', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', '1996 in music', '2006 in music', 'Tony Kaye (musician)'], 'recorded': ['Noise (music)', 'Rock music', 'Alex Turner (musician)'], 'various': ['Noise (music)', 'List of dystopian music, TV programs, and games', 'Tony Kaye (musician)'], '1960': ['Noise (music)'], 'album': ['Noise (music)', 'Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Tim Arnold (musician)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Alex Turner (musician)', '1996 in music', 'Joseph Williams (musician)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Danja (musician)', '2007 in music', '2008 in music'], 'cassette': ['Noise (music)'], 'ubuweb': ['Noise (music)'], 'com': ['Noise (music)'], 'ubu': ['Noise (music)'], '1922': ['1922 in music'], 'january': ['1922 in music', '1986 in music', '2009 in music', '1936 in music', 'Annie (musical)', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'orchestra': ['1922 in music', '1936 in music', '2006 in music', '2008 in music'], 'october': ['1922 in music', '1986 in music', '2009 in music', 'Lights (musician)', '1936 in music', 'David Gray (musician)', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'walter': ['1922 in music'], 'harry': ['1922 in music', '1936 in music'], 'you': ['1922 in music', '2009 in music', '1936 in music', 'Annie (musical)', 'Alex Turner (musician)', '2006 in music', '2008 in music'], 'march': ['1922 in music', '1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'april': ['1922 in music', '1986 in music', '2009 in music', 'Lights (musician)', '1936 in music', 'Alex Turner (musician)', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'production': ['1922 in music', '1936 in music', 'Annie (musical)', 'The Hunchback of Notre Dame (musical)'], 'opened': ['1922 in music', '1936 in music', 'Annie (musical)'], 'september': ['1922 in music', '1986 in music', '2009 in music', 'Lights (musician)', '1936 in music', 'David Gray (musician)', 'Annie (musical)', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'ran': ['1922 in music', '1936 in music'], 'performances': ['1922 in music', '1936 in music', 'Annie (musical)', '2006 in music'], 'august': ['1922 in music', '2009 in music', 'Lights (musician)', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'american': ['1922 in music', '1986 in music', '2009 in music', 'Rock music', 'Old-time music', 'List of dystopian music, TV programs, and games', 'Fisk University', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'june': ['1922 in music', '1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'kennedy': ['Ken Kennedy (computer scientist)'], 'computer': ['Ken Kennedy (computer scientist)', 'Human computer', 'List of dystopian music, TV programs, and games', 'Single-board computer', 'Personal computer', 'Digital photography', 'Mode (computer interface)'], 'award': ['Ken Kennedy (computer scientist)', 'The Hunchback of Notre Dame (musical)'], '1986': ['1986 in music'], 'british': ['1986 in music', '2009 in music', 'Rock music', '2006 in music', '2007 in music', '2008 in music'], 'february': ['1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'november': ['1986 in music', '2009 in music', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'december': ['1986 in music', '2009 in music', 'Will Johnson (soccer)', '1936 in music', '1996 in music', '2006 in music', '2007 in music', '2008 in music'], 'july': ['1986 in music', '2009 in music', 'Lights (musician)', 'Annie (musical)', '1996 in music', 'Lua (programming language)', '2006 in music', '2007 in music', '2008 in music'], 'flute': ['1986 in music'], 'opera': ['1986 in music', 'Voice classification in non-classical music', '1936 in music', 'George Crum (musician)', '2006 in music'], 'london': ['1986 in music', 'Tim Arnold (musician)', 'Richard Wright (musician)', '1936 in music', 'Alex Turner (musician)', '2008 in music'], 'korean': ['1986 in music'], 'english': ['1986 in music', 'Alex Turner (musician)', 'The Hunchback of Notre Dame (musical)', 'English folk music (1500–1899)', '2006 in music'], 'australian': ['1986 in music', '2008 in music'], 'dancer': ['1986 in music', '1996 in music'], 'beach': ['Spain national beach soccer team'], 'soccer': ['Spain national beach soccer team', 'Will Johnson (soccer)', 'Steven Cohen (soccer)'], 'fifa': ['Spain national beach soccer team'], 'cadogan': ['Kevin Cadogan'], 'third': ['Kevin Cadogan', '2009 in music', 'Python (programming language)', '2006 in music'], 'eye': ['Kevin Cadogan'], 'blind': ['Kevin Cadogan', 'Guide dog'], 'their': ['Kevin Cadogan', '2009 in music', 'Rock music', 'Lights (musician)', 'Black dog (ghost)', '2007 Bulldogs RLFC season', 'Old-time music', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', 'Sun dog', '1996 in music', 'Personal computer', 'Digital photography', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', '2007 in music', '2008 in music', 'Semaphore (programming)', "Wake Forest Demon Deacons men's soccer"], 'jenkins': ['Kevin Cadogan', '2009 Louisiana Tech Bulldogs football team'], 'elektra': ['Kevin Cadogan'], 'records': ['Kevin Cadogan', 'Rock music', 'Joe Becker (musician)', '1996 in music', '2006 in music', 'Sean Delaney (musician)'], 'california': ['Kevin Cadogan', 'Rock music', 'Steve Perry (musician)'], 'two': ['Kevin Cadogan', '2009 in music', 'Rock music', 'C Sharp (programming language)', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', '2009 Louisiana Tech Bulldogs football team', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', 'Sun dog', 'Covariance and contravariance (computer science)', 'Traditional Thai musical instruments', 'Tony Kaye (musician)', 'Ruby (programming language)'], 'were': ['Kevin Cadogan', 'Rock music', 'Lights (musician)', 'Human computer', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'Richard Wright (musician)', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', 'Sun dog', 'Lua (programming language)', 'Personal computer', 'Digital photography', 'Sean Delaney (musician)', 'Ruby (programming language)'], '2009': ['2009 in music', 'Lights (musician)', 'Annie (musical)', 'Tony Kaye (musician)', "Wake Forest Demon Deacons men's soccer"], 'lady': ['2009 in music'], 'gaga': ['2009 in music'], 'debut': ['2009 in music', 'Alex Turner (musician)', '2006 in music', '2008 in music'], 'single': ['2009 in music', 'Rock music', 'Lights (musician)', 'David Gray (musician)', 'Time travel', 'Alex Turner (musician)', '1996 in music', 'Single-board computer', 'Personal computer', 'Digital photography', '2006 in music', '2007 in music', '2008 in music'], 'just': ['2009 in music', 'Alex Turner (musician)'], 'hit': ['2009 in music', 'Rock music', '2006 in music'], 'number': ['2009 in music', 'Rock music', 'C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Digital photography', 'Comparison of programming languages (basic instructions)', '2006 in music', '2008 in music', 'Semaphore (programming)'], 'billboard': ['2009 in music', 'Rock music', '2006 in music', '2007 in music', '2008 in music'], 'hot': ['2009 in music', '2006 in music', '2008 in music'], '100': ['2009 in music', '2006 in music', '2008 in music'], 'after': ['2009 in music', 'Rock music', 'Will Johnson (soccer)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', '1996 in music', 'The Hunchback of Notre Dame (musical)', '2006 in music', 'Sean Delaney (musician)', 'Tony Kaye (musician)', 'Mode (computer interface)', '2007 in music', '2008 in music'], 'weeks': ['2009 in music', '2006 in music', '2008 in music'], 'second': ['2009 in music', 'Rock music', 'Lights (musician)', 'Georgia Bulldogs football', 'Annie (musical)', '2006 in music'], 'since': ['2009 in music', 'Rock music', 'Georgia Bulldogs football', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', '2006 in music', 'Ruby (programming language)', '2007 in music', '2008 in music'], 'singles': ['2009 in music', 'Rock music', '2006 in music'], 'chart': ['2009 in music', 'David Gray (musician)'], 'three': ['2009 in music', 'Old-time music', 'Alex Turner (musician)', 'Python (programming language)', 'Traditional Thai musical instruments', '2006 in music'], 'week': ['2009 in music', '2007 Bulldogs RLFC season', '2006 in music', '2008 in music'], 'day': ['2009 in music', 'Sun dog', '1996 in music', '2006 in music', 'Ruby (programming language)', '2008 in music'], 'out': ['2009 in music', 'Rock music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Annie (musical)', 'Alex Turner (musician)', '1996 in music', 'Covariance and contravariance (computer science)', '2006 in music'], 'festival': ['2009 in music', 'Old-time music', 'Alex Turner (musician)', '2006 in music', '2007 in music', '2008 in music'], 'takes': ['2009 in music', 'List of dystopian music, TV programs, and games', '2008 in music'], 'place': ['2009 in music', 'List of dystopian music, TV programs, and games', '2006 in music', '2007 in music', '2008 in music'], 'are': ['2009 in music', 'Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Voice classification in non-classical music', 'Dalmatian (dog)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Sun dog', '1996 in music', 'Lua (programming language)', 'Single-board computer', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Traditional Thai musical instruments', 'Comparison of programming languages (basic instructions)', '2006 in music', 'Ruby (programming language)', 'Texture (music)', 'Mode (computer interface)', '2007 in music', 'Semaphore (programming)'], 'concert': ['2009 in music', 'Richard Wright (musician)', '1996 in music', '2007 in music', '2008 in music'], 'held': ['2009 in music', '2006 in music', '2007 in music', '2008 in music'], 'beyoncé': ['2009 in music', '2006 in music'], 'shakira': ['2009 in music', '2006 in music'], 'songs': ['2009 in music', 'Rock music', 'Lights (musician)', 'Old-time music', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'David Gray (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Joseph Williams (musician)', 'The Hunchback of Notre Dame (musical)', 'Sean Delaney (musician)'], 'performed': ['2009 in music', 'Joe Becker (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music'], 'including': ['2009 in music', 'Rock music', 'Arabic music', 'Richard Wright (musician)', 'Annie (musical)', 'Python (programming language)', 'Ruby (programming language)'], 'jay': ['2009 in music', 'The Mandogs'], 'kelly': ['2009 in music'], 'clarkson': ['2009 in music'], 'her': ['2009 in music', 'Lights (musician)', 'List of dystopian music, TV programs, and games', 'Annie (musical)', '2006 in music', '2007 in music', '2008 in music'], 'life': ['2009 in music', 'List of dystopian music, TV programs, and games', 'David Gray (musician)', 'Annie (musical)'], 'would': ['2009 in music', 'Rock music', 'Black dog (ghost)', 'Tim Arnold (musician)', 'Arabic music', 'Richard Wright (musician)', 'Voice classification in non-classical music', 'Steve Perry (musician)', 'Time travel', 'Alex Turner (musician)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer'], '000': ['2009 in music', 'Personal computer', '2006 in music', '2007 in music'], 'release': ['2009 in music', 'Lights (musician)', 'David Gray (musician)', 'Python (programming language)', '2006 in music', 'Ruby (programming language)', '2007 in music', '2008 in music', 'Semaphore (programming)'], 'announces': ['2009 in music', '2006 in music', '2007 in music'], 'she': ['2009 in music', 'Lights (musician)', 'Annie (musical)'], 'tour': ['2009 in music', 'Lights (musician)', 'Richard Wright (musician)', 'Steve Perry (musician)', 'David Gray (musician)', 'Annie (musical)', 'Alex Turner (musician)', '1996 in music', '2006 in music', 'Tony Kaye (musician)', '2007 in music', '2008 in music'], 'run': ['2009 in music', '2009 Louisiana Tech Bulldogs football team', 'Annie (musical)', 'Python (programming language)', 'Personal computer', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)'], 'top': ['2009 in music', 'Rock music', '2007 Bulldogs RLFC season', '2006 in music', '2008 in music'], 'five': ['2009 in music', '2006 in music'], 'show': ['2009 in music', 'Annie (musical)', 'The Hunchback of Notre Dame (musical)', 'The Mandogs', '2006 in music', '2008 in music'], 'awards': ['2009 in music', 'David Gray (musician)', '1996 in music', '2006 in music', '2007 in music'], 'win': ['2009 in music', '2007 Bulldogs RLFC season', '2006 in music'], 'year': ['2009 in music', 'Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'David Gray (musician)', 'Annie (musical)', 'Alex Turner (musician)', '1996 in music', 'Personal computer', '2006 in music', '2007 in music', '2008 in music'], 'wins': ['2009 in music', '2006 in music', '2008 in music'], 'best': ['2009 in music', 'David Gray (musician)', '2007 in music', '2008 in music'], 'song': ['2009 in music', 'Rock music', 'Lights (musician)', 'Tim Arnold (musician)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', '1996 in music', 'Joseph Williams (musician)', '2006 in music', 'Sean Delaney (musician)', '2007 in music', '2008 in music'], 'blink': ['2009 in music'], '182': ['2009 in music'], 'rihanna': ['2009 in music'], 'announced': ['2009 in music'], 'live': ['2009 in music', 'List of Saturday Night Live musical sketches', 'Richard Wright (musician)', 'Tony Kaye (musician)'], '2008': ['2009 in music', 'Lights (musician)', 'USC Trojans volleyball', 'Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'Alex Turner (musician)', 'Personal computer', '2008 in music', "Wake Forest Demon Deacons men's soccer"], 'sold': ['2009 in music', 'Personal computer'], 'releases': ['2009 in music', 'Python (programming language)', '1996 in music', '2006 in music'], 'female': ['2009 in music', 'Rock music', 'Voice classification in non-classical music', '2008 in music'], 'only': ['2009 in music', 'C Sharp (programming language)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Semaphore (programming)'], 'last': ['2009 in music', 'List of dystopian music, TV programs, and games', 'Alex Turner (musician)', '2008 in music'], 'years': ['2009 in music', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Alex Turner (musician)', '2006 in music', '2007 in music', '2008 in music'], '2003': ['2009 in music', 'List of dystopian music, TV programs, and games'], 'million': ['2009 in music', 'Personal computer'], 'britney': ['2009 in music'], 'spears': ['2009 in music'], 'world': ['2009 in music', 'Rock music', 'Human computer', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Steven Cohen (soccer)', 'Time travel', '2006 in music'], 'jackson': ['2009 in music'], 'concerts': ['2009 in music'], 'death': ['2009 in music', 'Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Sean Delaney (musician)'], 'name': ['2009 in music', 'Black dog (ghost)', 'C Sharp (programming language)', 'Python (programming language)', 'Ruby (programming language)'], 'selling': ['2009 in music', 'Rock music', 'Personal computer', '2006 in music', '2007 in music', '2008 in music'], 'ever': ['2009 in music'], 'studio': ['2009 in music', 'Alex Turner (musician)', '2006 in music', '2007 in music', '2008 in music'], 'face': ['2009 in music'], 'becomes': ['2009 in music'], '2002': ['2009 in music', 'List of dystopian music, TV programs, and games'], 'black': ['2009 in music', 'Rock music', 'Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Fisk University', 'Landseer (dog)'], 'featuring': ['2009 in music', '1936 in music', '2006 in music'], 'bass': ['2009 in music', '2006 in music'], '2004': ['2009 in music', 'Alex Turner (musician)'], 'hiatus': ['2009 in music', '2007 in music'], '2005': ['2009 in music', 'List of dystopian music, TV programs, and games', 'Annie (musical)'], 'stage': ['2009 in music', 'Alex Turner (musician)', 'The Hunchback of Notre Dame (musical)'], 'eyed': ['2009 in music'], 'peas': ['2009 in music'], 'west': ['2009 in music', 'Old-time music', 'Annie (musical)'], 'kanye': ['2009 in music'], 'girls': ['2009 in music', 'List of dystopian music, TV programs, and games', 'Annie (musical)'], 'hits': ['2009 in music', 'Rock music'], 'touring': ['2009 in music', 'Richard Wright (musician)', 'David Gray (musician)', 'Annie (musical)'], '2001': ['2009 in music', 'Rock music', 'Annie (musical)'], 'love': ['2009 in music', 'Tim Arnold (musician)', '1936 in music', 'Alex Turner (musician)', '2006 in music'], 'boom': ['2009 in music'], 'popular': ['Rock music', 'Arabic music'], 'roll': ['Rock music'], 'united': ['Rock music', 'Old-time music', 'Guide dog', 'List of dystopian music, TV programs, and games', 'David Gray (musician)', 'Annie (musical)', '2008 in music', "Wake Forest Demon Deacons men's soccer"], 'states': ['Rock music', 'Old-time music', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Indian classical music'], 'late': ['Rock music'], '1950s': ['Rock music'], 'developed': ['Rock music', 'Old-time music', 'List of dystopian music, TV programs, and games', 'Personal computer'], 'into': ['Rock music', 'Embryo drawing', 'C Sharp (programming language)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Mode (computer interface)'], 'range': ['Rock music', 'Voice classification in non-classical music', 'Digital photography'], 'different': ['Rock music', 'Embryo drawing', 'Time travel', 'Indian classical music', 'Digital photography', 'Mode (computer interface)'], 'styles': ['Rock music', 'Old-time music', 'Arabic music'], 'mid': ['Rock music', 'Alex Turner (musician)'], '1960s': ['Rock music'], 'later': ['Rock music', 'Arabic music', 'Richard Wright (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Personal computer', 'Digital photography', 'Ruby (programming language)'], 'particularly': ['Rock music', 'Old-time music'], 'kingdom': ['Rock music'], 'has': ['Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Time travel', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', 'Indian classical music', 'Covariance and contravariance (computer science)', 'The Mandogs', 'Digital photography', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'its': ['Rock music', 'Lights (musician)', 'Black dog (ghost)', 'Old-time music', 'C Sharp (programming language)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'David Gray (musician)', 'Georgia Bulldogs football', 'Time travel', 'Fisk University', 'Python (programming language)', 'Endoglin', 'Indian classical music', '1996 in music', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', 'Personal computer', 'Digital photography', '2006 in music', 'Spawning (computer gaming)', 'Ruby (programming language)', 'Semaphore (programming)'], 'style': ['Rock music', 'Old-time music', 'Alex Turner (musician)', 'Python (programming language)'], 'genres': ['Rock music', 'Arabic music'], 'electric': ['Rock music'], 'incorporated': ['Rock music'], 'influences': ['Rock music', 'Indian classical music'], 'instrumentation': ['Rock music'], 'guitar': ['Rock music', 'Old-time music', 'Arabic music', 'Joe Becker (musician)', 'Richard Wright (musician)', 'David Gray (musician)', 'Alex Turner (musician)'], 'usually': ['Rock music', 'Black dog (ghost)', 'Dalmatian (dog)', 'Personal computer'], 'part': ['Rock music', 'Richard Wright (musician)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music'], 'drums': ['Rock music'], 'form': ['Rock music', 'Black dog (ghost)', 'Embryo drawing', 'Arabic music', 'Indian classical music', 'Personal computer'], 'become': ['Rock music'], 'diverse': ['Rock music'], 'lyrics': ['Rock music', 'Alex Turner (musician)'], 'often': ['Rock music', 'Human computer', 'Black dog (ghost)', 'Old-time music', 'Dalmatian (dog)', 'Python (programming language)', 'Single-board computer', 'Personal computer'], 'variety': ['Rock music'], 'themes': ['Rock music', 'List of dystopian music, TV programs, and games'], 'political': ['Rock music'], 'period': ['Rock music'], 'distinct': ['Rock music'], 'subgenres': ['Rock music'], 'emerged': ['Rock music'], 'southern': ['Rock music', 'Old-time music', 'Georgia Bulldogs football', 'Traditional Thai musical instruments'], 'many': ['Rock music', 'Old-time music', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Indian classical music', 'Personal computer', 'Digital photography', 'Ruby (programming language)'], 'development': ['Rock music', 'Embryo drawing', 'Python (programming language)', 'Digital photography'], 'psychedelic': ['Rock music'], 'influenced': ['Rock music'], 'included': ['Rock music'], 'progressive': ['Rock music'], 'elements': ['Rock music'], 'glam': ['Rock music'], 'subgenre': ['Rock music'], 'heavy': ['Rock music'], 'metal': ['Rock music'], 'power': ['Rock music', 'List of dystopian music, TV programs, and games', 'Personal computer'], '1970s': ['Rock music'], 'down': ['Rock music', '2007 Bulldogs RLFC season'], 'influence': ['Rock music'], '1980s': ['Rock music'], 'post': ['Rock music', 'List of dystopian music, TV programs, and games'], '1990s': ['Rock music'], 'began': ['Rock music', 'Alex Turner (musician)'], 'mainstream': ['Rock music'], 'grunge': ['Rock music'], 'britpop': ['Rock music'], 'rap': ['Rock music'], 'well': ['Rock music', 'Old-time music', 'Dalmatian (dog)'], 'history': ['Rock music', 'Embryo drawing', 'Georgia Bulldogs football', 'Time travel'], 'garage': ['Rock music'], '2000s': ['Rock music'], 'saw': ['Rock music', '2007 Bulldogs RLFC season', 'Traditional Thai musical instruments'], 'decline': ['Rock music', 'Personal computer'], 'popularity': ['Rock music'], 'cultural': ['Rock music'], 'most': ['Rock music', 'Embryo drawing', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography'], 'leading': ['Rock music'], 'major': ['Rock music', 'Python (programming language)', 'Indian classical music'], 'culture': ['Rock music'], 'emo': ['Rock music'], 'been': ['Rock music', 'Black dog (ghost)', 'Old-time music', 'Arabic music', 'C Sharp (programming language)', 'Fiskerton, Lincolnshire', 'Richard Wright (musician)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Endoglin', '1996 in music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Ruby (programming language)'], 'associated': ['Rock music'], 'sex': ['Rock music'], 'seen': ['Rock music', 'Black dog (ghost)', 'Sun dog'], 'youth': ['Rock music'], 'against': ['Rock music', '2007 Bulldogs RLFC season', 'Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football'], 'pioneered': ['Rock music'], 'era': ['Rock music', 'Indian classical music'], 'derived': ['Rock music'], 'lead': ['Rock music', 'Richard Wright (musician)', 'Steve Perry (musician)', 'Joseph Williams (musician)', '2006 in music'], 'musicians': ['Rock music', 'Old-time music', 'Indian classical music'], 'between': ['Rock music', 'Embryo drawing', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Time travel', 'Indian classical music'], 'members': ['Rock music'], 'whose': ['Rock music'], 'simple': ['Rock music'], 'beat': ['Rock music'], 'four': ['Rock music', 'List of dystopian music, TV programs, and games', 'Indian classical music'], 'common': ['Rock music', 'C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)'], 'there': ['Rock music', 'Black dog (ghost)', 'Old-time music', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Semaphore (programming)'], 'considerable': ['Rock music'], 'forms': ['Rock music', 'Indian classical music'], 'rebellion': ['Rock music'], 'christgau': ['Rock music'], 'cool': ['Rock music'], 'male': ['Rock music', 'Voice classification in non-classical music'], 'largely': ['Rock music'], 'audience': ['Rock music'], 'both': ['Rock music', 'Embryo drawing', 'Arabic music', 'C Sharp (programming language)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)'], 'term': ['Rock music', 'Voice classification in non-classical music', 'Personal computer'], 'emphasis': ['Rock music'], 'performance': ['Rock music', 'Indian classical music', 'Personal computer', 'Ruby (programming language)'], 'than': ['Rock music', 'Embryo drawing', 'Time travel', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Ruby (programming language)', 'Semaphore (programming)'], 'even': ['Rock music', 'Time travel'], 'through': ['Rock music', 'Black dog (ghost)', 'Embryo drawing', 'C Sharp (programming language)', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Personal computer'], 'much': ['Rock music'], 'boys': ['Rock music'], 'during': ['Rock music', 'Richard Wright (musician)', 'Steve Perry (musician)', 'Georgia Bulldogs football', 'Fisk University', 'Alex Turner (musician)', 'Tony Kaye (musician)'], 'playing': ['Rock music', 'Richard Wright (musician)', 'Annie (musical)', 'Tony Kaye (musician)'], 'describe': ['Rock music'], 'around': ['Rock music', 'Black dog (ghost)', 'List of dystopian music, TV programs, and games'], 'became': ['Rock music', 'Richard Wright (musician)', 'Fisk University'], 'airplay': ['Rock music'], 'charts': ['Rock music'], 'worldwide': ['Rock music'], 'soon': ['Rock music'], 'who': ['Rock music', 'Human computer', 'Black dog (ghost)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Sean Delaney (musician)', 'Tony Kaye (musician)'], 'dominated': ['Rock music'], 'decade': ['Rock music'], 'played': ['Rock music', 'Old-time music', 'Will Johnson (soccer)', 'Richard Wright (musician)', 'Georgia Bulldogs football', 'Annie (musical)', 'Alex Turner (musician)', 'Traditional Thai musical instruments', 'Tony Kaye (musician)'], 'commercial': ['Rock music'], 'success': ['Rock music'], 'hurricane': ['Rock music'], 'along': ['Rock music'], 'brothers': ['Rock music', 'David Levi (musician)'], 'they': ['Rock music', 'Black dog (ghost)', 'C Sharp (programming language)', 'Dalmatian (dog)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Sun dog', '1996 in music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Sean Delaney (musician)', 'Ruby (programming language)', 'Mode (computer interface)', 'Semaphore (programming)'], 'traditional': ['Rock music', 'Old-time music', 'Arabic music', 'Traditional Thai musical instruments'], 'vocal': ['Rock music', 'Voice classification in non-classical music', 'Register (music)'], 'gained': ['Rock music'], 'groups': ['Rock music'], 'acts': ['Rock music'], 'among': ['Rock music'], 'successful': ['Rock music'], 'link': ['Rock music', 'Indian classical music'], 'brought': ['Rock music'], 'britain': ['Rock music'], 'helped': ['Rock music'], 'moved': ['Rock music'], 'figures': ['Rock music'], 'end': ['Rock music', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Personal computer', 'Digital photography'], 'instrumental': ['Rock music'], 'general': ['Rock music', 'Embryo drawing', 'Guide dog', 'Time travel', 'Covariance and contravariance (computer science)'], 'about': ['Rock music', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Indian classical music', 'Personal computer'], '1967': ['Rock music'], 'increasingly': ['Rock music'], 'albums': ['Rock music', 'Alex Turner (musician)', 'Joseph Williams (musician)', '2007 in music'], 'existing': ['Rock music'], 'trends': ['Rock music'], 'while': ['Rock music', 'Old-time music', 'Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography', 'Sean Delaney (musician)', 'Mode (computer interface)'], 'performers': ['Rock music', 'List of gospel musicians'], 'significant': ['Rock music'], 'led': ['Rock music', 'Tony Kaye (musician)'], 'becoming': ['Rock music'], 'pursued': ['Rock music'], 'careers': ['Rock music'], 'santana': ['Rock music'], '1969': ['Rock music', 'Tony Kaye (musician)'], 'surf': ['Rock music'], 'distinctive': ['Rock music'], 'regional': ['Rock music', 'Old-time music'], 'following': ['Rock music', 'Ruby (programming language)'], 'bands': ['Rock music', 'Old-time music', '2007 in music'], 'formed': ['Rock music'], 'ten': ['Rock music'], 'national': ['Rock music', 'USC Trojans volleyball', 'Georgia Bulldogs football', 'Fisk University', 'Annie (musical)', 'George Crum (musician)'], '1963': ['Rock music'], 'achieved': ['Rock music'], 'them': ['Rock music', 'Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Semaphore (programming)'], 'reached': ['Rock music'], 'make': ['Rock music'], 'invasion': ['Rock music'], 'beatles': ['Rock music', 'Peter Brown (music industry)'], 'rolling': ['Rock music'], 'stones': ['Rock music'], 'yardbirds': ['Rock music'], 'directly': ['Rock music', 'Personal computer'], 'tended': ['Rock music'], 'less': ['Rock music'], 'however': ['Rock music', 'Voice classification in non-classical music', 'Time travel', 'Indian classical music', 'Covariance and contravariance (computer science)', 'Personal computer', 'Digital photography'], 'followed': ['Rock music'], 'subsequent': ['Rock music'], 'international': ['Rock music', '2008 in music'], 'america': ['Rock music', 'List of dystopian music, TV programs, and games'], 'scenes': ['Rock music'], 'greater': ['Rock music'], 'labels': ['Rock music'], 'commercially': ['Rock music'], '1968': ['Rock music'], 'college': ['Rock music', 'Fisk University'], 'psychedelia': ['Rock music'], 'although': ['Rock music', 'Embryo drawing'], 'taken': ['Rock music', 'List of dystopian music, TV programs, and games', 'Digital photography'], 'inspired': ['Rock music'], 'acoustic': ['Rock music', 'Lights (musician)'], 'adopted': ['Rock music'], 'key': ['Rock music', 'Lua (programming language)', 'Mode (computer interface)'], 'green': ['Rock music'], 'off': ['Rock music'], 'jimi': ['Rock music'], 'hendrix': ['Rock music'], 'away': ['Rock music', 'Georgia Bulldogs football'], 'hard': ['Rock music', 'Annie (musical)'], 'continued': ['Rock music'], 'revival': ['Rock music', 'Annie (musical)'], 'movement': ['Rock music'], 'dylan': ['Rock music'], 'byrds': ['Rock music'], 'took': ['Rock music', 'Richard Wright (musician)', 'Annie (musical)'], 'york': ['Rock music', 'Annie (musical)', 'Alex Turner (musician)'], 'peak': ['Rock music'], 'sometimes': ['Rock music', 'Black dog (ghost)'], 'mixed': ['Rock music'], 'beside': ['Rock music'], 'label': ['Rock music'], 'oriented': ['Rock music', 'Python (programming language)', 'Ruby (programming language)'], 'came': ['Rock music'], '1970': ['Rock music'], '1976': ['Rock music'], 'christian': ['Rock music', 'List of gospel musicians'], 'independent': ['Rock music'], 'hardcore': ['Rock music'], 'heartland': ['Rock music'], 'women': ['Rock music', 'Human computer', 'USC Trojans volleyball', 'Voice classification in non-classical music'], 'lights': ['Lights (musician)'], 'released': ['Lights (musician)', 'Tim Arnold (musician)', 'Joe Becker (musician)', 'Richard Wright (musician)', 'Steve Perry (musician)', 'David Gray (musician)', 'Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', '1996 in music', 'Joseph Williams (musician)', '2006 in music', 'Sean Delaney (musician)', 'Ruby (programming language)', '2007 in music', '2008 in music'], 'listening': ['Lights (musician)'], 'siberia': ['Lights (musician)'], 'little': ['Lights (musician)', '1936 in music', 'Annie (musical)'], 'machines': ['Lights (musician)', 'Personal computer'], '2014': ['Lights (musician)', 'The Hunchback of Notre Dame (musical)'], 'skin': ['Lights (musician)'], 'earth': ['Lights (musician)', 'List of dystopian music, TV programs, and games', 'Time travel'], '2017': ['Lights (musician)', 'Alex Turner (musician)', 'The Hunchback of Notre Dame (musical)', "Wake Forest Demon Deacons men's soccer"], 'video': ['Lights (musician)', 'List of dystopian music, TV programs, and games', '1996 in music', 'Personal computer', '2006 in music'], 'received': ['Lights (musician)', 'The Hunchback of Notre Dame (musical)'], 'mathematical': ['Human computer'], 'calculations': ['Human computer'], 'computers': ['Human computer', 'Single-board computer', 'Personal computer'], 'human': ['Human computer', 'Embryo drawing', 'Guide dog', 'List of dystopian music, TV programs, and games'], 'computing': ['Human computer', 'Personal computer'], 'tables': ['Human computer', 'Lua (programming language)'], 'project': ['Human computer', 'C Sharp (programming language)', 'Dalmatian (dog)', 'Steve Perry (musician)', 'Python (programming language)', 'Joseph Williams (musician)'], 'worked': ['Human computer'], 'data': ['Human computer', 'C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer'], 'harvard': ['Human computer'], 'committee': ['Human computer'], 'pearson': ['Human computer'], 'humans': ['Human computer', 'List of dystopian music, TV programs, and games'], 'war': ['Human computer', 'List of dystopian music, TV programs, and games'], 'akifumi': ['Aube (musician)'], 'aube': ['Aube (musician)'], 'overtone': ['List of overtone musicians'], 'singing': ['List of overtone musicians', 'Voice classification in non-classical music'], 'dog': ['Black dog (ghost)', 'Mexican dog-faced bat', 'Dalmatian (dog)', 'Guide dog', 'Sun dog'], 'folklore': ['Black dog (ghost)'], 'said': ['Black dog (ghost)', 'Richard Wright (musician)', 'Alex Turner (musician)'], 'devil': ['Black dog (ghost)'], 'described': ['Black dog (ghost)', 'Alex Turner (musician)'], 'large': ['Black dog (ghost)', 'Python (programming language)', 'Personal computer', 'Traditional Thai musical instruments'], 'eyes': ['Black dog (ghost)'], 'shuck': ['Black dog (ghost)'], 'dogs': ['Black dog (ghost)', '2007 Bulldogs RLFC season', 'Dalmatian (dog)', 'Guide dog', 'Sun dog', 'Landseer (dog)'], 'way': ['Black dog (ghost)', 'Time travel', 'Covariance and contravariance (computer science)', 'Mode (computer interface)'], 'barghest': ['Black dog (ghost)'], 'night': ['Black dog (ghost)', 'List of Saturday Night Live musical sketches'], 'padfoot': ['Black dog (ghost)'], 'skriker': ['Black dog (ghost)'], 'church': ['Black dog (ghost)'], 'grim': ['Black dog (ghost)'], 'england': ['Black dog (ghost)'], 'when': ['Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Time travel', 'Annie (musical)', 'Alex Turner (musician)', 'Covariance and contravariance (computer science)', 'Digital photography', 'Mode (computer interface)', 'Semaphore (programming)'], 'hounds': ['Black dog (ghost)'], 'appeared': ['Black dog (ghost)'], 'ghostly': ['Black dog (ghost)'], 'story': ['Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Time travel'], 'hound': ['Black dog (ghost)'], 'near': ['Black dog (ghost)', 'List of dystopian music, TV programs, and games'], 'haunted': ['Black dog (ghost)'], 'named': ['Black dog (ghost)', 'Fisk University'], 'area': ['Black dog (ghost)'], 'haunt': ['Black dog (ghost)'], 'heard': ['Black dog (ghost)'], 'omen': ['Black dog (ghost)'], 'haunts': ['Black dog (ghost)'], 'man': ['Black dog (ghost)', 'List of dystopian music, TV programs, and games'], 'village': ['Black dog (ghost)', 'Fiskerton, Lincolnshire'], 'home': ['Black dog (ghost)', 'Georgia Bulldogs football', 'Personal computer'], 'where': ['Black dog (ghost)', 'List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Mode (computer interface)'], 'old': ['Black dog (ghost)', 'Old-time music', 'Annie (musical)'], 'legend': ['Black dog (ghost)'], 'before': ['Black dog (ghost)', 'Time travel', 'Python (programming language)'], 'people': ['Black dog (ghost)', 'Guide dog', 'List of dystopian music, TV programs, and games', 'Personal computer'], 'another': ['Black dog (ghost)', '2007 Bulldogs RLFC season', 'Time travel', 'Personal computer'], 'then': ['Black dog (ghost)', 'Steve Perry (musician)', 'Annie (musical)', 'Covariance and contravariance (computer science)', 'Tony Kaye (musician)', 'Ruby (programming language)'], 'local': ['Black dog (ghost)'], 'will': ['Black dog (ghost)', 'Time travel', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)', 'Mode (computer interface)', '2007 in music'], 'usc': ['USC Trojans volleyball'], 'volleyball': ['USC Trojans volleyball'], 'team': ['USC Trojans volleyball', 'Will Johnson (soccer)', '2009 Louisiana Tech Bulldogs football team', 'Georgia Bulldogs football', 'Spawning (computer gaming)', "Wake Forest Demon Deacons men's soccer"], 'ncaa': ['USC Trojans volleyball', "Wake Forest Demon Deacons men's soccer"], 'final': ['USC Trojans volleyball', 'List of dystopian music, TV programs, and games'], 'indoor': ['USC Trojans volleyball'], 'troy': ['USC Trojans volleyball'], 'season': ['USC Trojans volleyball', '2007 Bulldogs RLFC season', 'Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', "Wake Forest Demon Deacons men's soccer"], 'olympian': ['USC Trojans volleyball'], 'arnold': ['Tim Arnold (musician)'], 'soho': ['Tim Arnold (musician)'], '2007': ['2007 Bulldogs RLFC season', 'List of dystopian music, TV programs, and games', 'Annie (musical)', 'Alex Turner (musician)', 'Tony Kaye (musician)', '2007 in music', "Wake Forest Demon Deacons men's soccer"], 'bulldogs': ['2007 Bulldogs RLFC season', 'Georgia Bulldogs football'], 'telstra': ['2007 Bulldogs RLFC season'], 'stadium': ['2007 Bulldogs RLFC season', 'Georgia Bulldogs football'], 'game': ['2007 Bulldogs RLFC season', 'List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Lua (programming language)', 'Spawning (computer gaming)'], 'comeback': ['2007 Bulldogs RLFC season'], 'front': ['2007 Bulldogs RLFC season'], 'round': ['2007 Bulldogs RLFC season', 'Python (programming language)'], 'match': ['2007 Bulldogs RLFC season'], 'points': ['2007 Bulldogs RLFC season', 'Spawning (computer gaming)'], 'publishing': ['2007 Bulldogs RLFC season'], 'isbn': ['2007 Bulldogs RLFC season', 'Python (programming language)', 'Indian classical music', 'Lua (programming language)'], 'rugby': ['2007 Bulldogs RLFC season'], 'league': ['2007 Bulldogs RLFC season', 'Will Johnson (soccer)'], 'brown': ['Peter Brown (music industry)', '2006 in music'], 'epstein': ['Peter Brown (music industry)'], 'faced': ['Mexican dog-faced bat'], 'bat': ['Mexican dog-faced bat'], 'embryo': ['Embryo drawing'], 'embryos': ['Embryo drawing'], 'developmental': ['Embryo drawing'], 'animals': ['Embryo drawing', 'Guide dog'], 'species': ['Embryo drawing'], 'drawings': ['Embryo drawing'], 'biology': ['Embryo drawing'], 'embryonic': ['Embryo drawing'], 'stages': ['Embryo drawing'], 'evolution': ['Embryo drawing'], 'ernst': ['Embryo drawing'], 'haeckel': ['Embryo drawing'], 'vertebrate': ['Embryo drawing'], 'recapitulation': ['Embryo drawing'], 'theory': ['Embryo drawing', 'Arabic music', 'Time travel', 'Indian classical music'], 'evolutionary': ['Embryo drawing'], 'comparative': ['Embryo drawing'], 'anatomy': ['Embryo drawing'], 'embryology': ['Embryo drawing'], 'similar': ['Embryo drawing', 'C Sharp (programming language)', 'Python (programming language)', 'Digital photography', 'Ruby (programming language)'], 'biogenetic': ['Embryo drawing'], 'law': ['Embryo drawing'], 'certain': ['Embryo drawing', 'Time travel'], 'von': ['Embryo drawing', 'The Hunchback of Notre Dame (musical)'], 'baer': ['Embryo drawing'], 'wilhelm': ['Embryo drawing'], 'gould': ['Embryo drawing'], 'richardson': ['Embryo drawing'], 'university': ['Embryo drawing', 'Georgia Bulldogs football', 'Fisk University', 'Indian classical music'], 'laws': ['Embryo drawing'], 'series': ['Embryo drawing', 'List of dystopian music, TV programs, and games'], 'phylogenetic': ['Embryo drawing'], 'argues': ['Embryo drawing'], 'features': ['Embryo drawing', 'C Sharp (programming language)', 'List of dystopian music, TV programs, and games', 'Python (programming language)', 'Lua (programming language)', 'Ruby (programming language)'], 'rather': ['Embryo drawing', 'Python (programming language)'], 'specifically': ['Embryo drawing'], 'comparison': ['Embryo drawing'], 'science': ['Embryo drawing', 'Time travel'], 'darwin': ['Embryo drawing'], 'north': ['Old-time music', 'Indian classical music'], 'dancing': ['Old-time music'], 'generally': ['Old-time music', 'Personal computer'], 'fiddle': ['Old-time music'], 'string': ['Old-time music', '1936 in music', 'Python (programming language)', 'Traditional Thai musical instruments', 'Ruby (programming language)'], 'banjo': ['Old-time music'], 'prominent': ['Old-time music'], 'tunes': ['Old-time music'], 'native': ['Old-time music'], 'appalachian': ['Old-time music'], 'mountain': ['Old-time music'], '19th': ['Old-time music'], 'century': ['Old-time music', 'Arabic music', 'List of dystopian music, TV programs, and games', 'Indian classical music'], 'region': ['Old-time music', 'Arabic music', 'Time travel', 'Endoglin', 'Traditional Thai musical instruments'], 'include': ['Old-time music', 'Python (programming language)', 'Personal computer', '2006 in music', 'Ruby (programming language)'], 'city': ['Old-time music', 'List of dystopian music, TV programs, and games'], 'tradition': ['Old-time music', 'Indian classical music'], 'bluegrass': ['Old-time music'], 'players': ['Old-time music', 'Georgia Bulldogs football', 'Spawning (computer gaming)', "Wake Forest Demon Deacons men's soccer"], 'finger': ['Old-time music'], 'dulcimer': ['Old-time music'], 'appalachia': ['Old-time music'], 'own': ['Old-time music', 'Time travel'], 'traditions': ['Old-time music', 'Indian classical music'], 'carolina': ['Old-time music'], 'virginia': ['Old-time music'], 'family': ['Old-time music'], 'tennessee': ['Old-time music'], 'established': ['Old-time music'], 'schools': ['Old-time music', 'Fisk University'], 'directed': ['Old-time music', 'Annie (musical)'], 'arabic': ['Arabic music'], 'arab': ['Arabic music'], 'islamic': ['Arabic music'], 'arabian': ['Arabic music'], 'middle': ['Arabic music', 'Voice classification in non-classical music'], 'notes': ['Arabic music', 'Indian classical music'], 'maqam': ['Arabic music'], 'notable': ['Arabic music'], 'system': ['Arabic music', 'C Sharp (programming language)', 'Voice classification in non-classical music', 'List of dystopian music, TV programs, and games', 'Python (programming language)', 'Indian classical music', 'Single-board computer', 'Covariance and contravariance (computer science)', 'Personal computer', 'Scores (computer virus)', 'Mode (computer interface)', 'Semaphore (programming)'], 'several': ['Arabic music', 'Python (programming language)'], 'oud': ['Arabic music'], 'tones': ['Arabic music'], 'scale': ['Arabic music', 'Indian classical music'], 'modern': ['Arabic music', 'Indian classical music'], 'tone': ['Arabic music'], 'western': ['Arabic music', 'Indian classical music'], 'european': ['Arabic music'], 'egypt': ['Arabic music'], 'cairo': ['Arabic music'], 'singers': ['Arabic music', 'Voice classification in non-classical music'], 'east': ['Arabic music'], 'quarter': ['Arabic music', '2009 Louisiana Tech Bulldogs football team', 'Personal computer'], 'scholars': ['Arabic music', 'Indian classical music'], 'morocco': ['Arabic music'], 'ajnas': ['Arabic music'], 'sharp': ['C Sharp (programming language)'], 'programming': ['C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Personal computer', 'Ruby (programming language)'], 'language': ['C Sharp (programming language)', 'B (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'functional': ['C Sharp (programming language)'], 'object': ['C Sharp (programming language)', 'Time travel', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'class': ['C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'microsoft': ['C Sharp (programming language)', 'Personal computer'], 'net': ['C Sharp (programming language)'], 'standard': ['C Sharp (programming language)', 'Dalmatian (dog)', 'Python (programming language)', 'Personal computer', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)'], 'ecma': ['C Sharp (programming language)'], 'iso': ['C Sharp (programming language)'], 'mono': ['C Sharp (programming language)'], 'open': ['C Sharp (programming language)'], 'source': ['C Sharp (programming language)'], 'compiler': ['C Sharp (programming language)', 'Covariance and contravariance (computer science)'], 'runtime': ['C Sharp (programming language)', 'Covariance and contravariance (computer science)'], 'languages': ['C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)'], 'infrastructure': ['C Sharp (programming language)'], 'cli': ['C Sharp (programming language)'], 'design': ['C Sharp (programming language)', 'Python (programming language)', 'Ruby (programming language)', 'Mode (computer interface)'], 'support': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'type': ['C Sharp (programming language)', 'Voice classification in non-classical music', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)'], 'variables': ['C Sharp (programming language)', 'Ruby (programming language)'], 'garbage': ['C Sharp (programming language)'], 'very': ['C Sharp (programming language)'], 'code': ['C Sharp (programming language)', 'Python (programming language)', 'Ruby (programming language)'], 'programmers': ['C Sharp (programming language)'], 'functions': ['C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)'], 'memory': ['C Sharp (programming language)', 'Personal computer', 'Digital photography'], 'framework': ['C Sharp (programming language)'], 'libraries': ['C Sharp (programming language)', 'Python (programming language)'], 'java': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'linq': ['C Sharp (programming language)'], 'expressions': ['C Sharp (programming language)', 'Python (programming language)'], 'methods': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'types': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)'], 'program': ['C Sharp (programming language)', 'Fisk University', 'Python (programming language)'], 'specification': ['C Sharp (programming language)'], 'implementation': ['C Sharp (programming language)', 'Python (programming language)', 'Ruby (programming language)'], 'classes': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'value': ['C Sharp (programming language)', 'Python (programming language)', 'Lua (programming language)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Semaphore (programming)'], 'does': ['C Sharp (programming language)', 'Time travel', 'Mode (computer interface)'], 'specific': ['C Sharp (programming language)', 'Covariance and contravariance (computer science)'], 'implicit': ['C Sharp (programming language)'], 'keyword': ['C Sharp (programming language)'], 'default': ['C Sharp (programming language)'], 'defined': ['C Sharp (programming language)', 'Ruby (programming language)'], 'unlike': ['C Sharp (programming language)'], 'static': ['C Sharp (programming language)'], 'method': ['C Sharp (programming language)', 'Python (programming language)', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'each': ['C Sharp (programming language)', 'Time travel', 'Python (programming language)', 'Indian classical music', 'Covariance and contravariance (computer science)'], 'namespace': ['C Sharp (programming language)'], 'reference': ['C Sharp (programming language)', 'Python (programming language)'], 'instance': ['C Sharp (programming language)', 'Ruby (programming language)'], 'console': ['C Sharp (programming language)'], 'saturday': ['List of Saturday Night Live musical sketches'], 'becker': ['Joe Becker (musician)'], 'joe': ['Joe Becker (musician)', '2009 Louisiana Tech Bulldogs football team'], 'soundtrack': ['Joe Becker (musician)'], 'horror': ['Joe Becker (musician)'], 'mls': ['Will Johnson (soccer)', "Wake Forest Demon Deacons men's soccer"], 'scored': ['Will Johnson (soccer)'], 'goal': ['Will Johnson (soccer)'], 'real': ['Will Johnson (soccer)', 'Time travel', 'Comparison of programming languages (basic instructions)'], 'salt': ['Will Johnson (soccer)'], 'lake': ['Will Johnson (soccer)'], 'cup': ['Will Johnson (soccer)'], '2013': ['Will Johnson (soccer)', 'List of dystopian music, TV programs, and games', 'Alex Turner (musician)', "Wake Forest Demon Deacons men's soccer"], '2016': ['Will Johnson (soccer)', 'Alex Turner (musician)', "Wake Forest Demon Deacons men's soccer"], 'fiskerton': ['Fiskerton, Lincolnshire'], 'thompson': ['B (programming language)'], 'ritchie': ['B (programming language)'], 'bcpl': ['B (programming language)'], 'pdp': ['B (programming language)'], 'version': ['B (programming language)', 'Annie (musical)', 'Python (programming language)', 'The Hunchback of Notre Dame (musical)', 'Ruby (programming language)'], 'wright': ['Richard Wright (musician)'], 'pink': ['Richard Wright (musician)'], 'floyd': ['Richard Wright (musician)'], 'waters': ['Richard Wright (musician)'], 'mason': ['Richard Wright (musician)'], 'joined': ['Richard Wright (musician)', 'Alex Turner (musician)', 'Tony Kaye (musician)'], 'barrett': ['Richard Wright (musician)'], 'him': ['Richard Wright (musician)', 'List of dystopian music, TV programs, and games', 'Annie (musical)', 'Alex Turner (musician)'], 'gilmour': ['Richard Wright (musician)'], 'wall': ['Richard Wright (musician)'], 'full': ['Richard Wright (musician)'], 'division': ['Richard Wright (musician)', 'Georgia Bulldogs football', 'Python (programming language)'], 'bell': ['Richard Wright (musician)'], 'sessions': ['Richard Wright (musician)'], 'farfisa': ['Richard Wright (musician)'], 'hammond': ['Richard Wright (musician)', 'Tony Kaye (musician)'], 'play': ['Richard Wright (musician)', 'Annie (musical)'], 'piano': ['Richard Wright (musician)', 'Tony Kaye (musician)'], 'organ': ['Richard Wright (musician)'], 'vocals': ['Richard Wright (musician)', 'Steve Perry (musician)', 'David Gray (musician)', 'Joseph Williams (musician)'], 'keyboards': ['Richard Wright (musician)', 'Tony Kaye (musician)'], 'voice': ['Voice classification in non-classical music', 'Steve Perry (musician)', 'Alex Turner (musician)'], 'classification': ['Voice classification in non-classical music'], 'non': ['Voice classification in non-classical music'], 'systems': ['Voice classification in non-classical music', 'Indian classical music', 'Personal computer', 'Solver (computer science)'], 'voices': ['Voice classification in non-classical music'], 'within': ['Voice classification in non-classical music'], 'choral': ['Voice classification in non-classical music'], 'men': ['Voice classification in non-classical music'], 'mezzo': ['Voice classification in non-classical music'], 'contralto': ['Voice classification in non-classical music'], 'tenor': ['Voice classification in non-classical music', '2007 in music'], 'categories': ['Voice classification in non-classical music'], 'alto': ['Voice classification in non-classical music'], 'sing': ['Voice classification in non-classical music', '1936 in music'], 'line': ['Voice classification in non-classical music', 'Ruby (programming language)'], 'below': ['Voice classification in non-classical music'], 'list': ['Voice classification in non-classical music', 'Python (programming language)', 'List of gospel musicians', 'Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'dalmatian': ['Dalmatian (dog)'], 'breed': ['Dalmatian (dog)', 'Guide dog'], 'liver': ['Dalmatian (dog)'], 'spots': ['Dalmatian (dog)'], 'breeds': ['Dalmatian (dog)'], 'dalmatians': ['Dalmatian (dog)'], 'kennel': ['Dalmatian (dog)'], 'club': ['Dalmatian (dog)', 'Steven Cohen (soccer)', 'Les Cousins (music club)'], 'akc': ['Dalmatian (dog)'], 'color': ['Dalmatian (dog)', 'Digital photography'], 'puppies': ['Dalmatian (dog)'], 'health': ['Dalmatian (dog)'], 'deafness': ['Dalmatian (dog)'], 'hearing': ['Dalmatian (dog)'], 'hyperuricemia': ['Dalmatian (dog)'], 'uric': ['Dalmatian (dog)'], 'acid': ['Dalmatian (dog)'], 'backcross': ['Dalmatian (dog)'], 'horses': ['Dalmatian (dog)'], 'fire': ['Dalmatian (dog)', 'Steve Perry (musician)'], '1936': ['1936 in music'], 'symphony': ['1936 in music'], 'concerto': ['1936 in music', '1996 in music', '2008 in music'], 'cole': ['1936 in music'], 'introduced': ['1936 in music', 'Personal computer'], 'shirley': ['1936 in music'], 'dorothy': ['1936 in music'], 'fields': ['1936 in music'], 'jerome': ['1936 in music'], 'kern': ['1936 in music'], 'fred': ['1936 in music'], 'astaire': ['1936 in music'], 'swing': ['1936 in music'], 'your': ['1936 in music'], 'ginger': ['1936 in music'], 'rogers': ['1936 in music'], 'irving': ['1936 in music'], 'berlin': ['1936 in music', 'The Hunchback of Notre Dame (musical)'], 'follow': ['1936 in music'], 'fleet': ['1936 in music'], 'richard': ['1936 in music', 'Alex Turner (musician)'], 'johnny': ['1936 in music'], 'bing': ['1936 in music'], 'crosby': ['1936 in music'], 'jack': ['1936 in music', '1996 in music'], 'quartet': ['1936 in music'], 'starring': ['1936 in music'], 'guide': ['Guide dog'], 'assistance': ['Guide dog'], 'trained': ['Guide dog'], 'training': ['Guide dog'], 'service': ['Guide dog'], 'public': ['Guide dog'], 'animal': ['Guide dog', 'Covariance and contravariance (computer science)'], 'german': ['Guide dog', 'The Hunchback of Notre Dame (musical)'], 'access': ['Guide dog'], 'labrador': ['Guide dog'], 'act': ['Guide dog'], 'rights': ['Guide dog'], 'allowed': ['Guide dog'], 'dystopian': ['List of dystopian music, TV programs, and games'], 'games': ['List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Spawning (computer gaming)'], 'role': ['List of dystopian music, TV programs, and games', 'Annie (musical)', 'Endoglin'], 'dystopia': ['List of dystopian music, TV programs, and games'], 'living': ['List of dystopian music, TV programs, and games'], 'society': ['List of dystopian music, TV programs, and games'], '2000': ['List of dystopian music, TV programs, and games', 'Annie (musical)'], 'future': ['List of dystopian music, TV programs, and games', 'Time travel'], 'government': ['List of dystopian music, TV programs, and games'], 'space': ['List of dystopian music, TV programs, and games', 'Time travel', 'Digital photography'], 'set': ['List of dystopian music, TV programs, and games', 'Traditional Thai musical instruments'], '1984': ['List of dystopian music, TV programs, and games'], 'orwell': ['List of dystopian music, TV programs, and games'], 'book': ['List of dystopian music, TV programs, and games', 'Annie (musical)'], '2010': ['List of dystopian music, TV programs, and games', 'Annie (musical)'], 'concept': ['List of dystopian music, TV programs, and games', 'Time travel'], 'shooter': ['List of dystopian music, TV programs, and games'], 'fighting': ['List of dystopian music, TV programs, and games'], 'organization': ['List of dystopian music, TV programs, and games'], '1987': ['List of dystopian music, TV programs, and games'], 'planet': ['List of dystopian music, TV programs, and games'], 'corporate': ['List of dystopian music, TV programs, and games'], 'controlled': ['List of dystopian music, TV programs, and games'], 'syndicate': ['List of dystopian music, TV programs, and games'], 'technology': ['List of dystopian music, TV programs, and games', 'Digital photography'], 'nuclear': ['List of dystopian music, TV programs, and games'], 'apocalyptic': ['List of dystopian music, TV programs, and games'], 'utopia': ['List of dystopian music, TV programs, and games'], 'main': ['List of dystopian music, TV programs, and games'], 'artificial': ['List of dystopian music, TV programs, and games'], 'evil': ['List of dystopian music, TV programs, and games'], 'global': ['List of dystopian music, TV programs, and games'], 'humanity': ['List of dystopian music, TV programs, and games'], 'point': ['List of dystopian music, TV programs, and games', '2009 Louisiana Tech Bulldogs football team', 'Time travel', 'Comparison of programming languages (basic instructions)'], 'control': ['List of dystopian music, TV programs, and games'], 'zero': ['List of dystopian music, TV programs, and games'], 'take': ['List of dystopian music, TV programs, and games', 'Digital photography'], 'back': ['List of dystopian music, TV programs, and games', 'Time travel', 'Annie (musical)', '2007 in music'], 'alternate': ['List of dystopian music, TV programs, and games'], 'alien': ['List of dystopian music, TV programs, and games'], 'citizens': ['List of dystopian music, TV programs, and games'], 'police': ['List of dystopian music, TV programs, and games'], 'rule': ['List of dystopian music, TV programs, and games', 'Covariance and contravariance (computer science)'], 'protagonist': ['List of dystopian music, TV programs, and games'], 'order': ['List of dystopian music, TV programs, and games'], 'dark': ['List of dystopian music, TV programs, and games'], '2015': ['List of dystopian music, TV programs, and games', "Wake Forest Demon Deacons men's soccer"], 'ruled': ['List of dystopian music, TV programs, and games'], 'television': ['List of dystopian music, TV programs, and games', '2006 in music'], 'present': ['List of dystopian music, TV programs, and games', 'Time travel'], 'under': ['List of dystopian music, TV programs, and games'], 'episode': ['List of dystopian music, TV programs, and games', 'Annie (musical)'], 'bbc': ['List of dystopian music, TV programs, and games'], 'now': ['List of dystopian music, TV programs, and games', 'Annie (musical)'], 'universe': ['List of dystopian music, TV programs, and games'], 'state': ['List of dystopian music, TV programs, and games', '2009 Louisiana Tech Bulldogs football team', 'Mode (computer interface)'], 'economic': ['List of dystopian music, TV programs, and games'], 'collapse': ['List of dystopian music, TV programs, and games'], 'crime': ['List of dystopian music, TV programs, and games'], 'left': ['List of dystopian music, TV programs, and games', 'Tony Kaye (musician)'], 'oppressive': ['List of dystopian music, TV programs, and games'], 'over': ['List of dystopian music, TV programs, and games', 'Georgia Bulldogs football', 'Annie (musical)', 'Personal computer', 'Ruby (programming language)'], 'population': ['List of dystopian music, TV programs, and games'], 'begins': ['List of dystopian music, TV programs, and games', '2006 in music'], 'virus': ['List of dystopian music, TV programs, and games', 'Scores (computer virus)'], 'race': ['List of dystopian music, TV programs, and games'], 'prevent': ['List of dystopian music, TV programs, and games'], 'person': ['List of dystopian music, TV programs, and games', 'Time travel'], 'deus': ['List of dystopian music, TV programs, and games'], 'cohen': ['Steven Cohen (soccer)'], 'daily': ['Steven Cohen (soccer)'], 'liverpool': ['Steven Cohen (soccer)'], 'perry': ['Steve Perry (musician)'], 'journey': ['Steve Perry (musician)'], '1998': ['Steve Perry (musician)', 'Annie (musical)'], 'greatest': ['Steve Perry (musician)'], 'wrote': ['Steve Perry (musician)', 'Alex Turner (musician)', 'Sean Delaney (musician)'], 'never': ['Steve Perry (musician)', 'Annie (musical)'], 'trial': ['Steve Perry (musician)'], 'sherrie': ['Steve Perry (musician)'], 'steve': ['Steve Perry (musician)'], 'red': ['2009 Louisiana Tech Bulldogs football team', 'Georgia Bulldogs football'], 'pass': ['2009 Louisiana Tech Bulldogs football team'], 'dennis': ['2009 Louisiana Tech Bulldogs football team'], 'morris': ['2009 Louisiana Tech Bulldogs football team'], 'porter': ['2009 Louisiana Tech Bulldogs football team'], 'williams': ['2009 Louisiana Tech Bulldogs football team', 'Joseph Williams (musician)'], '1st': ['2009 Louisiana Tech Bulldogs football team'], 'aub': ['2009 Louisiana Tech Bulldogs football team'], 'wes': ['2009 Louisiana Tech Bulldogs football team'], 'byrum': ['2009 Louisiana Tech Bulldogs football team'], 'ross': ['2009 Louisiana Tech Bulldogs football team'], 'nelson': ['2009 Louisiana Tech Bulldogs football team'], 'kick': ['2009 Louisiana Tech Bulldogs football team'], 'navy': ['2009 Louisiana Tech Bulldogs football team'], 'return': ['2009 Louisiana Tech Bulldogs football team', 'Covariance and contravariance (computer science)'], 'nev': ['2009 Louisiana Tech Bulldogs football team'], 'kyle': ['2009 Louisiana Tech Bulldogs football team'], 'bsu': ['2009 Louisiana Tech Bulldogs football team'], 'brotzman': ['2009 Louisiana Tech Bulldogs football team'], 'fres': ['2009 Louisiana Tech Bulldogs football team'], 'goessling': ['2009 Louisiana Tech Bulldogs football team'], 'gray': ['David Gray (musician)'], 'ladder': ['David Gray (musician)'], 'sell': ['David Gray (musician)'], 'backing': ['David Gray (musician)'], 'georgia': ['Georgia Bulldogs football'], 'football': ['Georgia Bulldogs football'], 'bowl': ['Georgia Bulldogs football'], 'athletic': ['Georgia Bulldogs football'], 'conference': ['Georgia Bulldogs football'], 'sec': ['Georgia Bulldogs football'], 'sanford': ['Georgia Bulldogs football'], 'uga': ['Georgia Bulldogs football'], 'championships': ['Georgia Bulldogs football'], '1980': ['Georgia Bulldogs football', 'Charles McPherson (musician)'], 'champion': ['Georgia Bulldogs football'], '1920': ['Georgia Bulldogs football'], 'won': ['Georgia Bulldogs football'], 'tied': ['Georgia Bulldogs football'], 'bulldog': ['Georgia Bulldogs football'], 'times': ['Georgia Bulldogs football', 'Alex Turner (musician)'], 'championship': ['Georgia Bulldogs football'], 'head': ['Georgia Bulldogs football'], 'vince': ['Georgia Bulldogs football'], 'dooley': ['Georgia Bulldogs football'], 'coach': ['Georgia Bulldogs football', "Wake Forest Demon Deacons men's soccer"], 'hall': ['Georgia Bulldogs football', 'Fisk University'], 'fame': ['Georgia Bulldogs football'], 'inducted': ['Georgia Bulldogs football'], 'fans': ['Georgia Bulldogs football'], 'silver': ['Georgia Bulldogs football'], 'britches': ['Georgia Bulldogs football'], 'changed': ['Georgia Bulldogs football'], 'uniform': ['Georgia Bulldogs football'], 'pants': ['Georgia Bulldogs football'], 'helmet': ['Georgia Bulldogs football'], 'jerseys': ['Georgia Bulldogs football'], 'stripe': ['Georgia Bulldogs football'], 'numbers': ['Georgia Bulldogs football'], 'travel': ['Time travel'], 'fiction': ['Time travel'], 'idea': ['Time travel'], 'past': ['Time travel'], 'possible': ['Time travel', 'Covariance and contravariance (computer science)'], 'forward': ['Time travel'], 'special': ['Time travel'], 'relativity': ['Time travel'], 'backward': ['Time travel'], 'allow': ['Time travel', 'Covariance and contravariance (computer science)'], 'traveling': ['Time travel'], 'spacetime': ['Time travel'], 'physics': ['Time travel'], 'quantum': ['Time travel'], 'mechanics': ['Time travel'], 'wormholes': ['Time travel'], 'means': ['Time travel'], 'because': ['Time travel', 'Covariance and contravariance (computer science)'], 'traveler': ['Time travel'], 'events': ['Time travel'], 'clock': ['Time travel'], 'might': ['Time travel'], 'physicists': ['Time travel'], 'possibility': ['Time travel'], 'closed': ['Time travel', 'Annie (musical)'], 'curves': ['Time travel'], 'causality': ['Time travel'], 'grandfather': ['Time travel'], 'paradox': ['Time travel'], 'novikov': ['Time travel'], 'self': ['Time travel'], 'principle': ['Time travel', 'Ruby (programming language)'], 'worlds': ['Time travel'], 'interpretation': ['Time travel'], 'faster': ['Time travel'], 'speed': ['Time travel'], 'light': ['Time travel', 'Sun dog'], 'gravity': ['Time travel'], 'effects': ['Time travel'], 'hawking': ['Time travel'], 'exist': ['Time travel'], 'wormhole': ['Time travel'], 'dilation': ['Time travel'], 'either': ['Time travel'], 'matter': ['Time travel'], 'existence': ['Time travel'], 'negative': ['Time travel', 'Python (programming language)'], 'energy': ['Time travel'], 'argued': ['Time travel'], 'could': ['Time travel', 'Covariance and contravariance (computer science)', 'Personal computer'], 'violation': ['Time travel'], 'impossible': ['Time travel'], 'event': ['Time travel'], 'information': ['Time travel'], 'travelers': ['Time travel'], 'experiment': ['Time travel'], 'photons': ['Time travel'], 'philosophers': ['Time travel'], 'presentism': ['Time travel'], 'fisk': ['Fisk University'], 'nashville': ['Fisk University'], 'campus': ['Fisk University'], 'historic': ['Fisk University'], 'african': ['Fisk University'], 'association': ['Fisk University'], 'colleges': ['Fisk University'], 'education': ['Fisk University'], 'student': ['Fisk University', 'Semaphore (programming)'], 'students': ['Fisk University', 'Semaphore (programming)'], 'arts': ['Fisk University', 'The Hunchback of Notre Dame (musical)'], 'building': ['Fisk University'], 'built': ['Fisk University'], 'president': ['Fisk University'], 'stieglitz': ['Fisk University'], 'collection': ['Fisk University'], 'annie': ['Annie (musical)'], 'broadway': ['Annie (musical)', '1996 in music', 'The Hunchback of Notre Dame (musical)', '2006 in music'], 'orphan': ['Annie (musical)'], 'charnin': ['Annie (musical)'], 'meehan': ['Annie (musical)'], 'original': ['Annie (musical)', 'Lua (programming language)', 'The Hunchback of Notre Dame (musical)', '2006 in music'], '1977': ['Annie (musical)', 'Personal computer'], 'tours': ['Annie (musical)'], 'tomorrow': ['Annie (musical)'], 'knock': ['Annie (musical)'], 'orphanage': ['Annie (musical)'], 'orphans': ['Annie (musical)'], 'molly': ['Annie (musical)'], 'pepper': ['Annie (musical)'], 'tells': ['Annie (musical)'], 'parents': ['Annie (musical)'], 'maybe': ['Annie (musical)'], 'miss': ['Annie (musical)'], 'hannigan': ['Annie (musical)'], 'reprise': ['Annie (musical)'], 'grace': ['Annie (musical)'], 'farrell': ['Annie (musical)'], 'oliver': ['Annie (musical)'], 'warbucks': ['Annie (musical)'], 'christmas': ['Annie (musical)', 'Ruby (programming language)'], 'rooster': ['Annie (musical)'], 'lily': ['Annie (musical)'], 'fully': ['Annie (musical)'], 'dressed': ['Annie (musical)'], 'without': ['Annie (musical)', 'Digital photography'], 'smile': ['Annie (musical)'], 'shows': ['Annie (musical)'], 'character': ['Annie (musical)'], 'novelisation': ['Annie (musical)'], 'title': ['Annie (musical)'], 'producers': ['Annie (musical)', 'Semaphore (programming)'], 'starred': ['Annie (musical)'], 'daddy': ['Annie (musical)'], 'ann': ['Annie (musical)'], 'until': ['Annie (musical)'], 'company': ['Annie (musical)'], '1978': ['Annie (musical)', 'Sean Delaney (musician)'], '1979': ['Annie (musical)'], '1981': ['Annie (musical)'], '1982': ['Annie (musical)'], 'cast': ['Annie (musical)', 'The Hunchback of Notre Dame (musical)'], '1997': ['Annie (musical)'], 'anniversary': ['Annie (musical)'], 'nell': ['Annie (musical)'], 'carter': ['Annie (musical)'], '1999': ['Annie (musical)', 'The Hunchback of Notre Dame (musical)'], '2011': ['Annie (musical)', 'Alex Turner (musician)'], '2012': ['Annie (musical)', 'Alex Turner (musician)', 'Python (programming language)', 'Indian classical music', 'The Mandogs'], 'references': ['Annie (musical)'], 'turner': ['Alex Turner (musician)'], 'arctic': ['Alex Turner (musician)'], 'monkeys': ['Alex Turner (musician)'], 'side': ['Alex Turner (musician)'], 'shadow': ['Alex Turner (musician)'], 'puppets': ['Alex Turner (musician)'], 'friends': ['Alex Turner (musician)'], 'sheffield': ['Alex Turner (musician)'], 'stone': ['Alex Turner (musician)'], 'tranquility': ['Alex Turner (musician)'], 'base': ['Alex Turner (musician)'], 'hotel': ['Alex Turner (musician)'], '2018': ['Alex Turner (musician)', 'Lua (programming language)'], 'summer': ['Alex Turner (musician)'], 'miles': ['Alex Turner (musician)'], 'kane': ['Alex Turner (musician)'], 'age': ['Alex Turner (musician)'], 'come': ['Alex Turner (musician)', 'Ruby (programming language)'], 'savior': ['Alex Turner (musician)'], 'father': ['Alex Turner (musician)'], 'helders': ['Alex Turner (musician)'], 'nicholson': ['Alex Turner (musician)'], 'noted': ['Alex Turner (musician)'], 'too': ['Alex Turner (musician)'], 'writing': ['Alex Turner (musician)'], 'get': ['Alex Turner (musician)'], 'working': ['Alex Turner (musician)'], 'clarke': ['Alex Turner (musician)'], 'attention': ['Alex Turner (musician)'], 'ford': ['Alex Turner (musician)'], 'remarked': ['Alex Turner (musician)'], 'petridis': ['Alex Turner (musician)'], 'guardian': ['Alex Turner (musician)'], 'writer': ['Alex Turner (musician)'], 'pitchfork': ['Alex Turner (musician)'], 'los': ['Alex Turner (musician)'], 'angeles': ['Alex Turner (musician)'], 'python': ['Python (programming language)', 'Ruby (programming language)'], 'van': ['Python (programming language)'], 'rossum': ['Python (programming language)'], 'philosophy': ['Python (programming language)'], 'multiple': ['Python (programming language)', 'Covariance and contravariance (computer science)'], 'library': ['Python (programming language)'], 'supported': ['Python (programming language)'], 'available': ['Python (programming language)', 'Personal computer', 'Digital photography', 'Semaphore (programming)'], 'community': ['Python (programming language)'], 'cpython': ['Python (programming language)'], 'software': ['Python (programming language)', 'Lua (programming language)', 'Personal computer'], 'uses': ['Python (programming language)', 'Ruby (programming language)'], 'variable': ['Python (programming language)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)', 'Semaphore (programming)'], 'names': ['Python (programming language)'], 'modules': ['Python (programming language)'], 'better': ['Python (programming language)'], 'applications': ['Python (programming language)', 'Lua (programming language)', 'Personal computer'], 'interpreter': ['Python (programming language)', 'Ruby (programming language)'], 'syntax': ['Python (programming language)', 'Lua (programming language)', 'Ruby (programming language)'], 'written': ['Python (programming language)', 'Ruby (programming language)'], 'spam': ['Python (programming language)'], 'eggs': ['Python (programming language)'], 'statements': ['Python (programming language)', 'Comparison of programming languages (basic instructions)'], 'indentation': ['Python (programming language)'], 'block': ['Python (programming language)', 'Ruby (programming language)'], 'assignment': ['Python (programming language)'], 'statement': ['Python (programming language)'], 'objects': ['Python (programming language)', 'Covariance and contravariance (computer science)'], 'strings': ['Python (programming language)', 'Comparison of programming languages (basic instructions)'], 'function': ['Python (programming language)', 'Lua (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)'], 'operator': ['Python (programming language)'], 'import': ['Python (programming language)'], 'module': ['Python (programming language)'], 'integer': ['Python (programming language)', 'Comparison of programming languages (basic instructions)'], 'expression': ['Python (programming language)', 'Endoglin', 'Indian classical music'], 'blah': ['Python (programming language)'], 'index': ['Python (programming language)'], 'scripting': ['Python (programming language)', 'Lua (programming language)'], 'processing': ['Python (programming language)', 'Digital photography'], 'web': ['Python (programming language)'], 'implementations': ['Python (programming language)', 'Ruby (programming language)'], 'package': ['Python (programming language)'], 'programs': ['Python (programming language)', 'Covariance and contravariance (computer science)'], 'compiles': ['Python (programming language)'], '978': ['Python (programming language)', 'Indian classical music', 'Lua (programming language)'], 'hooper': ['Tom Hooper (musician)'], 'endoglin': ['Endoglin'], 'cell': ['Endoglin'], 'tgf': ['Endoglin'], 'beta': ['Endoglin'], 'receptor': ['Endoglin'], 'complex': ['Endoglin', 'Covariance and contravariance (computer science)'], 'tumor': ['Endoglin'], 'growth': ['Endoglin'], 'cancer': ['Endoglin', '2008 in music'], 'cells': ['Endoglin'], 'gene': ['Endoglin', 'Sean Delaney (musician)'], 'extracellular': ['Endoglin'], 'domain': ['Endoglin'], 'cytoplasmic': ['Endoglin'], 'bmp': ['Endoglin'], 'binding': ['Endoglin'], 'bind': ['Endoglin'], 'cellular': ['Endoglin'], 'indian': ['Indian classical music'], 'subcontinent': ['Indian classical music'], 'india': ['Indian classical music'], 'hindustani': ['Indian classical music'], 'south': ['Indian classical music'], 'carnatic': ['Indian classical music'], '16th': ['Indian classical music'], 'raga': ['Indian classical music'], 'hinduism': ['Indian classical music'], 'ancient': ['Indian classical music'], 'natyashastra': ['Indian classical music'], 'sanskrit': ['Indian classical music'], 'text': ['Indian classical music', 'Personal computer', 'Mode (computer interface)'], 'tala': ['Indian classical music'], 'melodic': ['Indian classical music'], 'structure': ['Indian classical music', 'Covariance and contravariance (computer science)'], 'texts': ['Indian classical music'], 'swaras': ['Indian classical music'], 'octave': ['Indian classical music'], 'ragas': ['Indian classical music'], 'according': ['Indian classical music', 'Personal computer'], 'talas': ['Indian classical music'], 'hindu': ['Indian classical music'], 'persian': ['Indian classical music'], 'press': ['Indian classical music'], 'cs1': ['Indian classical music'], 'maint': ['Indian classical music'], 'ref': ['Indian classical music'], 'harv': ['Indian classical music'], 'oxford': ['Indian classical music'], 'moutal': ['Indian classical music'], 'patrick': ['Indian classical music'], 'sun': ['Sun dog'], 'parhelia': ['Sun dog'], 'halo': ['Sun dog'], 'ice': ['Sun dog'], 'crystals': ['Sun dog'], 'suns': ['Sun dog'], 'weather': ['Sun dog'], '1996': ['1996 in music'], 'madonna': ['1996 in music', '2006 in music'], 'kiss': ['1996 in music', 'Sean Delaney (musician)'], 'reunion': ['1996 in music'], 'mtv': ['1996 in music', '2006 in music'], 'lua': ['Lua (programming language)'], 'api': ['Lua (programming language)'], 'extension': ['Lua (programming language)'], 'ierusalimschy': ['Lua (programming language)'], 'tecgraf': ['Lua (programming language)'], 'table': ['Lua (programming language)'], 'values': ['Lua (programming language)'], 'array': ['Lua (programming language)', 'Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)', 'Ruby (programming language)'], 'loop': ['Lua (programming language)'], 'nil': ['Lua (programming language)'], 'stack': ['Lua (programming language)'], 'archived': ['Lua (programming language)'], 'board': ['Single-board computer'], 'embedded': ['Single-board computer'], 'plug': ['Single-board computer'], 'backplane': ['Single-board computer'], 'sbcs': ['Single-board computer'], 'motherboard': ['Single-board computer', 'Personal computer'], 'cards': ['Single-board computer', 'Personal computer', 'Digital photography'], 'toto': ['Joseph Williams (musician)'], 'compilation': ['Joseph Williams (musician)'], '2006': ['Joseph Williams (musician)', '2006 in music'], 'hunchback': ['The Hunchback of Notre Dame (musical)'], 'notre': ['The Hunchback of Notre Dame (musical)'], 'dame': ['The Hunchback of Notre Dame (musical)'], 'disney': ['The Hunchback of Notre Dame (musical)'], 'der': ['The Hunchback of Notre Dame (musical)'], 'glöckner': ['The Hunchback of Notre Dame (musical)'], 'premiere': ['The Hunchback of Notre Dame (musical)'], 'playhouse': ['The Hunchback of Notre Dame (musical)'], 'king': ['The Hunchback of Notre Dame (musical)'], 'quasimodo': ['The Hunchback of Notre Dame (musical)'], 'nominations': ['The Hunchback of Notre Dame (musical)'], 'subtyping': ['Covariance and contravariance (computer science)'], 'cat': ['Covariance and contravariance (computer science)'], 'subtype': ['Covariance and contravariance (computer science)'], 'should': ['Covariance and contravariance (computer science)'], 'variance': ['Covariance and contravariance (computer science)'], 'how': ['Covariance and contravariance (computer science)', 'Personal computer'], 'constructor': ['Covariance and contravariance (computer science)'], 'ocaml': ['Covariance and contravariance (computer science)'], 'covariant': ['Covariance and contravariance (computer science)'], 'contravariant': ['Covariance and contravariance (computer science)'], 'parameter': ['Covariance and contravariance (computer science)'], 'consider': ['Covariance and contravariance (computer science)'], 'rules': ['Covariance and contravariance (computer science)'], 'arrays': ['Covariance and contravariance (computer science)'], 'inheritance': ['Covariance and contravariance (computer science)'], 'generic': ['Covariance and contravariance (computer science)'], 'constructors': ['Covariance and contravariance (computer science)'], 'instead': ['Covariance and contravariance (computer science)', 'Comparison of programming languages (basic instructions)'], 'invariant': ['Covariance and contravariance (computer science)'], 'contravariance': ['Covariance and contravariance (computer science)'], 'useful': ['Covariance and contravariance (computer science)'], 'safe': ['Covariance and contravariance (computer science)'], 'ilist': ['Covariance and contravariance (computer science)'], 'interface': ['Covariance and contravariance (computer science)', 'Mode (computer interface)'], 'declared': ['Covariance and contravariance (computer science)'], 'parameters': ['Covariance and contravariance (computer science)'], 'above': ['Covariance and contravariance (computer science)'], 'interfaces': ['Covariance and contravariance (computer science)'], 'argument': ['Covariance and contravariance (computer science)'], 'read': ['Covariance and contravariance (computer science)'], 'write': ['Covariance and contravariance (computer science)'], 'immutable': ['Covariance and contravariance (computer science)'], 'generics': ['Covariance and contravariance (computer science)'], 'covariantly': ['Covariance and contravariance (computer science)'], 'check': ['Covariance and contravariance (computer science)'], 'error': ['Covariance and contravariance (computer science)', 'Mode (computer interface)'], 'covariance': ['Covariance and contravariance (computer science)'], 'parameterized': ['Covariance and contravariance (computer science)'], 'need': ['Covariance and contravariance (computer science)'], 'displaystyle': ['Covariance and contravariance (computer science)'], 'leq': ['Covariance and contravariance (computer science)'], 'must': ['Covariance and contravariance (computer science)'], 'overriding': ['Covariance and contravariance (computer science)'], 'scala': ['Covariance and contravariance (computer science)'], 'compareto': ['Covariance and contravariance (computer science)'], 'comparable': ['Covariance and contravariance (computer science)'], 'provide': ['Covariance and contravariance (computer science)', 'Personal computer'], 'dispatch': ['Covariance and contravariance (computer science)'], 'programmer': ['Covariance and contravariance (computer science)', 'Ruby (programming language)'], 'declaration': ['Covariance and contravariance (computer science)'], 'site': ['Covariance and contravariance (computer science)'], 'annotations': ['Covariance and contravariance (computer science)'], 'ienumerator': ['Covariance and contravariance (computer science)'], 'valid': ['Covariance and contravariance (computer science)'], 'contravariantly': ['Covariance and contravariance (computer science)'], 'wildcards': ['Covariance and contravariance (computer science)'], 'wildcard': ['Covariance and contravariance (computer science)'], 'extends': ['Covariance and contravariance (computer science)'], 'capture': ['Covariance and contravariance (computer science)', 'Digital photography'], 'personal': ['Personal computer'], 'capabilities': ['Personal computer'], 'price': ['Personal computer'], 'user': ['Personal computer', 'Mode (computer interface)'], 'users': ['Personal computer', 'Ruby (programming language)'], 'hardware': ['Personal computer'], 'operating': ['Personal computer'], 'still': ['Personal computer'], 'mobile': ['Personal computer'], 'intel': ['Personal computer'], 'market': ['Personal computer'], 'windows': ['Personal computer'], 'share': ['Personal computer'], 'apple': ['Personal computer'], 'linux': ['Personal computer'], 'digital': ['Personal computer', 'Digital photography'], 'ibm': ['Personal computer'], 'connected': ['Personal computer'], 'research': ['Personal computer'], 'expensive': ['Personal computer'], 'integrated': ['Personal computer'], 'small': ['Personal computer', 'Traditional Thai musical instruments'], 'word': ['Personal computer'], 'mouse': ['Personal computer'], 'required': ['Personal computer', 'Comparison of programming languages (basic instructions)'], 'business': ['Personal computer'], 'kit': ['Personal computer'], 'panel': ['Personal computer'], 'displays': ['Personal computer'], 'disk': ['Personal computer'], 'drives': ['Personal computer'], 'units': ['Personal computer'], '1973': ['Personal computer'], 'portable': ['Personal computer'], 'scamp': ['Personal computer'], 'apl': ['Personal computer'], 'processor': ['Personal computer'], 'drive': ['Personal computer'], 'keyboard': ['Personal computer', 'Tony Kaye (musician)', 'Mode (computer interface)'], 'desktop': ['Personal computer'], 'shipped': ['Personal computer'], 'display': ['Personal computer'], 'storage': ['Personal computer'], 'designed': ['Personal computer'], 'case': ['Personal computer'], 'mass': ['Personal computer'], 'card': ['Personal computer', 'Digital photography'], 'cost': ['Personal computer'], 'graphics': ['Personal computer'], 'unit': ['Personal computer'], 'processors': ['Personal computer'], 'laptop': ['Personal computer'], 'internet': ['Personal computer'], 'tasks': ['Personal computer'], 'pcs': ['Personal computer'], 'components': ['Personal computer'], 'external': ['Personal computer'], 'monitor': ['Personal computer'], 'screen': ['Personal computer'], 'usb': ['Personal computer'], 'gaming': ['Personal computer'], 'input': ['Personal computer'], 'devices': ['Personal computer'], 'laptops': ['Personal computer'], 'netbooks': ['Personal computer'], 'tablet': ['Personal computer'], 'pocket': ['Personal computer'], 'expansion': ['Personal computer'], 'application': ['Personal computer', 'Mode (computer interface)'], 'billion': ['Personal computer'], 'sales': ['Personal computer', '2008 in music'], 'shipments': ['Personal computer'], 'mandogs': ['The Mandogs'], 'hosts': ['The Mandogs'], 'naked': ['David Levi (musician)'], 'scores': ['Scores (computer virus)'], '1988': ['Scores (computer virus)'], 'photography': ['Digital photography', 'Wildlife photography'], 'cameras': ['Digital photography'], 'images': ['Digital photography'], 'lens': ['Digital photography'], 'photographic': ['Digital photography'], 'stored': ['Digital photography'], 'file': ['Digital photography'], 'photographs': ['Digital photography'], 'image': ['Digital photography'], 'typically': ['Digital photography'], 'consumer': ['Digital photography', 'Semaphore (programming)'], 'professional': ['Digital photography'], 'media': ['Digital photography'], 'camera': ['Digital photography'], 'format': ['Digital photography'], 'quality': ['Digital photography'], 'advanced': ['Digital photography'], 'semiconductor': ['Digital photography'], 'sensors': ['Digital photography'], 'device': ['Digital photography'], 'ccd': ['Digital photography'], 'sensor': ['Digital photography'], 'picture': ['Digital photography'], 'jpeg': ['Digital photography'], 'kodak': ['Digital photography'], 'resolution': ['Digital photography'], 'megapixels': ['Digital photography'], 'pixels': ['Digital photography'], 'nikon': ['Digital photography'], 'pictures': ['Digital photography'], 'photographers': ['Digital photography'], 'photos': ['Digital photography', 'Wildlife photography'], 'raw': ['Digital photography'], 'pixel': ['Digital photography'], 'print': ['Digital photography'], 'dynamic': ['Digital photography'], 'photo': ['Digital photography'], 'prints': ['Digital photography'], 'gamut': ['Digital photography'], 'ratio': ['Digital photography'], 'aspect': ['Digital photography'], 'crum': ['George Crum (musician)'], 'ballet': ['George Crum (musician)'], 'conducted': ['George Crum (musician)'], 'solver': ['Solver (computer science)'], 'problem': ['Solver (computer science)', 'Semaphore (programming)'], 'problems': ['Solver (computer science)'], 'solvers': ['Solver (computer science)'], 'linear': ['Solver (computer science)'], 'equations': ['Solver (computer science)'], 'wildlife': ['Wildlife photography'], 'thai': ['Traditional Thai musical instruments'], 'thailand': ['Traditional Thai musical instruments'], 'plucked': ['Traditional Thai musical instruments'], 'isan': ['Traditional Thai musical instruments'], 'northern': ['Traditional Thai musical instruments'], 'hardwood': ['Traditional Thai musical instruments'], 'northeast': ['Traditional Thai musical instruments'], 'bamboo': ['Traditional Thai musical instruments'], 'drum': ['Traditional Thai musical instruments'], 'hands': ['Traditional Thai musical instruments'], 'piphat': ['Traditional Thai musical instruments'], 'ensemble': ['Traditional Thai musical instruments'], 'klong': ['Traditional Thai musical instruments'], 'pair': ['Traditional Thai musical instruments'], 'frame': ['Traditional Thai musical instruments'], 'nora': ['Traditional Thai musical instruments'], 'tuned': ['Traditional Thai musical instruments'], 'gong': ['Traditional Thai musical instruments'], 'khong': ['Traditional Thai musical instruments'], 'bossed': ['Traditional Thai musical instruments'], 'gongs': ['Traditional Thai musical instruments'], 'ranat': ['Traditional Thai musical instruments'], 'instrument': ['Traditional Thai musical instruments'], 'wooden': ['Traditional Thai musical instruments'], 'khlui': ['Traditional Thai musical instruments'], 'reed': ['Traditional Thai musical instruments'], 'glong': ['Traditional Thai musical instruments'], 'landseer': ['Landseer (dog)'], 'newfoundland': ['Landseer (dog)'], 'charles': ['Charles McPherson (musician)'], 'mcpherson': ['Charles McPherson (musician)'], 'mingus': ['Charles McPherson (musician)'], 'prestige': ['Charles McPherson (musician)'], 'xanadu': ['Charles McPherson (musician)'], 'constants': ['Comparison of programming languages (basic instructions)'], 'int': ['Comparison of programming languages (basic instructions)'], 'short': ['Comparison of programming languages (basic instructions)'], 'long': ['Comparison of programming languages (basic instructions)'], 'size': ['Comparison of programming languages (basic instructions)'], 'max': ['Comparison of programming languages (basic instructions)'], 'width': ['Comparison of programming languages (basic instructions)'], 'bits': ['Comparison of programming languages (basic instructions)'], 'floating': ['Comparison of programming languages (basic instructions)'], 'precision': ['Comparison of programming languages (basic instructions)'], 'std': ['Comparison of programming languages (basic instructions)'], 'les': ['Les Cousins (music club)'], 'cousins': ['Les Cousins (music club)'], 'carr': ['Paul Carr (musician)'], 'usa': ['2006 in music'], 'australia': ['2006 in music', '2008 in music'], 'nelly': ['2006 in music'], 'furtado': ['2006 in music'], 'justin': ['2006 in music'], 'timberlake': ['2006 in music'], 'spawn': ['Spawning (computer gaming)'], 'enemies': ['Spawning (computer gaming)'], 'delaney': ['Sean Delaney (musician)'], 'sean': ['Sean Delaney (musician)'], 'simmons': ['Sean Delaney (musician)'], 'criss': ['Sean Delaney (musician)'], 'aucoin': ['Sean Delaney (musician)'], 'neil': ['Sean Delaney (musician)'], 'casablanca': ['Sean Delaney (musician)'], 'piper': ['Sean Delaney (musician)'], 'skatt': ['Sean Delaney (musician)'], 'bros': ['Sean Delaney (musician)'], 'kaye': ['Tony Kaye (musician)'], 'yes': ['Tony Kaye (musician)'], '1971': ['Tony Kaye (musician)'], 'badger': ['Tony Kaye (musician)'], 'detective': ['Tony Kaye (musician)'], 'badfinger': ['Tony Kaye (musician)'], '1994': ['Tony Kaye (musician)'], 'circa': ['Tony Kaye (musician)'], 'squire': ['Tony Kaye (musician)'], 'offer': ['Tony Kaye (musician)'], 'rabin': ['Tony Kaye (musician)'], '90125': ['Tony Kaye (musician)'], 'tribute': ['Tony Kaye (musician)'], 'danja': ['Danja (musician)'], 'timbaland': ['Danja (musician)'], 'ruby': ['Ruby (programming language)'], 'matsumoto': ['Ruby (programming language)'], 'perl': ['Ruby (programming language)'], 'exception': ['Ruby (programming language)'], 'handling': ['Ruby (programming language)'], 'rails': ['Ruby (programming language)'], 'changes': ['Ruby (programming language)'], 'hash': ['Ruby (programming language)'], 'added': ['Ruby (programming language)'], 'few': ['Ruby (programming language)'], 'least': ['Ruby (programming language)'], 'surprise': ['Ruby (programming language)'], 'metaprogramming': ['Ruby (programming language)'], 'exceptions': ['Ruby (programming language)'], 'jruby': ['Ruby (programming language)'], 'texture': ['Texture (music)'], 'parts': ['Texture (music)'], 'register': ['Register (music)'], 'mode': ['Mode (computer interface)'], 'modal': ['Mode (computer interface)'], 'lock': ['Mode (computer interface)'], 'keys': ['Mode (computer interface)'], 'modes': ['Mode (computer interface)'], 'modeless': ['Mode (computer interface)'], 'errors': ['Mode (computer interface)'], 'action': ['Mode (computer interface)'], 'raskin': ['Mode (computer interface)'], 'current': ['Mode (computer interface)'], 'change': ['Mode (computer interface)'], 'interaction': ['Mode (computer interface)'], 'command': ['Mode (computer interface)'], 'emacs': ['Mode (computer interface)'], 'window': ['Mode (computer interface)'], 'annual': ['2007 in music', '2008 in music'], 'indefinite': ['2007 in music'], 'genesis': ['2007 in music'], 'linkin': ['2007 in music'], 'park': ['2007 in music', '2008 in music'], 'duran': ['2007 in music'], 'violin': ['2008 in music'], 'saxophonist': ['2008 in music'], 'due': ['2008 in music'], 'heart': ['2008 in music'], 'attack': ['2008 in music'], 'trumpeter': ['2008 in music'], 'jamaican': ['2008 in music'], 'semaphore': ['Semaphore (programming)'], 'resource': ['Semaphore (programming)'], 'processes': ['Semaphore (programming)'], 'critical': ['Semaphore (programming)'], 'section': ['Semaphore (programming)'], 'process': ['Semaphore (programming)'], 'operations': ['Semaphore (programming)'], 'free': ['Semaphore (programming)'], 'wait': ['Semaphore (programming)'], 'semaphores': ['Semaphore (programming)'], 'dijkstra': ['Semaphore (programming)'], 'rooms': ['Semaphore (programming)'], 'room': ['Semaphore (programming)'], 'empty': ['Semaphore (programming)'], 'waiting': ['Semaphore (programming)'], 'resources': ['Semaphore (programming)'], 'operation': ['Semaphore (programming)'], 'queue': ['Semaphore (programming)'], 'emptycount': ['Semaphore (programming)'], 'fullcount': ['Semaphore (programming)'], 'usequeue': ['Semaphore (programming)'], 'mutex': ['Semaphore (programming)'], 'task': ['Semaphore (programming)'], 'wake': ["Wake Forest Demon Deacons men's soccer"], 'forest': ["Wake Forest Demon Deacons men's soccer"], 'deacons': ["Wake Forest Demon Deacons men's soccer"], 'acc': ["Wake Forest Demon Deacons men's soccer"], 'plays': ["Wake Forest Demon Deacons men's soccer"], 'usl': ["Wake Forest Demon Deacons men's soccer"]}
-
+# pageids takes one ID or several separated by |. Full plain text extracts come back
+# one per response whatever exlimit says, the rest of a batch follows through continue
+WIKI_API = "https://en.wikipedia.org/w/api.php?action=query&format=json&prop=extracts&pageids={}&formatversion=2&explaintext=1&exlimit=max"
+
+# Common English words that can be left out of keywords with _find_keywords(article, stopwords=STOPWORDS)
+STOPWORDS = frozenset([
+  'about', 'after', 'all', 'also', 'and', 'any', 'are', 'been', 'before', 'but', 'can', 'did', 'for',
+  'from', 'had', 'has', 'have', 'her', 'his', 'into', 'its', 'more', 'most', 'not', 'one', 'only',
+  'other', 'over', 'she', 'some', 'such', 'than', 'that', 'the', 'their', 'them', 'then', 'there',
+  'these', 'they', 'this', 'those', 'through', 'two', 'under', 'until', 'was', 'were', 'what', 'when',
+  'where', 'which', 'while', 'who', 'will', 'with', 'would', 'you', 'your'
+])
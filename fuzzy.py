@@ -0,0 +1,116 @@
+from index import default_compact_index, shared, _normalize
+from postings import union_all
+
+# Typo tolerant keyword lookups with a symmetric delete index, as in SymSpell.
+#
+# Every keyword is stored under each string obtained by deleting up to
+# MAX_DISTANCE characters from its first PREFIX_LENGTH characters. A query term
+# goes through the same deletions, and any keyword sharing one of those strings
+# is a candidate; candidates are then checked with the real edit distance. Two
+# words within edit distance d always share a string reachable with at most d
+# deletions from each, so no match is missed, and a lookup costs a few dozen
+# dictionary accesses whatever the size of the vocabulary. Cutting keywords to
+# a prefix keeps the number of stored deletions per keyword fixed.
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+
+def _deletes(word, max_distance):
+  """ Returns set of word and every string obtained by deleting up to max_distance of its characters
+  """
+  result = {word}
+  level = {word}
+  for _ in range(max_distance):
+    level = {variant[:i] + variant[i + 1:] for variant in level for i in range(len(variant))}
+    result |= level
+  return result
+
+def edit_distance(first, second, max_distance=None):
+  """Returns the optimal string alignment distance between two strings
+
+  Insertions, deletions, substitutions and swaps of two neighbouring characters
+  each count as one edit.
+
+  Args:
+    first, second - strings to compare
+    max_distance - stop early and return max_distance + 1 once the distance is
+                   known to exceed it
+  """
+  if max_distance is not None and abs(len(first) - len(second)) > max_distance:
+    return max_distance + 1
+  before = None
+  previous = list(range(len(second) + 1))
+  for i in range(1, len(first) + 1):
+    current = [i] + [0] * len(second)
+    for j in range(1, len(second) + 1):
+      cost = first[i - 1] != second[j - 1]
+      current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+      if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+        current[j] = min(current[j], before[j - 2] + 1)
+    if max_distance is not None and min(current) > max_distance:
+      return max_distance + 1
+    before, previous = previous, current
+  return previous[-1]
+
+class FuzzyIndex:
+  """ Delete index over the keywords of a CompactKeywordIndex, finding keywords within a small edit distance
+  """
+
+  def __init__(self, index, max_distance=MAX_DISTANCE, prefix_length=PREFIX_LENGTH):
+    """
+    Args:
+      index - CompactKeywordIndex whose keywords and posting lists are used
+      max_distance - largest edit distance lookups can ask for
+      prefix_length - number of leading characters of a keyword the deletions are taken from
+    """
+    self.index = index
+    self.max_distance = max_distance
+    self.prefix_length = prefix_length
+    self._deletes = {}
+    for keyword in index.keywords():
+      for variant in _deletes(keyword[:prefix_length], max_distance):
+        self._deletes.setdefault(variant, []).append(keyword)
+
+  def lookup(self, term, max_distance=None):
+    """Returns list of [keyword, distance] within max_distance edits of term
+
+    Closest keywords come first, then those found in more articles, then
+    alphabetical order.
+
+    Args:
+      term - possibly misspelled query term
+      max_distance - largest edit distance accepted, at most the index's max_distance
+    """
+    term = _normalize(term)
+    max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+    candidates = set()
+    for variant in _deletes(term[:self.prefix_length], max_distance):
+      candidates.update(self._deletes.get(variant, ()))
+
+    matches = []
+    for keyword in candidates:
+      distance = edit_distance(term, keyword, max_distance)
+      if distance <= max_distance:
+        matches.append([keyword, distance])
+    return sorted(matches, key=lambda match: (match[1], -len(self.index.postings(match[0])), match[0]))
+
+  def suggest(self, term, max_distance=None):
+    """ Returns list of the keywords closest to term, all at the same smallest distance within max_distance
+    """
+    matches = self.lookup(term, max_distance)
+    return [keyword for keyword, distance in matches if distance == matches[0][1]]
+
+  def postings(self, term, max_distance=None):
+    """ Returns sorted array of the doc IDs of articles containing any of suggest(term)
+    """
+    return union_all([self.index.postings(keyword) for keyword in self.suggest(term, max_distance)])
+
+  def search(self, term, max_distance=None):
+    """ Returns list of titles with articles containing any of suggest(term), in doc ID order
+    """
+    return self.index.decode(self.postings(term, max_distance))
+
+def default_fuzzy_index():
+  """ Returns the shared FuzzyIndex over default_compact_index(), building it on first use
+  """
+  return shared('fuzzy_index', lambda: FuzzyIndex(default_compact_index()))
@@ -0,0 +1,56 @@
+import random
+from fuzzy import FuzzyIndex, edit_distance
+from index import CompactKeywordIndex
+from search import fuzzy_search, search
+from wiki import keyword_to_titles_map
+
+KEYWORDS = keyword_to_titles_map()
+
+def test_edit_distance():
+    assert edit_distance('music', 'music') == 0
+    assert edit_distance('musik', 'music') == 1
+    assert edit_distance('programing', 'programming') == 1
+    assert edit_distance('msuic', 'music') == 1
+    assert edit_distance('kitten', 'sitting') == 3
+    assert edit_distance('kitten', 'sitting', 1) == 2
+    assert edit_distance('', 'abc') == 3
+
+def test_lookup():
+    index = FuzzyIndex(CompactKeywordIndex.from_keyword_map(KEYWORDS))
+    rng = random.Random(7)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    terms = ['musik', 'msuic', 'dgo', 'canad', 'socer', 'x'] + [''.join(rng.choice(letters) for _ in range(rng.randint(2, 12))) for _ in range(50)]
+    for keyword in rng.sample(sorted(KEYWORDS), 50):
+        position = rng.randrange(len(keyword))
+        terms.append(keyword[:position] + rng.choice(letters) + keyword[position + 1:])
+        terms.append(keyword[:position] + keyword[position + 1:])
+    for term in terms:
+        distances = [[keyword, edit_distance(term, keyword, 2)] for keyword in KEYWORDS]
+        for max_distance in [1, 2]:
+            expected = sorted(match for match in distances if match[1] <= max_distance)
+            assert sorted(index.lookup(term, max_distance)) == expected
+
+    assert index.lookup('musik')[0] == ['music', 1]
+    assert index.suggest('music') == ['music']
+    assert index.suggest('qqqqqqq') == []
+
+def test_fuzzy_search():
+    assert fuzzy_search('dgo', 1) == search('dog')
+    assert fuzzy_search('Musik') == search('music')
+    assert fuzzy_search('dog') == search('dog')
+    assert fuzzy_search('qqqqqqq') == []
+
+def test_large_vocabulary():
+    rng = random.Random(9)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    vocabulary = set(''.join(rng.choice(letters) for _ in range(rng.randint(4, 12))) for _ in range(20000))
+    index = FuzzyIndex(CompactKeywordIndex({keyword: ['doc'] for keyword in vocabulary}))
+    for keyword in sorted(vocabulary)[:100]:
+        assert [keyword, 1] in index.lookup(keyword[:-1])
+
+
+if __name__ == "__main__":
+    test_edit_distance()
+    test_lookup()
+    test_fuzzy_search()
+    test_large_vocabulary()
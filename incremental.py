@@ -0,0 +1,242 @@
+from array import array
+from bisect import bisect_left, insort
+from threading import RLock, Thread
+from index import _normalize
+from wiki import _find_keywords
+
+# Keyword index and metadata that take single article changes without a rebuild.
+#
+# Each article keeps one doc ID for its whole life. Adding an article appends a
+# new doc ID, which keeps every posting list sorted by appending. Updating an
+# article re-extracts its keywords and patches only the posting lists of the
+# keywords it gained or lost, plus its own slots in the metadata columns.
+# Deleting an article only marks its doc ID with a tombstone that queries skip;
+# compact() later removes tombstoned docs from their posting lists, touching
+# only the lists of the keywords those docs had.
+
+class IncrementalIndex:
+  """Keyword index and article metadata supporting add, update and delete by article ID
+
+  Every method is safe to call from several threads, so compaction can run in
+  the background while articles are applied and queries are answered.
+  """
+
+  def __init__(self):
+    self._lock = RLock()
+    self._postings = {}
+    self._titles = []
+    self._authors = []
+    self._timestamps = array('q')
+    self._lengths = array('q')
+    self._doc_keywords = []
+    self._title_to_id = {}
+    self._article_to_doc = {}
+    self._tombstones = set()
+    # Incremented on every change, usable as the version of a QueryCache
+    self.version = 0
+
+  @classmethod
+  def from_records(cls, records):
+    """Builds an index from article records as returned by wiki._metadata_list()
+
+    Args:
+      records - list of dictionaries with id, title, contributor_username,
+                timestamp, num_characters and keywords
+    """
+    index = cls()
+    for record in records:
+      index.add(record)
+    return index
+
+  def _keywords(self, record, extract):
+    keywords = _find_keywords(extract) if extract is not None else record.get('keywords', [])
+    return list(dict.fromkeys(map(_normalize, keywords)))
+
+  def _check_title(self, title, doc_id=None):
+    """ Raises KeyError if another live article already has the title, titles map to one doc ID
+    """
+    if self._title_to_id.get(title, doc_id) != doc_id:
+      raise KeyError('{} is already the title of another article'.format(title))
+
+  def _set_info(self, doc_id, record):
+    self._titles[doc_id] = record.get('title')
+    self._authors[doc_id] = record.get('contributor_username')
+    self._timestamps[doc_id] = int(record.get('timestamp', 0))
+    self._lengths[doc_id] = int(record.get('num_characters', 0))
+    self._title_to_id[record.get('title')] = doc_id
+
+  def add(self, record, extract=None):
+    """Adds a new article and returns its doc ID
+
+    Raises KeyError if the article ID or the title is already indexed.
+
+    Args:
+      record - dictionary with id, title, contributor_username, timestamp,
+               num_characters and, when extract is not given, keywords
+      extract - plain text of the article, its keywords are extracted from it
+    """
+    with self._lock:
+      article_id = str(record.get('id'))
+      if article_id in self._article_to_doc:
+        raise KeyError('article {} is already indexed'.format(article_id))
+      self._check_title(record.get('title'))
+
+      doc_id = len(self._titles)
+      self._titles.append(None)
+      self._authors.append(None)
+      self._timestamps.append(0)
+      self._lengths.append(0)
+      self._set_info(doc_id, record)
+      self._doc_keywords.append(self._keywords(record, extract))
+      for keyword in self._doc_keywords[doc_id]:
+        self._postings.setdefault(keyword, array('I')).append(doc_id)
+
+      self._article_to_doc[article_id] = doc_id
+      self.version += 1
+      return doc_id
+
+  def update(self, article_id, record, extract=None):
+    """Replaces the metadata and keywords of an indexed article in place
+
+    Only posting lists of keywords the article gained or lost are touched.
+    Raises KeyError if the article is not indexed or another article has the
+    new title.
+
+    Args:
+      article_id - Wikipedia page ID of the article
+      record - dictionary with the new title, contributor_username, timestamp,
+               num_characters and, when extract is not given, keywords
+      extract - new plain text of the article, its keywords are extracted from it
+    """
+    with self._lock:
+      doc_id = self._live_doc(article_id)
+      self._check_title(record.get('title'), doc_id)
+      old_keywords = self._doc_keywords[doc_id]
+      new_keywords = self._keywords(record, extract)
+
+      for keyword in set(old_keywords).difference(new_keywords):
+        self._remove_posting(keyword, doc_id)
+      for keyword in set(new_keywords).difference(old_keywords):
+        insort(self._postings.setdefault(keyword, array('I')), doc_id)
+
+      del self._title_to_id[self._titles[doc_id]]
+      self._set_info(doc_id, record)
+      self._doc_keywords[doc_id] = new_keywords
+      self.version += 1
+
+  def delete(self, article_id):
+    """ Hides an article from every query, its postings are removed by the next compact()
+    """
+    with self._lock:
+      doc_id = self._live_doc(article_id)
+      self._tombstones.add(doc_id)
+      del self._title_to_id[self._titles[doc_id]]
+      del self._article_to_doc[str(article_id)]
+      self.version += 1
+
+  def _live_doc(self, article_id):
+    doc_id = self._article_to_doc.get(str(article_id))
+    if doc_id is None:
+      raise KeyError('article {} is not indexed'.format(article_id))
+    return doc_id
+
+  def _remove_posting(self, keyword, doc_id):
+    postings = self._postings[keyword]
+    position = bisect_left(postings, doc_id)
+    if position < len(postings) and postings[position] == doc_id:
+      postings.pop(position)
+    if not postings:
+      del self._postings[keyword]
+
+  def compact(self):
+    """Removes tombstoned docs from their posting lists and clears their metadata
+
+    Returns the number of docs removed.
+    """
+    with self._lock:
+      tombstones = self._tombstones
+      self._tombstones = set()
+      for doc_id in tombstones:
+        for keyword in self._doc_keywords[doc_id]:
+          self._remove_posting(keyword, doc_id)
+        self._doc_keywords[doc_id] = []
+        self._titles[doc_id] = self._authors[doc_id] = None
+      return len(tombstones)
+
+  def compact_in_background(self):
+    """ Starts compact() on a daemon thread and returns the thread
+    """
+    thread = Thread(target=self.compact, daemon=True)
+    thread.start()
+    return thread
+
+  @property
+  def num_docs(self):
+    """ Number of live articles
+    """
+    return len(self._article_to_doc)
+
+  @property
+  def tombstones(self):
+    """ Number of deleted docs waiting for compaction
+    """
+    return len(self._tombstones)
+
+  def __len__(self):
+    return len(self._postings)
+
+  def __contains__(self, keyword):
+    return bool(self.postings(keyword))
+
+  def doc_id(self, title):
+    """ Returns the doc ID of a live article's title, or None
+    """
+    return self._title_to_id.get(title)
+
+  def title(self, doc_id):
+    """ Returns the title with the given doc ID
+    """
+    return self._titles[doc_id]
+
+  def decode(self, doc_ids):
+    """ Returns list of titles for the given doc IDs, in the same order
+    """
+    titles = self._titles
+    return [titles[doc_id] for doc_id in doc_ids]
+
+  def postings(self, keyword):
+    """ Returns the sorted array of live doc IDs of articles containing the keyword
+    """
+    with self._lock:
+      postings = self._postings.get(_normalize(keyword), array('I'))
+      if not self._tombstones:
+        return array('I', postings)
+      return array('I', (doc_id for doc_id in postings if doc_id not in self._tombstones))
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword, in doc ID order
+    """
+    with self._lock:
+      return self.decode(self.postings(keyword))
+
+  def info(self, doc_id):
+    """ Returns dictionary with the author, timestamp and length of a doc
+    """
+    return {'author': self._authors[doc_id], 'timestamp': self._timestamps[doc_id], 'length': self._lengths[doc_id]}
+
+  def title_to_info(self):
+    """ Returns dictionary mapping every live article title to its author, timestamp and length
+    """
+    with self._lock:
+      return {title: self.info(doc_id) for title, doc_id in self._title_to_id.items()}
+
+  def keyword_to_titles(self):
+    """ Returns dictionary mapping every keyword to the titles of live articles containing it
+    """
+    with self._lock:
+      result = {}
+      for keyword in self._postings:
+        titles = self.search(keyword)
+        if titles:
+          result[keyword] = titles
+      return result
@@ -0,0 +1,104 @@
+from incremental import IncrementalIndex
+from index import CompactKeywordIndex
+from search_tests_helper import METADATA
+
+records = [{'id': 1, 'title': 'dogs', 'contributor_username': 'Ann', 'timestamp': 10, 'num_characters': 100, 'keywords': ['dog', 'cat']},
+           {'id': 2, 'title': 'cats', 'contributor_username': 'Bob', 'timestamp': 20, 'num_characters': 200, 'keywords': ['cat']},
+           {'id': 3, 'title': 'birds', 'contributor_username': 'Ann', 'timestamp': 30, 'num_characters': 300, 'keywords': ['bird', 'cat']}]
+
+def corpus_records():
+    return [{'id': doc_id, 'title': items[0], 'contributor_username': items[1], 'timestamp': items[2],
+             'num_characters': items[3], 'keywords': items[4]} for doc_id, items in enumerate(METADATA)]
+
+def test_add():
+    index = IncrementalIndex.from_records(records)
+    assert index.num_docs == 3
+    assert index.search('cat') == ['dogs', 'cats', 'birds']
+    assert index.search('Dog') == ['dogs']
+    assert index.info(index.doc_id('cats')) == {'author': 'Bob', 'timestamp': 20, 'length': 200}
+
+    version = index.version
+    doc_id = index.add({'id': 4, 'title': 'fish', 'contributor_username': 'Cy', 'timestamp': 40, 'num_characters': 50},
+                       'fish fish fish fish fish fish cat cat cat cat cat cat')
+    assert doc_id == 3
+    assert index.version > version
+    assert index.search('fish') == ['fish']
+    assert index.search('cat') == ['dogs', 'cats', 'birds', 'fish']
+    for record in [records[0], dict(records[0], id=5)]:
+        try:
+            index.add(record)
+            assert False
+        except KeyError:
+            pass
+    assert index.num_docs == 4
+
+def test_update():
+    index = IncrementalIndex.from_records(records)
+    index.update(1, {'title': 'dogs and birds', 'contributor_username': 'Cy', 'timestamp': 50,
+                     'num_characters': 500, 'keywords': ['dog', 'bird']})
+    assert index.search('cat') == ['cats', 'birds']
+    assert index.search('bird') == ['dogs and birds', 'birds']
+    assert index.doc_id('dogs') is None
+    assert index.info(index.doc_id('dogs and birds')) == {'author': 'Cy', 'timestamp': 50, 'length': 500}
+
+    # Keywords re-extracted from the new text
+    index.update(2, records[1], 'cat ' * 3 + 'mouse ' * 6)
+    assert index.search('cat') == ['birds']
+    assert index.search('mouse') == ['cats']
+    try:
+        index.update(9, records[0])
+        assert False
+    except KeyError:
+        pass
+
+    # Renaming onto another live article's title is rejected and changes nothing
+    try:
+        index.update(2, dict(records[1], title='birds'))
+        assert False
+    except KeyError:
+        pass
+    assert index.search('mouse') == ['cats']
+    index.delete(3)
+    assert index.title_to_info() == {'dogs and birds': {'author': 'Cy', 'timestamp': 50, 'length': 500},
+                                     'cats': {'author': 'Bob', 'timestamp': 20, 'length': 200}}
+
+def test_delete_and_compact():
+    index = IncrementalIndex.from_records(records)
+    index.delete(2)
+    assert index.num_docs == 2
+    assert index.tombstones == 1
+    assert index.search('cat') == ['dogs', 'birds']
+    assert 'cats' not in index.title_to_info()
+    assert index.keyword_to_titles() == {'dog': ['dogs'], 'cat': ['dogs', 'birds'], 'bird': ['birds']}
+
+    assert index.compact() == 1
+    assert index.tombstones == 0
+    assert index.search('cat') == ['dogs', 'birds']
+    index.delete(1)
+    index.compact_in_background().join()
+    assert 'dog' not in index
+    assert len(index) == 2
+    try:
+        index.delete(1)
+        assert False
+    except KeyError:
+        pass
+
+def test_matches_rebuild():
+    index = IncrementalIndex.from_records(corpus_records())
+    for doc_id in range(0, len(METADATA), 3):
+        index.delete(doc_id)
+    if index.tombstones:
+        index.compact_in_background().join()
+    kept = [items for doc_id, items in enumerate(METADATA) if doc_id % 3]
+    rebuilt = CompactKeywordIndex.from_metadata(kept)
+    assert sorted(index.keyword_to_titles()) == sorted(rebuilt.keywords())
+    for keyword in rebuilt.keywords():
+        assert index.search(keyword) == rebuilt.search(keyword)
+
+
+if __name__ == "__main__":
+    test_add()
+    test_update()
+    test_delete_and_compact()
+    test_matches_rebuild()
@@ -0,0 +1,213 @@
+from array import array
+import os
+from wiki import article_metadata, article_titles, keyword_to_titles_map
+
+
+def _normalize(keyword):
+  """ Returns the form of a query term used for index lookups
+  """
+  return keyword.lower()
+
+class KeywordIndex:
+  """Hash index of keyword to list of article titles containing the keyword
+
+  Built once and reused for every query, so each lookup costs one dictionary
+  access instead of a walk over the whole vocabulary.
+  """
+
+  def __init__(self, keyword_to_titles, titles=None):
+    """
+    Args:
+      keyword_to_titles - dictionary mapping keyword to list of titles with
+                          articles containing the keyword
+      titles - list of all article titles in corpus order (unused here, kept
+               so every index type is built the same way)
+    """
+    self._postings = dict(keyword_to_titles)
+
+  @classmethod
+  def from_keyword_map(cls, keyword_to_titles=None):
+    """Builds an index from a keyword to titles mapping
+
+    Args:
+      keyword_to_titles - dictionary mapping keyword to list of titles, defaults
+                          to keyword_to_titles_map()
+    """
+    if keyword_to_titles is None:
+      return cls(keyword_to_titles_map(), article_titles())
+    return cls(keyword_to_titles)
+
+  @classmethod
+  def from_metadata(cls, metadata=None):
+    """Builds an index from article metadata
+
+    Args:
+      metadata - 2D list of [title, author, timestamp, article length, keywords],
+                 defaults to article_metadata()
+    """
+    metadata = article_metadata() if metadata is None else metadata
+    keyword_to_titles = {}
+    for items in metadata:
+      for keyword in items[-1]:
+        keyword_to_titles.setdefault(keyword, []).append(items[0])
+    return cls(keyword_to_titles, [items[0] for items in metadata])
+
+  def __len__(self):
+    return len(self._postings)
+
+  def __contains__(self, keyword):
+    return _normalize(keyword) in self._postings
+
+  def keywords(self):
+    """ Returns list of every indexed keyword
+    """
+    return list(self._postings)
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword
+    """
+    return self._postings.get(_normalize(keyword), [])
+
+  def search_many(self, keywords):
+    """ Returns dictionary mapping each given keyword to its list of titles
+    """
+    postings = self._postings
+    return {keyword: postings.get(_normalize(keyword), []) for keyword in keywords}
+
+class CompactKeywordIndex(KeywordIndex):
+  """Keyword index storing each posting list as a sorted array of integer doc IDs
+
+  Every title is interned once and given a dense doc ID, so a posting list costs
+  four bytes per article instead of one title reference, and two posting lists
+  can be merged by walking integers.
+  """
+
+  def __init__(self, keyword_to_titles, titles=None):
+    """
+    Args:
+      keyword_to_titles - dictionary mapping keyword to list of titles with
+                          articles containing the keyword
+      titles - list of all article titles in corpus order, doc IDs follow this
+               order; titles only seen in keyword_to_titles are appended after
+    """
+    self._titles = []
+    self._title_to_id = {}
+    for title in titles or []:
+      self._intern(title)
+
+    self._postings = {}
+    for keyword, keyword_titles in keyword_to_titles.items():
+      self._postings[keyword] = array('I', sorted(set(map(self._intern, keyword_titles))))
+
+  def _intern(self, title):
+    doc_id = self._title_to_id.get(title)
+    if doc_id is None:
+      doc_id = self._title_to_id[title] = len(self._titles)
+      self._titles.append(title)
+    return doc_id
+
+  @property
+  def num_docs(self):
+    return len(self._titles)
+
+  def doc_id(self, title):
+    """ Returns the doc ID of a title, or None if the title is not indexed
+    """
+    return self._title_to_id.get(title)
+
+  def title(self, doc_id):
+    """ Returns the title with the given doc ID
+    """
+    return self._titles[doc_id]
+
+  def decode(self, doc_ids):
+    """ Returns list of titles for the given doc IDs, in the same order
+    """
+    titles = self._titles
+    return [titles[doc_id] for doc_id in doc_ids]
+
+  def postings(self, keyword):
+    """ Returns the sorted array of doc IDs of articles containing the keyword
+    """
+    return self._postings.get(_normalize(keyword), array('I'))
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword, in doc ID order
+    """
+    return self.decode(self.postings(keyword))
+
+  def search_many(self, keywords):
+    """ Returns dictionary mapping each given keyword to its list of titles
+    """
+    return {keyword: self.search(keyword) for keyword in keywords}
+
+# Shared indexes over the bundled corpus, built on first use. Every module's
+# default_*() accessor goes through shared() so invalidate_indexes() drops them
+# all at once, and index_version() lets caches notice that it happened.
+_shared = {}
+_version = 0
+
+def shared(name, build):
+  """Returns the shared object registered under name, calling build() to create it on first use
+
+  Args:
+    name - unique name of the shared object
+    build - function with no arguments returning the object
+  """
+  if name not in _shared:
+    _shared[name] = build()
+  return _shared[name]
+
+def index_version():
+  """ Returns a number that changes every time the shared indexes are invalidated
+  """
+  return _version
+
+def invalidate_indexes():
+  """Drops every shared index so the next use rebuilds it from the current corpus
+
+  Switching to a newly written index file with use_index_file() calls this, so
+  re-ingested articles served that way are picked up on their own. The wiki
+  ingestion functions only return records and never change what the shared
+  indexes read, so code that changes the corpus any other way calls this by hand.
+  """
+  global _version
+  _shared.clear()
+  _version += 1
+
+# Binary index file written by storage.write_index(), None builds the indexes
+# from corpus.py. When set, default_index() and default_compact_index() both
+# return one MappedIndex over the file, so startup only maps it and every
+# process reading the same file shares its pages. Read from the
+# SEARCH_INDEX_FILE environment variable on import, or set with use_index_file().
+INDEX_FILE_ENV = 'SEARCH_INDEX_FILE'
+_index_file = os.environ.get(INDEX_FILE_ENV) or None
+
+def use_index_file(path):
+  """Makes the shared keyword indexes come from a binary index file and rebuilds them on next use
+
+  Args:
+    path - file written by storage.write_index(), None goes back to corpus.py
+  """
+  global _index_file
+  _index_file = path
+  invalidate_indexes()
+
+def _mapped_index():
+  # storage imports this module, so it is only imported once a file is configured
+  from storage import load_index
+  return shared('mapped_index', lambda: load_index(_index_file))
+
+def default_index():
+  """ Returns the shared index over keyword_to_titles_map(), or the mapped index file, building it on first use
+  """
+  if _index_file is not None:
+    return _mapped_index()
+  return shared('index', KeywordIndex.from_keyword_map)
+
+def default_compact_index():
+  """ Returns the shared CompactKeywordIndex over keyword_to_titles_map(), or the mapped index file, building it on first use
+  """
+  if _index_file is not None:
+    return _mapped_index()
+  return shared('compact_index', CompactKeywordIndex.from_keyword_map)
@@ -0,0 +1,57 @@
+from index import KeywordIndex, CompactKeywordIndex
+from wiki import keyword_to_titles_map
+from search_tests_helper import DOG, METADATA
+
+KEYWORD_TO_TITLES = keyword_to_titles_map()
+
+TRAVEL = ['Time travel']
+
+SOCCER = ['Spain national beach soccer team', 'Will Johnson (soccer)', 'Steven Cohen (soccer)']
+
+fake_metadata = [['an article title', 'andrea', 1234567890, 103, ['some', 'words', 'that', 'make', 'up', 'sentence']],
+                 ['another article title', 'helloworld', 987123456, 8029, ['more', 'words', 'could', 'make', 'sentences']]]
+
+def test_keyword_index():
+    index = KeywordIndex.from_keyword_map(KEYWORD_TO_TITLES)
+    assert index.search('dog') == DOG
+    assert index.search('DoG') == DOG
+    assert index.search('not a keyword') == []
+    assert 'Travel' in index
+    assert len(index) == len(KEYWORD_TO_TITLES)
+
+    assert KeywordIndex.from_metadata(METADATA).search('soccer') == SOCCER
+
+    index = KeywordIndex.from_metadata(fake_metadata)
+    assert index.search('words') == ['an article title', 'another article title']
+    assert index.search('sentences') == ['another article title']
+
+def test_search_many():
+    index = KeywordIndex.from_keyword_map(KEYWORD_TO_TITLES)
+    expected = {'dog': DOG, 'Travel': TRAVEL, 'nothing here': []}
+    assert index.search_many(['dog', 'Travel', 'nothing here']) == expected
+
+def test_compact_keyword_index():
+    index = CompactKeywordIndex.from_metadata(METADATA)
+    assert index.num_docs == len(METADATA)
+    assert index.search('dog') == DOG
+    assert index.search('not a keyword') == []
+    assert index.postings('dog').typecode == 'I'
+    assert list(index.postings('dog')) == sorted(index.postings('dog'))
+    assert index.decode(index.postings('travel')) == TRAVEL
+    assert index.title(index.doc_id('Time travel')) == 'Time travel'
+    assert index.doc_id('not a title') is None
+
+    # Every keyword decodes back to the same titles as the list based index
+    index = CompactKeywordIndex.from_keyword_map()
+    for keyword, titles in KEYWORD_TO_TITLES.items():
+        assert index.search(keyword) == titles
+
+    index = CompactKeywordIndex.from_metadata(fake_metadata)
+    assert list(index.postings('words')) == [0, 1]
+    assert index.search_many(['make', 'up']) == {'make': ['an article title', 'another article title'], 'up': ['an article title']}
+
+
+if __name__ == "__main__":
+    test_keyword_index()
+    test_search_many()
+    test_compact_keyword_index()
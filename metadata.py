@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice, repeat
+from operator import eq, ge, le, lt
+from index import default_compact_index, shared
+from postings import gallop_intersect
+from storage import MappedIndex
+from wiki import article_metadata, title_to_info_map
+
+# Column store of article metadata indexed by doc ID.
+#
+# Lengths and timestamps are array('q') columns and authors are dictionary
+# encoded: each distinct author gets an integer code and the author column
+# stores codes. Filters take a candidate list of doc IDs and build their mask
+# with map() and operator functions, so the per-doc loop runs in C instead of
+# one Python level dict lookup chain per title. Range queries on length and
+# timestamp can also be answered from a SortedIndex without touching every doc.
+
+class SortedIndex:
+  """Secondary index of a numeric column: doc IDs ordered by value
+
+  Range queries bisect the sorted values, so counting the docs in a range is
+  O(log n) and listing them costs O(log n + matches) plus sorting the matches
+  back into doc ID order.
+  """
+
+  def __init__(self, column):
+    """
+    Args:
+      column - sequence of numbers, position is the doc ID
+    """
+    order = sorted(range(len(column)), key=column.__getitem__)
+    self.doc_ids = array('I', order)
+    self.values = array('q', map(column.__getitem__, order))
+
+  def _bounds(self, low, high):
+    start = 0 if low is None else bisect_left(self.values, low)
+    end = len(self.values) if high is None else bisect_right(self.values, high)
+    return start, max(start, end)
+
+  def count(self, low=None, high=None):
+    """ Returns the number of docs with low <= value <= high, None leaves a side open
+    """
+    start, end = self._bounds(low, high)
+    return end - start
+
+  def range(self, low=None, high=None):
+    """ Returns sorted array of the doc IDs with low <= value <= high, None leaves a side open
+    """
+    start, end = self._bounds(low, high)
+    return array('I', sorted(self.doc_ids[start:end]))
+
+class MetadataColumns:
+  """ Author, timestamp and length columns for every doc, aligned with a CompactKeywordIndex
+  """
+
+  def __init__(self, titles, title_to_info):
+    """
+    Args:
+      titles - list of article titles, position is the doc ID
+      title_to_info - dictionary mapping article title to a dictionary with the
+                      following keys: author, timestamp, length of article
+    """
+    self.titles = list(titles)
+    self.title_to_id = {title: doc_id for doc_id, title in enumerate(self.titles)}
+    self.authors = []
+    self.author_to_code = {}
+    self.author_codes = array('I')
+    # Inverted index of author code to the sorted doc IDs of the author's articles
+    self.author_postings = []
+    self.timestamps = array('q')
+    self.lengths = array('q')
+    self._length_index = None
+    self._timestamp_index = None
+    for title in self.titles:
+      info = title_to_info[title]
+      code = self.author_to_code.setdefault(info['author'], len(self.authors))
+      if code == len(self.authors):
+        self.authors.append(info['author'])
+        self.author_postings.append(array('I'))
+      self.author_postings[code].append(len(self.author_codes))
+      self.author_codes.append(code)
+      self.timestamps.append(int(info['timestamp']))
+      self.lengths.append(int(info['length']))
+
+  @classmethod
+  def from_metadata(cls, metadata=None):
+    """Builds columns from article metadata, doc IDs follow metadata order
+
+    Args:
+      metadata - 2D list of [title, author, timestamp, article length, keywords],
+                 defaults to article_metadata()
+    """
+    metadata = article_metadata() if metadata is None else metadata
+    title_to_info = {items[0]: {'author': items[1], 'timestamp': items[2], 'length': items[3]} for items in metadata}
+    return cls([items[0] for items in metadata], title_to_info)
+
+  @classmethod
+  def from_index(cls, index, title_to_info=None):
+    """Builds columns sharing the doc IDs of a CompactKeywordIndex
+
+    Args:
+      index - CompactKeywordIndex whose doc IDs the columns use
+      title_to_info - dictionary mapping article title to author, timestamp and
+                      length, defaults to title_to_info_map()
+    """
+    title_to_info = title_to_info_map() if title_to_info is None else title_to_info
+    return cls([index.title(doc_id) for doc_id in range(index.num_docs)], title_to_info)
+
+  def __len__(self):
+    return len(self.titles)
+
+  def _candidates(self, doc_ids):
+    return range(len(self.titles)) if doc_ids is None else doc_ids
+
+  def doc_ids(self, titles):
+    """ Returns array of the doc IDs of the given titles, in the same order
+    """
+    return array('I', map(self.title_to_id.__getitem__, titles))
+
+  def decode(self, doc_ids):
+    """ Returns list of titles for the given doc IDs, in the same order
+    """
+    return list(map(self.titles.__getitem__, doc_ids))
+
+  @property
+  def length_index(self):
+    """ SortedIndex over the length column, built on first use
+    """
+    if self._length_index is None:
+      self._length_index = SortedIndex(self.lengths)
+    return self._length_index
+
+  @property
+  def timestamp_index(self):
+    """ SortedIndex over the timestamp column, built on first use
+    """
+    if self._timestamp_index is None:
+      self._timestamp_index = SortedIndex(self.timestamps)
+    return self._timestamp_index
+
+  def _scan(self, column, low, high, doc_ids):
+    if low is not None:
+      doc_ids = array('I', compress(doc_ids, map(ge, map(column.__getitem__, doc_ids), repeat(low))))
+    if high is not None:
+      doc_ids = array('I', compress(doc_ids, map(le, map(column.__getitem__, doc_ids), repeat(high))))
+    return array('I', doc_ids)
+
+  def _range(self, index, column, low, high, doc_ids):
+    """Returns the doc IDs with low <= value <= high, starting from the more selective side
+
+    Without candidates the sorted index answers directly. When the candidates
+    are strictly increasing, like a posting list, and the range holds fewer docs
+    than them, the range is listed from the sorted index and intersected with
+    them. Otherwise the candidates are scanned against the column. Both plans
+    return the matching candidates in candidate order.
+    """
+    if doc_ids is None:
+      return index.range(low, high)
+    if index.count(low, high) < len(doc_ids) and all(map(lt, doc_ids, islice(doc_ids, 1, None))):
+      return gallop_intersect(index.range(low, high), doc_ids)
+    return self._scan(column, low, high, doc_ids)
+
+  def length_between(self, low=None, high=None, doc_ids=None):
+    """Returns array of the doc IDs with low <= length <= high, None leaves a side open
+
+    Args:
+      low, high - inclusive length range
+      doc_ids - candidate doc IDs in any order, defaults to every doc
+    """
+    return self._range(self.length_index, self.lengths, low, high, doc_ids)
+
+  def length_at_most(self, max_length, doc_ids=None):
+    """ Returns array of the candidate doc IDs whose length does not exceed max_length, in candidate order
+    """
+    if doc_ids is None:
+      return self.length_index.range(None, max_length)
+    return self._scan(self.lengths, None, max_length, doc_ids)
+
+  def timestamp_between(self, start=None, end=None, doc_ids=None):
+    """Returns array of the doc IDs with start <= timestamp <= end, None leaves a side open
+
+    Args:
+      start, end - inclusive timestamp range
+      doc_ids - candidate doc IDs in any order, defaults to every doc
+    """
+    return self._range(self.timestamp_index, self.timestamps, start, end, doc_ids)
+
+  def author_docs(self, author):
+    """ Returns the sorted doc IDs of every article written by author, from the author index
+    """
+    code = self.author_to_code.get(author)
+    return array('I') if code is None else self.author_postings[code]
+
+  def by_author(self, author, doc_ids=None):
+    """ Returns array of the candidate doc IDs written by author, in candidate order
+    """
+    if doc_ids is None:
+      return array('I', self.author_docs(author))
+    code = self.author_to_code.get(author)
+    if code is None:
+      return array('I')
+    return array('I', compress(doc_ids, map(eq, map(self.author_codes.__getitem__, doc_ids), repeat(code))))
+
+  def has_author(self, author, doc_ids):
+    """ Returns True if author wrote any of the candidate docs, stopping at the first one
+    """
+    code = self.author_to_code.get(author)
+    return code is not None and code in map(self.author_codes.__getitem__, doc_ids)
+
+  def filter(self, doc_ids=None, max_length=None, start=None, end=None, author=None):
+    """Returns array of the candidate doc IDs passing every given filter
+
+    Args:
+      doc_ids - candidate doc IDs, defaults to every doc
+      max_length - keep docs whose length does not exceed this
+      start, end - keep docs whose timestamp is in this inclusive range
+      author - keep docs written by this author
+    """
+    if author is not None:
+      result = self.by_author(author, doc_ids)
+    else:
+      result = array('I', self._candidates(doc_ids))
+    if max_length is not None:
+      result = self.length_at_most(max_length, result)
+    if start is not None or end is not None:
+      result = self.timestamp_between(start, end, result)
+    return result
+
+  def info(self, doc_id):
+    """ Returns dictionary with the author, timestamp and length of a doc
+    """
+    return {'author': self.authors[self.author_codes[doc_id]],
+            'timestamp': self.timestamps[doc_id],
+            'length': self.lengths[doc_id]}
+
+def default_columns():
+  """ Returns the shared MetadataColumns aligned with default_compact_index(), building it on first use
+  """
+  def build():
+    index = default_compact_index()
+    # A mapped index file carries its own metadata, so corpus.py is never loaded
+    title_to_info = index.title_to_info() if isinstance(index, MappedIndex) else None
+    return MetadataColumns.from_index(index, title_to_info)
+  return shared('columns', build)
@@ -0,0 +1,111 @@
+import random
+from index import CompactKeywordIndex
+from metadata import MetadataColumns, SortedIndex
+from search import article_info, article_length, title_timestamp, favorite_author, articles_by_author
+from wiki import title_to_info_map
+from copy import deepcopy
+from search_tests_helper import DOG, METADATA
+
+TITLE_TO_INFO = title_to_info_map()
+
+def test_columns():
+    columns = MetadataColumns.from_metadata(METADATA)
+    assert len(columns) == len(METADATA)
+    for title, info in TITLE_TO_INFO.items():
+        assert columns.info(columns.title_to_id[title]) == info
+
+    dogs = columns.doc_ids(DOG)
+    assert columns.decode(columns.length_at_most(8000, dogs)) == ['Mexican dog-faced bat', 'Guide dog']
+    assert columns.decode(columns.by_author('J. Spencer', dogs)) == ['Dalmatian (dog)']
+    assert columns.has_author('J. Spencer', dogs)
+    assert not columns.has_author('Andrea', dogs)
+    assert columns.decode(columns.timestamp_between(1207793294, 1220471117, dogs)) == ['Black dog (ghost)', 'Dalmatian (dog)', 'Sun dog']
+    assert columns.decode(columns.timestamp_between(end=1207793294, doc_ids=dogs)) == ['Dalmatian (dog)', 'Guide dog']
+
+    # Without candidates every doc is filtered
+    expected = [title for title in columns.titles if TITLE_TO_INFO[title]['length'] <= 5000]
+    assert columns.decode(columns.length_at_most(5000)) == expected
+    expected = [title for title in columns.titles if TITLE_TO_INFO[title]['author'] == 'Bearcat']
+    assert columns.decode(columns.by_author('Bearcat')) == expected
+    assert list(columns.by_author('Nobody')) == []
+
+    expected = [title for title in columns.titles if TITLE_TO_INFO[title]['length'] <= 20000
+                and 1170000000 <= TITLE_TO_INFO[title]['timestamp'] <= 1230000000]
+    assert columns.decode(columns.filter(max_length=20000, start=1170000000, end=1230000000)) == expected
+
+def test_column_store_matches_dict_path():
+    # A copy of the map is not the shared map, so the functions fall back to dict lookups
+    copied = deepcopy(TITLE_TO_INFO)
+    titles = DOG + ['Time travel', 'Guide dog']
+    assert article_length(15000, titles, TITLE_TO_INFO) == article_length(15000, titles, copied)
+    assert article_info(titles, TITLE_TO_INFO) == article_info(titles, copied)
+    assert title_timestamp(titles, TITLE_TO_INFO) == title_timestamp(titles, copied)
+    assert favorite_author('J. Spencer', titles, TITLE_TO_INFO) == favorite_author('J. Spencer', titles, copied) == True
+    assert favorite_author('Andrea', titles, TITLE_TO_INFO) == favorite_author('Andrea', titles, copied) == False
+
+def test_sorted_index():
+    index = SortedIndex([50, 10, 30, 10, 40])
+    assert index.count() == 5
+    assert index.count(10, 10) == 2
+    assert list(index.range(10, 10)) == [1, 3]
+    assert list(index.range(25, 45)) == [2, 4]
+    assert list(index.range(high=30)) == [1, 2, 3]
+    assert list(index.range(low=45)) == [0]
+    assert list(index.range(60, 70)) == []
+    assert list(index.range(40, 20)) == []
+
+def test_range_queries():
+    columns = MetadataColumns.from_metadata(METADATA)
+    keywords = CompactKeywordIndex.from_metadata(METADATA)
+
+    expected = [title for title in columns.titles if TITLE_TO_INFO[title]['length'] < 5000]
+    assert columns.decode(columns.length_between(high=4999)) == expected
+    expected = [title for title in columns.titles if 1200000000 <= TITLE_TO_INFO[title]['timestamp'] <= 1250000000]
+    assert columns.decode(columns.timestamp_between(1200000000, 1250000000)) == expected
+
+    # Both plans give the same answer whichever side is more selective
+    rng = random.Random(5)
+    for keyword in ['music', 'dog', 'the', 'canada', 'travel']:
+        postings = keywords.postings(keyword)
+        for _ in range(20):
+            low, high = sorted(rng.sample(range(0, 80000), 2))
+            expected = [doc_id for doc_id in postings if low <= columns.lengths[doc_id] <= high]
+            assert list(columns.length_between(low, high, postings)) == expected
+            low, high = sorted(rng.sample(range(1100000000, 1280000000), 2))
+            expected = [doc_id for doc_id in postings if low <= columns.timestamps[doc_id] <= high]
+            assert list(columns.timestamp_between(low, high, postings)) == expected
+
+    # Unsorted candidates come back in candidate order from either plan
+    backwards = list(range(len(columns)))[::-1]
+    for low, high in [(0, 100), (0, 10 ** 9), (2000, 6000)]:
+        expected = [doc_id for doc_id in backwards if low <= columns.lengths[doc_id] <= high]
+        assert list(columns.length_between(low, high, backwards)) == expected
+    low, high = sorted(columns.timestamps)[40], sorted(columns.timestamps)[45]
+    expected = [doc_id for doc_id in backwards if low <= columns.timestamps[doc_id] <= high]
+    assert len(expected) >= 6
+    assert list(columns.filter(doc_ids=backwards, start=low, end=high)) == expected
+    assert list(columns.timestamp_between(low, high, backwards)) == expected
+
+def test_author_index():
+    columns = MetadataColumns.from_metadata(METADATA)
+    for author in set(info['author'] for info in TITLE_TO_INFO.values()):
+        expected = [title for title in columns.titles if TITLE_TO_INFO[title]['author'] == author]
+        assert columns.decode(columns.author_docs(author)) == expected
+    assert list(columns.author_docs('Nobody')) == []
+
+    dogs = columns.doc_ids(DOG)
+    assert columns.has_author('J. Spencer', reversed(dogs))
+    assert not columns.has_author('Nobody', dogs)
+    assert columns.decode(columns.filter(author='J. Spencer')) == columns.decode(columns.author_docs('J. Spencer'))
+
+    expected = [title for title in TITLE_TO_INFO if TITLE_TO_INFO[title]['author'] == 'Bearcat']
+    assert sorted(articles_by_author('Bearcat')) == sorted(expected)
+    assert articles_by_author('Nobody') == []
+
+
+if __name__ == "__main__":
+    test_columns()
+    test_column_store_matches_dict_path()
+    test_sorted_index()
+    test_range_queries()
+    test_author_index()
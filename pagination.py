@@ -0,0 +1,112 @@
+from array import array
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+from bisect import bisect_right
+import struct
+from weakref import WeakKeyDictionary
+from cache import QueryCache
+from index import default_compact_index
+from ranking import default_ranked_index, query_terms
+
+# Pages of search results addressed by opaque cursors.
+#
+# A cursor encodes the (score, doc ID) of the last result of a page. Results
+# are kept in one fixed order, by descending score and then ascending doc ID,
+# so the next page starts right after that pair and is found by binary search.
+# Keyword search pages walk the posting list itself, every score being 0.
+# Ranked search pages walk the impact ordered list of a single term, or the
+# full ranking of a multi term query, which is computed on the first page and
+# cached for the index it came from. Every later page costs O(log n + page size).
+
+PAGE_SIZE = 20
+
+_CURSOR = struct.Struct('<dI')
+
+class CursorError(ValueError):
+  pass
+
+def encode_cursor(score, doc_id):
+  """ Returns the opaque cursor string of a (score, doc ID) position
+  """
+  return urlsafe_b64encode(_CURSOR.pack(score, doc_id)).decode('ascii')
+
+def decode_cursor(cursor):
+  """ Returns the (score, doc ID) position of a cursor string, raising CursorError if it is malformed
+  """
+  try:
+    return _CURSOR.unpack(urlsafe_b64decode(cursor.encode('ascii')))
+  except (binascii.Error, struct.error, UnicodeEncodeError, AttributeError):
+    raise CursorError('invalid cursor {!r}'.format(cursor))
+
+def _page(doc_ids, scores, cursor, page_size, decode):
+  """Returns [titles, next cursor] of the page of results after cursor
+
+  Args:
+    doc_ids - doc IDs of every result in page order
+    scores - score of each result, None if every score is 0
+    cursor - cursor returned with the previous page, None for the first page
+    page_size - number of results per page
+    decode - function turning a list of doc IDs into titles
+  """
+  start = 0
+  if cursor is not None:
+    score, doc_id = decode_cursor(cursor)
+    if scores is None:
+      start = bisect_right(doc_ids, doc_id)
+    else:
+      start = bisect_right(range(len(doc_ids)), (-score, doc_id), key=lambda i: (-scores[i], doc_ids[i]))
+
+  end = min(start + page_size, len(doc_ids))
+  next_cursor = None
+  if end < len(doc_ids):
+    next_cursor = encode_cursor(0 if scores is None else scores[end - 1], doc_ids[end - 1])
+  return [decode(doc_ids[start:end]), next_cursor]
+
+def search_page(keyword, cursor=None, page_size=PAGE_SIZE, index=None):
+  """Returns [titles, next cursor] of one page of articles containing the keyword, in doc ID order
+
+  The next cursor is None on the last page.
+
+  Args:
+    keyword - search word to look for
+    cursor - cursor returned with the previous page, None for the first page
+    page_size - number of titles per page
+    index - CompactKeywordIndex to search, defaults to default_compact_index()
+  """
+  index = default_compact_index() if index is None else index
+  return _page(index.postings(keyword), None, cursor, page_size, index.decode)
+
+# Full rankings of multi term queries, one cache per RankedIndex. Entries go
+# away with their index, so a rebuilt shared index starts with an empty cache.
+_rankings = WeakKeyDictionary()
+RANKINGS_PER_INDEX = 256
+
+def _ranking(query, index):
+  """ Returns [doc IDs, scores] of every article matching a free text query, best first
+  """
+  terms = query_terms(query)
+  if len(terms) == 1:
+    return index.impact_postings(terms[0])
+
+  def rank():
+    results = index.top_k(query, index.num_docs)
+    return [array('I', (doc_id for _, doc_id in results)), array('d', (score for score, _ in results))]
+  cache = _rankings.get(index)
+  if cache is None:
+    cache = _rankings[index] = QueryCache(maxsize=RANKINGS_PER_INDEX, version=lambda: 0)
+  return cache.get(' '.join(terms), rank)
+
+def ranked_search_page(query, cursor=None, page_size=PAGE_SIZE, index=None):
+  """Returns [titles, next cursor] of one page of articles ranked by BM25 for a free text query
+
+  The next cursor is None on the last page.
+
+  Args:
+    query - one or more search words
+    cursor - cursor returned with the previous page, None for the first page
+    page_size - number of titles per page
+    index - RankedIndex to search, defaults to default_ranked_index()
+  """
+  index = default_ranked_index() if index is None else index
+  doc_ids, scores = _ranking(query, index)
+  return _page(doc_ids, scores, cursor, page_size, index.decode)
@@ -0,0 +1,60 @@
+from pagination import search_page, ranked_search_page, encode_cursor, decode_cursor, CursorError
+from ranking import RankedIndex
+from wiki import keyword_to_titles_map
+from search_tests_helper import METADATA
+
+def all_pages(page, query, page_size, **options):
+    titles, cursor = page(query, page_size=page_size, **options)
+    pages = [titles]
+    while cursor is not None:
+        titles, cursor = page(query, cursor, page_size, **options)
+        pages.append(titles)
+    return pages
+
+def test_cursor():
+    assert decode_cursor(encode_cursor(1.5, 42)) == (1.5, 42)
+    for cursor in ['', 'not a cursor!', None, encode_cursor(0, 1)[:-2]]:
+        try:
+            decode_cursor(cursor)
+            assert False
+        except CursorError:
+            pass
+
+def test_search_pages():
+    music = keyword_to_titles_map()['music']
+    pages = all_pages(search_page, 'music', 7)
+    assert [title for page in pages for title in page] == music
+    assert all(len(page) == 7 for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= 7
+    assert search_page('music', page_size=len(music)) == [music, None]
+    assert search_page('not a keyword') == [[], None]
+
+def test_ranked_pages():
+    index = RankedIndex.from_metadata(METADATA)
+    for query in ['music', 'music canada', 'rock jazz music', 'dog soccer travel']:
+        expected = index.ranked_search(query, len(METADATA))
+        for page_size in [1, 3, 20]:
+            pages = all_pages(ranked_search_page, query, page_size)
+            assert [title for page in pages for title in page] == expected
+            pages = all_pages(ranked_search_page, query, page_size, index=index)
+            assert [title for page in pages for title in page] == expected
+    assert ranked_search_page('fish') == [[], None]
+
+def test_ranking_cached_per_index():
+    index = RankedIndex.from_metadata(METADATA)
+    calls = []
+    top_k = index.top_k
+    def counting_top_k(query, k):
+        calls.append(query)
+        return top_k(query, k)
+    index.top_k = counting_top_k
+    pages = all_pages(ranked_search_page, 'music canada', 2, index=index)
+    assert len(pages) > 2
+    assert calls == ['music canada']
+
+
+if __name__ == "__main__":
+    test_cursor()
+    test_search_pages()
+    test_ranked_pages()
+    test_ranking_cached_per_index()
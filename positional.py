@@ -0,0 +1,154 @@
+from array import array
+from bisect import bisect_left
+import heapq
+from itertools import accumulate
+from compressed import decode_vbyte, encode_vbyte
+from index import CompactKeywordIndex, _normalize
+from postings import intersect_all
+from wiki import _WORD, _token_positions
+
+# Keyword index that also knows where in each article every word appears.
+#
+# For each word, the token positions in every doc of its posting list are
+# stored back to back in one bytes object, each list delta encoded (the first
+# position as is, then the gap to the previous one) and every gap variable byte
+# encoded as in compressed.py, so most positions cost one byte. A parallel
+# array of byte offsets finds the list of the i-th doc of the posting list.
+# Phrase and proximity queries first intersect the posting lists, then merge
+# the position lists of the candidate docs, never going back to the article text.
+
+class PositionalIndex(CompactKeywordIndex):
+  """ CompactKeywordIndex of every word with compressed token positions, answering phrase and proximity queries
+  """
+
+  def __init__(self, positions, titles=None):
+    """
+    Args:
+      positions - dictionary mapping article title to a dictionary of word to
+                  sorted token positions, as kept by wiki._metadata_list()
+      titles - list of all article titles in corpus order, defaults to the
+               order of positions
+    """
+    titles = list(positions) if titles is None else titles
+    keyword_to_titles = {}
+    for title in titles:
+      for word in positions.get(title, {}):
+        keyword_to_titles.setdefault(_normalize(word), []).append(title)
+    CompactKeywordIndex.__init__(self, keyword_to_titles, titles)
+
+    self._starts = {}
+    self._gaps = {}
+    for keyword, postings in self._postings.items():
+      starts = self._starts[keyword] = array('I', [0])
+      gaps = bytearray()
+      for doc_id in postings:
+        doc_positions = positions[self._titles[doc_id]][keyword]
+        gaps += encode_vbyte(position - previous for position, previous in zip(doc_positions, [0] + doc_positions[:-1]))
+        starts.append(len(gaps))
+      self._gaps[keyword] = bytes(gaps)
+
+  @classmethod
+  def from_records(cls, records):
+    """Builds a positional index from the article records returned by wiki._metadata_list(positions=True)
+
+    Args:
+      records - list of dictionaries with title and positions
+    """
+    return cls({record.get('title'): record.get('positions', {}) for record in records},
+               [record.get('title') for record in records])
+
+  @classmethod
+  def from_articles(cls, titles, articles):
+    """Builds a positional index by tokenizing article text
+
+    Args:
+      titles - list of article titles
+      articles - list of article extracts, in the same order as titles
+    """
+    return cls({title: _token_positions(article) for title, article in zip(titles, articles)}, titles)
+
+  def _positions_at(self, keyword, rank):
+    """ Returns the positions of keyword in the rank-th doc of its posting list
+    """
+    starts = self._starts[keyword]
+    return array('I', accumulate(decode_vbyte(self._gaps[keyword], starts[rank], starts[rank + 1])))
+
+  def positions(self, keyword, doc_id):
+    """ Returns sorted array of the token positions of keyword in a doc, empty if it does not appear
+    """
+    keyword = _normalize(keyword)
+    postings = self._postings.get(keyword, array('I'))
+    rank = bisect_left(postings, doc_id)
+    if rank == len(postings) or postings[rank] != doc_id:
+      return array('I')
+    return self._positions_at(keyword, rank)
+
+  def phrase_postings(self, phrase):
+    """Returns sorted array of the doc IDs of articles containing the words of phrase next to each other, in order
+
+    Positions of the i-th word are shifted back by i, so the docs containing
+    the phrase are the ones where every shifted position list has a common
+    position, found by intersecting the lists.
+
+    Args:
+      phrase - text such as 'rock music', quotes and punctuation are ignored
+    """
+    words = [_normalize(word) for word in _WORD.findall(phrase)]
+    if not words:
+      return array('I')
+    result = array('I')
+    last = len(words) - 1
+    for doc_id in intersect_all([self.postings(word) for word in words]):
+      # Shifted forward by last - i rather than back by i, so positions stay unsigned
+      shifted = [array('I', (position + last - i for position in self.positions(word, doc_id)))
+                 for i, word in enumerate(words)]
+      if intersect_all(shifted):
+        result.append(doc_id)
+    return result
+
+  def phrase_search(self, phrase):
+    """ Returns list of titles with articles containing phrase, in doc ID order
+    """
+    return self.decode(self.phrase_postings(phrase))
+
+  def _within(self, lists, window):
+    """ Returns True if one position from every list fits in window consecutive tokens
+    """
+    heap = [(positions[0], i, 0) for i, positions in enumerate(lists)]
+    heapq.heapify(heap)
+    highest = max(positions[0] for positions in lists)
+    while True:
+      lowest, i, rank = heap[0]
+      if highest - lowest < window:
+        return True
+      if rank + 1 == len(lists[i]):
+        return False
+      following = lists[i][rank + 1]
+      highest = max(highest, following)
+      heapq.heapreplace(heap, (following, i, rank + 1))
+
+  def near_postings(self, query, window):
+    """Returns sorted array of the doc IDs of articles where every word of query appears within window tokens
+
+    For each candidate doc the position lists are merged with a heap, keeping
+    the smallest span that holds one position of every word, in one pass.
+
+    Args:
+      query - words in any order
+      window - largest number of consecutive tokens holding every word
+    """
+    words = list(dict.fromkeys(_normalize(word) for word in _WORD.findall(query)))
+    if not words:
+      return array('I')
+    return array('I', (doc_id for doc_id in intersect_all([self.postings(word) for word in words])
+                       if self._within([self.positions(word, doc_id) for word in words], window)))
+
+  def near_search(self, query, window):
+    """ Returns list of titles with articles where every word of query appears within window tokens, in doc ID order
+    """
+    return self.decode(self.near_postings(query, window))
+
+  def nbytes(self):
+    """ Returns the bytes used by the encoded positions and their offsets
+    """
+    return sum(len(gaps) + self._starts[keyword].itemsize * len(self._starts[keyword]) for keyword, gaps in self._gaps.items())
@@ -0,0 +1,82 @@
+import random
+from positional import PositionalIndex
+from wiki import _token_positions
+
+TITLES = ['rock', 'jazz', 'mixed', 'empty']
+ARTICLES = ['Rock music is loud. Rock music, rock music!',
+            'Jazz music and rock jazz. Music jazz rock.',
+            'The music of rock bands: rock and roll music.',
+            '']
+
+def brute_phrase(articles, phrase):
+    words = phrase.lower().split()
+    found = []
+    for title, article in zip(TITLES, articles):
+        tokens = list(_token_positions(article).items())
+        sequence = [None] * sum(len(positions) for _, positions in tokens)
+        for word, positions in tokens:
+            for position in positions:
+                sequence[position] = word
+        if any(sequence[i:i + len(words)] == words for i in range(len(sequence))):
+            found.append(title)
+    return found
+
+def test_token_positions():
+    assert _token_positions('Rock music, rock!') == {'rock': [0, 2], 'music': [1]}
+    assert _token_positions('') == {}
+
+def test_positions():
+    index = PositionalIndex.from_articles(TITLES, ARTICLES)
+    rock = index.doc_id('rock')
+    assert list(index.positions('rock', rock)) == [0, 4, 6]
+    assert list(index.positions('Music', rock)) == [1, 5, 7]
+    assert list(index.positions('jazz', rock)) == []
+    assert index.search('music') == ['rock', 'jazz', 'mixed']
+
+    # Gaps below 128 take one byte each, plus the four byte start and end offsets of each list
+    article = ' '.join(['rock music'] * 500)
+    index = PositionalIndex.from_articles(['long'], [article])
+    assert list(index.positions('music', 0)) == list(range(1, 1000, 2))
+    assert index.nbytes() == 2 * 500 + 2 * 2 * 4
+
+def test_phrase():
+    index = PositionalIndex.from_articles(TITLES, ARTICLES)
+    assert index.phrase_search('"rock music"') == ['rock']
+    assert index.phrase_search('music rock') == ['rock']
+    assert index.phrase_search('rock jazz') == ['jazz']
+    assert index.phrase_search('rock and roll music') == ['mixed']
+    assert index.phrase_search('music') == ['rock', 'jazz', 'mixed']
+    assert index.phrase_search('roll rock') == []
+    assert index.phrase_search('') == []
+
+    rng = random.Random(11)
+    vocabulary = ['rock', 'music', 'jazz', 'and', 'the']
+    articles = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30))) for _ in TITLES]
+    index = PositionalIndex.from_articles(TITLES, articles)
+    for _ in range(100):
+        phrase = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(1, 4)))
+        assert index.phrase_search(phrase) == brute_phrase(articles, phrase)
+
+def test_near():
+    index = PositionalIndex.from_articles(TITLES, ARTICLES)
+    assert index.near_search('music rock', 2) == ['rock']
+    assert index.near_search('rock music', 3) == ['rock', 'jazz', 'mixed']
+    assert index.near_search('jazz rock', 2) == ['jazz']
+    assert index.near_search('roll music', 2) == ['mixed']
+    assert index.near_search('the roll', 7) == []
+    assert index.near_search('the roll', 8) == ['mixed']
+    assert index.near_search('the jazz', 100) == []
+
+def test_from_records():
+    records = [{'title': title, 'positions': _token_positions(article)} for title, article in zip(TITLES, ARTICLES)]
+    index = PositionalIndex.from_records(records)
+    assert index.phrase_search('rock music') == ['rock']
+    assert index.num_docs == 4
+
+
+if __name__ == "__main__":
+    test_token_positions()
+    test_positions()
+    test_phrase()
+    test_near()
+    test_from_records()
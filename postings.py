@@ -0,0 +1,76 @@
+from array import array
+from bisect import bisect_left
+
+
+# Helpers for sorted posting lists of integer doc IDs (array('I') or lists).
+# All of them return a new array('I') and leave their inputs untouched.
+
+def gallop_intersect(small, large):
+  """Returns doc IDs found in both sorted posting lists
+
+  Walks the shorter list and gallops through the longer one: the search window
+  doubles until it passes the wanted doc ID, then a binary search finishes the
+  job. The cost is close to len(small) * log(len(large) / len(small)) instead of
+  len(small) + len(large).
+
+  Args:
+    small - sorted posting list, ideally the shorter one
+    large - sorted posting list
+  """
+  if len(small) > len(large):
+    small, large = large, small
+
+  result = array('I')
+  low = 0
+  end = len(large)
+  for doc_id in small:
+    step = 1
+    high = low
+    while high < end and large[high] < doc_id:
+      low = high + 1
+      high += step
+      step *= 2
+    low = bisect_left(large, doc_id, low, min(high + 1, end))
+    if low == end:
+      break
+    if large[low] == doc_id:
+      result.append(doc_id)
+      low += 1
+  return result
+
+def intersect_all(lists):
+  """Returns doc IDs found in every sorted posting list
+
+  Lists are intersected smallest first, so the running result never grows
+  beyond the shortest list and the work stays close to its length.
+  """
+  if not lists:
+    return array('I')
+  lists = sorted(lists, key=len)
+  result = array('I', lists[0])
+  for postings in lists[1:]:
+    if not result:
+      break
+    result = gallop_intersect(result, postings)
+  return result
+
+def union_all(lists):
+  """ Returns sorted doc IDs found in any of the posting lists
+  """
+  if len(lists) == 1:
+    return array('I', lists[0])
+  merged = set()
+  for postings in lists:
+    merged.update(postings)
+  return array('I', sorted(merged))
+
+def difference(postings, excluded):
+  """ Returns doc IDs of postings that are not in excluded, both sorted
+  """
+  if not postings or not excluded:
+    return array('I', postings)
+  return array('I', (doc_id for doc_id in postings if not _contains(excluded, doc_id)))
+
+def _contains(postings, doc_id):
+  position = bisect_left(postings, doc_id)
+  return position < len(postings) and postings[position] == doc_id
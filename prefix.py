@@ -0,0 +1,83 @@
+from bisect import bisect_left
+import heapq
+from index import default_compact_index, shared, _normalize
+from postings import union_all
+
+# Prefix lookups over the keyword vocabulary.
+#
+# Keywords are kept in one sorted list with their document frequencies in a
+# parallel list, so the keywords starting with a prefix are one contiguous
+# slice found with two binary searches. Completions are the most frequent
+# keywords of that slice. A one or two letter prefix can match a large part of
+# the vocabulary, so the best completions of such short prefixes are kept
+# after the first lookup and later keystrokes cost a dictionary access.
+
+SHORT_PREFIX = 2
+
+def _prefix_end(prefix):
+  """ Returns the smallest string greater than every string starting with prefix
+  """
+  return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+class PrefixIndex:
+  """ Sorted keyword vocabulary of a CompactKeywordIndex answering prefix queries
+  """
+
+  def __init__(self, index):
+    """
+    Args:
+      index - CompactKeywordIndex whose keywords and posting lists are used
+    """
+    self.index = index
+    self.keywords = sorted(index.keywords())
+    self.frequencies = [len(index.postings(keyword)) for keyword in self.keywords]
+    self._short = {}
+
+  def _range(self, prefix):
+    if not prefix:
+      return 0, len(self.keywords)
+    return bisect_left(self.keywords, prefix), bisect_left(self.keywords, _prefix_end(prefix))
+
+  def count(self, prefix):
+    """ Returns the number of keywords starting with prefix
+    """
+    start, end = self._range(_normalize(prefix))
+    return end - start
+
+  def _best(self, prefix, limit):
+    start, end = self._range(prefix)
+    best = heapq.nsmallest(limit, range(start, end), key=lambda i: (-self.frequencies[i], i))
+    return [self.keywords[i] for i in best]
+
+  def complete(self, prefix, limit=10):
+    """Returns up to limit keywords starting with prefix, most frequent first
+
+    Keywords found in the same number of articles are in alphabetical order.
+
+    Args:
+      prefix - start of a keyword, as typed
+      limit - most completions returned
+    """
+    prefix = _normalize(prefix)
+    if len(prefix) > SHORT_PREFIX:
+      return self._best(prefix, limit)
+    cached = self._short.get(prefix)
+    if cached is None or limit > cached[0]:
+      cached = self._short[prefix] = [limit, self._best(prefix, limit)]
+    return cached[1][:limit]
+
+  def postings(self, prefix):
+    """ Returns sorted array of the doc IDs of articles containing any keyword starting with prefix
+    """
+    start, end = self._range(_normalize(prefix))
+    return union_all([self.index.postings(keyword) for keyword in self.keywords[start:end]])
+
+  def search(self, prefix):
+    """ Returns list of titles with articles containing any keyword starting with prefix, in doc ID order
+    """
+    return self.index.decode(self.postings(prefix))
+
+def default_prefix_index():
+  """ Returns the shared PrefixIndex over default_compact_index(), building it on first use
+  """
+  return shared('prefix_index', lambda: PrefixIndex(default_compact_index()))
@@ -0,0 +1,44 @@
+import random
+from index import CompactKeywordIndex
+from prefix import PrefixIndex
+from search import autocomplete, prefix_search
+from wiki import keyword_to_titles_map
+
+KEYWORDS = keyword_to_titles_map()
+
+def brute_force(prefix, limit):
+    matches = [keyword for keyword in KEYWORDS if keyword.startswith(prefix)]
+    return sorted(matches, key=lambda keyword: (-len(KEYWORDS[keyword]), keyword))[:limit]
+
+def test_complete():
+    for prefix in ['', 'm', 'mu', 'mus', 'music', 'prog', 'zzz']:
+        for limit in [1, 5, 50]:
+            assert autocomplete(prefix, limit) == brute_force(prefix, limit)
+    assert autocomplete('MUS') == brute_force('mus', 10)
+    assert autocomplete('zzz') == []
+
+def test_prefix_search():
+    index = CompactKeywordIndex.from_keyword_map(KEYWORDS)
+    prefixes = PrefixIndex(index)
+    assert prefixes.count('dog') == len([keyword for keyword in KEYWORDS if keyword.startswith('dog')])
+    titles = set(title for keyword in KEYWORDS if keyword.startswith('dog') for title in KEYWORDS[keyword])
+    assert prefixes.search('dog') == sorted(titles, key=index.doc_id)
+    assert prefix_search('dog') == prefixes.search('dog')
+    assert prefix_search('zzz') == []
+
+def test_large_vocabulary():
+    rng = random.Random(5)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    vocabulary = set(''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(100000))
+    postings = {keyword: ['doc {}'.format(rng.randint(0, 50))] for keyword in vocabulary}
+    prefixes = PrefixIndex(CompactKeywordIndex(postings))
+    for prefix in ['a', 'ab', 'abc', 'qwe']:
+        matches = sorted(keyword for keyword in vocabulary if keyword.startswith(prefix))
+        assert prefixes.complete(prefix) == matches[:10]
+        assert prefixes.count(prefix) == len(matches)
+
+
+if __name__ == "__main__":
+    test_complete()
+    test_prefix_search()
+    test_large_vocabulary()
@@ -0,0 +1,111 @@
+import re
+from array import array
+from postings import intersect_all, union_all, difference
+
+
+# Boolean query language over a CompactKeywordIndex.
+#
+#   music AND canada NOT jazz    articles with music and canada but not jazz
+#   rock OR jazz                 articles with either keyword
+#   music (rock OR jazz)         adjacent terms are ANDed together
+#   NOT music                    every article without music
+#
+# NOT binds tighter than AND, which binds tighter than OR. Operators are only
+# recognised in upper case so lower case 'and', 'or' and 'not' stay searchable.
+
+_TOKEN = re.compile(r'\(|\)|[^\s()]+')
+
+class QuerySyntaxError(ValueError):
+  pass
+
+def parse(query):
+  """Parses a boolean query into a nested tuple tree
+
+  Leaves are ('term', keyword); inner nodes are ('and', [children]),
+  ('or', [children]) and ('not', child).
+
+  Args:
+    query - boolean query string
+  """
+  tokens = _TOKEN.findall(query)
+  if not tokens:
+    raise QuerySyntaxError('empty query')
+  tree, position = _parse_or(tokens, 0)
+  if position != len(tokens):
+    raise QuerySyntaxError('unexpected {!r}'.format(tokens[position]))
+  return tree
+
+def _parse_or(tokens, position):
+  children = []
+  while True:
+    child, position = _parse_and(tokens, position)
+    children.append(child)
+    if position < len(tokens) and tokens[position] == 'OR':
+      position += 1
+    else:
+      break
+  return (children[0] if len(children) == 1 else ('or', children)), position
+
+def _parse_and(tokens, position):
+  children = []
+  while position < len(tokens) and tokens[position] not in ('OR', ')'):
+    if tokens[position] == 'AND':
+      if not children:
+        raise QuerySyntaxError('AND without a left operand')
+      position += 1
+    child, position = _parse_not(tokens, position)
+    children.append(child)
+  if not children:
+    raise QuerySyntaxError('missing operand')
+  return (children[0] if len(children) == 1 else ('and', children)), position
+
+def _parse_not(tokens, position):
+  if position >= len(tokens):
+    raise QuerySyntaxError('missing operand')
+  token = tokens[position]
+  if token == 'NOT':
+    child, position = _parse_not(tokens, position + 1)
+    return ('not', child), position
+  if token == '(':
+    child, position = _parse_or(tokens, position + 1)
+    if position >= len(tokens) or tokens[position] != ')':
+      raise QuerySyntaxError('missing )')
+    return child, position + 1
+  if token in ('AND', 'OR', ')'):
+    raise QuerySyntaxError('unexpected {!r}'.format(token))
+  return ('term', token), position + 1
+
+def evaluate(tree, index):
+  """Returns sorted doc IDs matching a parsed query
+
+  AND nodes intersect their positive operands smallest posting list first with
+  galloping search and then subtract the negated ones, so a conjunction costs
+  about as much as its rarest term.
+
+  Args:
+    tree - query tree returned by parse()
+    index - CompactKeywordIndex to evaluate against
+  """
+  kind = tree[0]
+  if kind == 'term':
+    return index.postings(tree[1])
+  if kind == 'or':
+    return union_all([evaluate(child, index) for child in tree[1]])
+  if kind == 'not':
+    return difference(range(index.num_docs), evaluate(tree[1], index))
+
+  positive = [evaluate(child, index) for child in tree[1] if child[0] != 'not']
+  negative = [evaluate(child[1], index) for child in tree[1] if child[0] == 'not']
+  result = intersect_all(positive) if positive else array('I', range(index.num_docs))
+  if negative and result:
+    result = difference(result, union_all(negative))
+  return result
+
+def boolean_search(query, index):
+  """Returns list of titles of articles matching a boolean query
+
+  Args:
+    query - boolean query string such as 'music AND canada NOT jazz'
+    index - CompactKeywordIndex to evaluate against
+  """
+  return index.decode(evaluate(parse(query), index))
@@ -0,0 +1,60 @@
+import random
+from index import CompactKeywordIndex
+from postings import gallop_intersect, intersect_all, union_all, difference
+from query import parse, boolean_search, QuerySyntaxError
+from search_tests_helper import DOG, METADATA
+
+INDEX = CompactKeywordIndex.from_metadata(METADATA)
+
+SOCCER = ['Spain national beach soccer team', 'Will Johnson (soccer)', 'Steven Cohen (soccer)']
+
+def test_posting_helpers():
+    assert list(gallop_intersect([3, 9], [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])) == [3, 9]
+    assert list(gallop_intersect([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], [0, 10, 11])) == [10]
+    assert list(gallop_intersect([], [1, 2])) == []
+    assert list(intersect_all([[1, 2, 3, 5], [2, 5, 7], [0, 2, 4, 5]])) == [2, 5]
+    assert list(intersect_all([])) == []
+    assert list(union_all([[1, 5], [2, 5], [9]])) == [1, 2, 5, 9]
+    assert list(difference([1, 2, 3, 4], [2, 4, 6])) == [1, 3]
+
+    rng = random.Random(7)
+    for _ in range(200):
+        first = sorted(rng.sample(range(500), rng.randint(0, 60)))
+        second = sorted(rng.sample(range(500), rng.randint(0, 300)))
+        expected = sorted(set(first) & set(second))
+        assert list(gallop_intersect(first, second)) == expected
+        assert list(gallop_intersect(second, first)) == expected
+
+def test_parse():
+    assert parse('dog') == ('term', 'dog')
+    assert parse('music AND canada NOT jazz') == ('and', [('term', 'music'), ('term', 'canada'), ('not', ('term', 'jazz'))])
+    assert parse('dog OR soccer rock') == ('or', [('term', 'dog'), ('and', [('term', 'soccer'), ('term', 'rock')])])
+    assert parse('(dog OR soccer) NOT guide') == ('and', [('or', [('term', 'dog'), ('term', 'soccer')]), ('not', ('term', 'guide'))])
+
+    for query in ['', 'AND dog', 'dog OR', '(dog', 'dog)', 'NOT']:
+        try:
+            parse(query)
+            assert False, query
+        except QuerySyntaxError:
+            pass
+
+def test_boolean_search():
+    music = set(INDEX.search('music'))
+    canada = set(INDEX.search('canada'))
+    jazz = set(INDEX.search('jazz'))
+
+    expected = [title for title in INDEX.search('music') if title in canada and title not in jazz]
+    assert boolean_search('music AND canada NOT jazz', INDEX) == expected
+    assert boolean_search('music canada', INDEX) == [title for title in INDEX.search('music') if title in canada]
+    assert set(boolean_search('dog OR soccer', INDEX)) == set(DOG + SOCCER)
+    assert set(boolean_search('(dog OR soccer) NOT guide', INDEX)) == set(DOG + SOCCER) - {'Guide dog'}
+    assert len(boolean_search('NOT music', INDEX)) == INDEX.num_docs - len(music)
+    assert boolean_search('dog AND soccer', INDEX) == []
+    assert boolean_search('dog AND notakeyword', INDEX) == []
+    assert boolean_search('jazz', INDEX) == INDEX.search('jazz')
+
+
+if __name__ == "__main__":
+    test_posting_helpers()
+    test_parse()
+    test_boolean_search()
@@ -0,0 +1,284 @@
+from array import array
+from bisect import bisect_left
+import heapq
+import math
+from index import CompactKeywordIndex, shared, _normalize
+from wiki import article_metadata, _WORD
+
+# Okapi BM25 parameters: K1 controls how quickly repeated terms stop adding to
+# the score, B how strongly long articles are penalised.
+K1 = 1.2
+B = 0.75
+
+# MaxScore walks only the postings of essential terms but costs a few times more
+# per posting than top_k(). ranked_search() uses it when the terms sure to turn
+# non-essential leave at most this share of the query's postings to walk.
+MAX_SCORE_SHARE = 0.1
+
+def query_terms(query):
+  """ Returns the distinct normalized terms of a free text query, in order
+  """
+  return list(dict.fromkeys(map(_normalize, _WORD.findall(query))))
+
+class RankedIndex(CompactKeywordIndex):
+  """CompactKeywordIndex that also keeps term frequencies and article lengths for BM25 ranking
+
+  Each posting list has a parallel array of how many times the keyword appears
+  in each article. Articles without known counts are treated as containing each
+  of their keywords once, and articles without a known length as average length.
+  """
+
+  def __init__(self, keyword_to_titles, titles=None, lengths=None, term_counts=None, k1=K1, b=B, collection=None):
+    """
+    Args:
+      keyword_to_titles - dictionary mapping keyword to list of titles with
+                          articles containing the keyword
+      titles - list of all article titles in corpus order
+      lengths - dictionary mapping title to article length (num_characters)
+      term_counts - dictionary mapping title to dictionary of keyword to number
+                    of occurrences, as kept by wiki._metadata_list()
+      k1, b - BM25 parameters
+      collection - [number of docs, dictionary of keyword to document frequency,
+                   average length] of the whole collection when this index holds
+                   only part of it, so its scores match an index of everything
+    """
+    CompactKeywordIndex.__init__(self, keyword_to_titles, titles)
+    lengths = lengths or {}
+    term_counts = term_counts or {}
+    self.k1 = k1
+    self.b = b
+    self._collection = collection
+
+    self._frequencies = {}
+    for keyword, postings in self._postings.items():
+      self._frequencies[keyword] = array('I', (term_counts.get(self._titles[doc_id], {}).get(keyword, 1) for doc_id in postings))
+
+    known = [lengths[title] for title in self._titles if title in lengths]
+    average = sum(known) / len(known) if known else 1
+    if collection is not None:
+      average = collection[2]
+    self._lengths = array('d', (lengths.get(title, average) for title in self._titles))
+    # k1 * (1 - b + b * length / average length) for each doc, the only per doc part of the score
+    self._norms = array('d', (k1 * (1 - b + b * length / average) if average else k1 for length in self._lengths))
+
+    # Impact ordered copy of every posting list: doc IDs by descending score with
+    # the scores alongside. The first score is the keyword's upper bound.
+    self._impacts = {}
+    for keyword, postings in self._postings.items():
+      idf = self.idf(keyword)
+      scored = sorted(((-self.score(keyword, doc_id, frequency, idf), doc_id)
+                       for doc_id, frequency in zip(postings, self._frequencies[keyword])))
+      self._impacts[keyword] = [array('I', (doc_id for _, doc_id in scored)),
+                                array('d', (-score for score, _ in scored))]
+
+  @classmethod
+  def from_metadata(cls, metadata=None, term_counts=None, collection=None):
+    """Builds a ranked index from article metadata
+
+    Args:
+      metadata - 2D list of [title, author, timestamp, article length, keywords],
+                 defaults to article_metadata()
+      term_counts - dictionary mapping title to dictionary of keyword to count
+      collection - statistics of the whole collection, see RankedIndex()
+    """
+    metadata = article_metadata() if metadata is None else metadata
+    keyword_to_titles = {}
+    for items in metadata:
+      for keyword in items[-1]:
+        keyword_to_titles.setdefault(keyword, []).append(items[0])
+    return cls(keyword_to_titles, [items[0] for items in metadata],
+               {items[0]: int(items[3]) for items in metadata}, term_counts, collection=collection)
+
+  @classmethod
+  def from_records(cls, records):
+    """Builds a ranked index from the article records returned by wiki._metadata_list()
+
+    Args:
+      records - list of dictionaries with title, num_characters, keywords and term_counts
+    """
+    metadata = [[record.get('title'), record.get('contributor_username'), record.get('timestamp'),
+                 record.get('num_characters', 0), record.get('keywords')] for record in records]
+    term_counts = {record.get('title'): record.get('term_counts', {}) for record in records}
+    return cls.from_metadata(metadata, term_counts)
+
+  def idf(self, keyword):
+    """ Returns the BM25 inverse document frequency of a keyword
+    """
+    if self._collection is not None:
+      num_docs, df = self._collection[0], self._collection[1].get(_normalize(keyword), 0)
+    else:
+      num_docs, df = self.num_docs, len(self.postings(keyword))
+    return math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+
+  def frequencies(self, keyword):
+    """ Returns the term frequencies of a keyword, parallel to postings(keyword)
+    """
+    return self._frequencies.get(_normalize(keyword), array('I'))
+
+  def score(self, keyword, doc_id, frequency, idf=None):
+    """ Returns the BM25 contribution of one keyword appearing frequency times in a doc
+    """
+    if idf is None:
+      idf = self.idf(keyword)
+    return idf * frequency * (self.k1 + 1) / (frequency + self._norms[doc_id])
+
+  def impact_postings(self, keyword):
+    """ Returns [doc IDs, scores] of a keyword ordered by descending score, ties by doc ID
+    """
+    return self._impacts.get(_normalize(keyword), [array('I'), array('d')])
+
+  def max_score(self, keyword):
+    """ Returns the highest score the keyword alone gives any doc, 0 if it is not indexed
+    """
+    scores = self.impact_postings(keyword)[1]
+    return scores[0] if scores else 0
+
+  def top_k(self, query, k=10):
+    """Returns list of the k best [score, doc_id] pairs for a free text query, best first
+
+    Scores are accumulated term at a time and the best k are picked with a heap,
+    so the full candidate set is never sorted. Ties go to the lower doc ID.
+
+    Args:
+      query - free text query, every word is a term
+      k - number of results
+    """
+    scores = {}
+    norms = self._norms
+    boost = self.k1 + 1
+    for term in query_terms(query):
+      postings = self._postings.get(term)
+      if not postings:
+        continue
+      idf = self.idf(term)
+      for doc_id, frequency in zip(postings, self._frequencies[term]):
+        scores[doc_id] = scores.get(doc_id, 0) + idf * frequency * boost / (frequency + norms[doc_id])
+
+    best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+    return [[score, doc_id] for doc_id, score in best]
+
+  def max_score_top_k(self, query, k=10):
+    """Returns the same pairs as top_k(), skipping docs that cannot reach the top k
+
+    A single term is answered straight from its impact ordered list. Longer
+    queries run MaxScore over the doc ordered lists: terms are split into
+    essential and non-essential ones by their upper bounds, only docs found in an
+    essential list are candidates, and a candidate is dropped as soon as its
+    partial score plus the bounds of the terms left cannot beat the current k-th
+    best score.
+
+    Args:
+      query - free text query, every word is a term
+      k - number of results
+    """
+    terms = [term for term in query_terms(query) if term in self._postings]
+    if not terms or k <= 0:
+      return []
+    if len(terms) == 1:
+      doc_ids, scores = self._impacts[terms[0]]
+      return [[scores[i], doc_ids[i]] for i in range(min(k, len(doc_ids)))]
+
+    # Bounds are nudged up so float rounding in the partial sums never prunes a doc that belongs
+    order = sorted(terms, key=self.max_score)
+    bounds = [self.max_score(term) * (1 + 1e-9) for term in order]
+    cumulative = []
+    for bound in bounds:
+      cumulative.append(bound + (cumulative[-1] if cumulative else 0))
+    postings = [self._postings[term] for term in order]
+    frequencies = [self._frequencies[term] for term in order]
+    idfs = [self.idf(term) for term in order]
+    positions = [0] * len(order)
+    norms = self._norms
+    boost = self.k1 + 1
+
+    heap = []
+    threshold = 0
+    # Terms before first_essential can't reach threshold on their own
+    first_essential = 0
+    while True:
+      candidate = min((postings[i][positions[i]] for i in range(first_essential, len(order))
+                       if positions[i] < len(postings[i])), default=None)
+      if candidate is None:
+        break
+
+      contributions = {}
+      partial = 0
+      for i in range(first_essential, len(order)):
+        if positions[i] < len(postings[i]) and postings[i][positions[i]] == candidate:
+          frequency = frequencies[i][positions[i]]
+          contributions[order[i]] = idfs[i] * frequency * boost / (frequency + norms[candidate])
+          partial += contributions[order[i]]
+          positions[i] += 1
+
+      for i in range(first_essential - 1, -1, -1):
+        if partial + cumulative[i] <= threshold:
+          break
+        positions[i] = bisect_left(postings[i], candidate, positions[i])
+        if positions[i] < len(postings[i]) and postings[i][positions[i]] == candidate:
+          frequency = frequencies[i][positions[i]]
+          contributions[order[i]] = idfs[i] * frequency * boost / (frequency + norms[candidate])
+          partial += contributions[order[i]]
+      else:
+        # Summed in query order so scores match top_k() exactly
+        score = sum(contributions[term] for term in terms if term in contributions)
+        if len(heap) < k:
+          heapq.heappush(heap, (score, -candidate))
+        elif (score, -candidate) > heap[0]:
+          heapq.heapreplace(heap, (score, -candidate))
+        if len(heap) == k:
+          threshold = heap[0][0]
+          while first_essential < len(order) and cumulative[first_essential] <= threshold:
+            first_essential += 1
+
+    return [[score, -doc_id] for score, doc_id in sorted(heap, reverse=True)]
+
+  def _prunes(self, query, k):
+    """Returns True if max_score_top_k() is expected to beat top_k() for the query
+
+    The k-th best score of any single term is a lower bound on the final k-th
+    best score, so every term whose cumulative upper bound is below it is sure
+    to become non-essential. When only a few of the postings belong to the
+    other terms, MaxScore skips most of the work; when every term is a head term
+    it walks nearly everything at a higher cost per posting.
+    """
+    terms = [term for term in query_terms(query) if term in self._postings]
+    if len(terms) < 2 or k <= 0:
+      return True
+    floor = max(self._impacts[term][1][k - 1] if len(self._postings[term]) >= k else 0 for term in terms)
+    walked = total = cumulative = 0
+    for term in sorted(terms, key=self.max_score):
+      cumulative += self.max_score(term)
+      total += len(self._postings[term])
+      if cumulative > floor:
+        walked += len(self._postings[term])
+    return walked <= total * MAX_SCORE_SHARE
+
+  def planned_top_k(self, query, k=10):
+    """ Returns the pairs of top_k(), computed with max_score_top_k() when pruning is expected to pay off
+    """
+    if self._prunes(query, k):
+      return self.max_score_top_k(query, k)
+    return self.top_k(query, k)
+
+  def ranked_search(self, query, k=10):
+    """ Returns list of titles of the k best articles for a free text query, best first
+    """
+    return [self._titles[doc_id] for _, doc_id in self.planned_top_k(query, k)]
+
+def collection_statistics(metadata):
+  """Returns [number of docs, dictionary of keyword to document frequency, average length] of article metadata
+
+  Args:
+    metadata - 2D list of [title, author, timestamp, article length, keywords]
+  """
+  frequencies = {}
+  for items in metadata:
+    for keyword in set(items[-1]):
+      frequencies[keyword] = frequencies.get(keyword, 0) + 1
+  average = sum(int(items[3]) for items in metadata) / len(metadata) if metadata else 1
+  return [len(metadata), frequencies, average]
+
+def default_ranked_index():
+  """ Returns the shared RankedIndex over article_metadata(), building it on first use
+  """
+  return shared('ranked_index', RankedIndex.from_metadata)
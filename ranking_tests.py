@@ -0,0 +1,101 @@
+import math
+import random
+from ranking import RankedIndex, query_terms
+from search_tests_helper import DOG, METADATA
+
+records = [{'title': 'dogs', 'num_characters': 100, 'keywords': ['dog', 'cat'], 'term_counts': {'dog': 10, 'cat': 6}},
+           {'title': 'cats', 'num_characters': 100, 'keywords': ['cat'], 'term_counts': {'cat': 20}},
+           {'title': 'long dogs', 'num_characters': 1000, 'keywords': ['dog'], 'term_counts': {'dog': 10}},
+           {'title': 'birds', 'num_characters': 100, 'keywords': ['bird'], 'term_counts': {'bird': 7}}]
+
+def brute_force(index, query):
+    ''' Scores every doc against every term, sorted best first '''
+    results = []
+    for doc_id in range(index.num_docs):
+        score = 0
+        for term in query_terms(query):
+            postings = list(index.postings(term))
+            if doc_id in postings:
+                score += index.score(term, doc_id, index.frequencies(term)[postings.index(doc_id)])
+        if score:
+            results.append([score, doc_id])
+    return sorted(results, key=lambda item: (-item[0], item[1]))
+
+def test_query_terms():
+    assert query_terms('Music, canada music') == ['music', 'canada']
+    assert query_terms('') == []
+
+def test_bm25():
+    index = RankedIndex.from_records(records)
+    assert index.ranked_search('dog') == ['dogs', 'long dogs']
+    assert index.ranked_search('cat') == ['cats', 'dogs']
+    assert index.ranked_search('dog cat') == ['dogs', 'cats', 'long dogs']
+    assert index.ranked_search('dog cat', k=1) == ['dogs']
+    assert index.ranked_search('fish') == []
+    assert list(index.frequencies('dog')) == [10, 10]
+
+    # idf of a keyword in one of four docs
+    assert math.isclose(index.idf('bird'), math.log(1 + 3.5 / 1.5))
+    assert index.top_k('dog cat') == brute_force(index, 'dog cat')
+
+def test_ranked_corpus():
+    index = RankedIndex.from_metadata(METADATA)
+    assert sorted(index.ranked_search('dog')) == sorted(DOG)
+    for query in ['music canada', 'rock jazz music', 'dog soccer travel']:
+        expected = brute_force(index, query)
+        assert index.top_k(query, 10) == expected[:10]
+        assert index.top_k(query, 1000) == expected
+
+def test_impact_postings():
+    index = RankedIndex.from_records(records)
+    doc_ids, scores = index.impact_postings('dog')
+    assert index.decode(doc_ids) == ['dogs', 'long dogs']
+    assert list(scores) == sorted(scores, reverse=True)
+    assert index.max_score('dog') == scores[0]
+    assert index.max_score('fish') == 0
+
+def test_max_score_top_k():
+    index = RankedIndex.from_metadata(METADATA)
+    for query in ['dog', 'music', 'music canada', 'rock jazz music', 'dog soccer travel', 'the and music', 'fish']:
+        for k in [1, 3, 10, 100]:
+            assert index.max_score_top_k(query, k) == index.top_k(query, k)
+
+    # Random corpus with varied term counts and lengths
+    rng = random.Random(3)
+    vocabulary = ['term{}'.format(i) for i in range(30)]
+    random_records = []
+    for doc in range(300):
+        keywords = rng.sample(vocabulary, rng.randint(1, 10))
+        random_records.append({'title': 'doc {}'.format(doc), 'num_characters': rng.randint(100, 20000),
+                               'keywords': keywords, 'term_counts': {keyword: rng.randint(6, 40) for keyword in keywords}})
+    index = RankedIndex.from_records(random_records)
+    for _ in range(100):
+        query = ' '.join(rng.sample(vocabulary, rng.randint(1, 5)))
+        k = rng.choice([1, 5, 20])
+        assert index.max_score_top_k(query, k) == index.top_k(query, k)
+    assert index.max_score_top_k('term1', 0) == []
+
+def test_planned_top_k():
+    rng = random.Random(4)
+    planned_records = []
+    for doc in range(2000):
+        keywords = ['head1', 'head2'] + (['rare'] if doc % 100 == 0 else [])
+        planned_records.append({'title': 'doc {}'.format(doc), 'num_characters': rng.randint(100, 20000),
+                                'keywords': keywords, 'term_counts': {keyword: rng.randint(6, 40) for keyword in keywords}})
+    index = RankedIndex.from_records(planned_records)
+    # Two head terms leave nothing to prune, a rare term makes the head term non-essential
+    assert not index._prunes('head1 head2', 10)
+    assert index._prunes('head1 rare', 10)
+    assert index._prunes('rare', 10)
+    for query in ['head1 head2', 'head1 rare', 'head1 head2 rare', 'rare']:
+        for k in [1, 10, 50]:
+            assert index.planned_top_k(query, k) == index.top_k(query, k)
+
+
+if __name__ == "__main__":
+    test_query_terms()
+    test_bm25()
+    test_ranked_corpus()
+    test_impact_postings()
+    test_max_score_top_k()
+    test_planned_top_k()
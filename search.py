@@ -1,4 +1,25 @@
+from itertools import islice
 from wiki import article_metadata, ask_search, ask_advanced_search, title_to_info_map, keyword_to_titles_map
+from index import default_index, default_compact_index, shared
+from query import boolean_search
+from ranking import default_ranked_index, query_terms
+from metadata import default_columns
+from bitmap import Bitmap
+from cache import QueryCache
+from prefix import default_prefix_index
+from fuzzy import default_fuzzy_index
+
+# Results of the search functions below, keyed on the normalized query and
+# options and emptied automatically when the shared indexes are rebuilt.
+_query_cache = QueryCache(maxsize=1024)
+
+def query_cache_stats():
+    return _query_cache.stats()
+
+# Results are cached as tuples and every caller gets its own list, so changing
+# a returned list never changes what later calls return.
+def _cached(key, compute):
+    return list(_query_cache.get(key, lambda: tuple(compute())))
 
 
 # FOR ALL OF THESE FUNCTIONS, READ THE FULL INSTRUCTIONS.
@@ -80,18 +101,24 @@ def keyword_to_titles(metadata):
 # Hint: to get a mapping of article titles to list of titles with articles containing
 # a keyword, use keyword_to_titles_map()
 #
+# The lookup goes through a KeywordIndex that is built once from
+# keyword_to_titles_map(), so each search is a single hash lookup.
+#
 # TODO Write code for #3 here
 def search(keyword):
-    for keywords, titles in keyword_to_titles_map().items():
-        if keywords == keyword.lower():
-            return titles
-    return []
+    return _cached(('search', keyword.lower()), lambda: default_index().search(keyword))
         
         
 
 '''
 Functions 4-8 are called after searching for a list of articles containing the user's keyword.
 '''
+
+# Functions 4-7 read the metadata column store instead of title_to_info when
+# given title_to_info_map(), whose contents the columns were built from.
+def _columns_for(title_to_info):
+    return default_columns() if title_to_info is title_to_info_map() else None
+
 # 4) 
 #
 # Function: article_info
@@ -106,6 +133,10 @@ Functions 4-8 are called after searching for a list of articles containing the u
 #
 # TODO Write code for #4 here
 def article_info(titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        return {title: columns.info(doc_id) for title, doc_id in zip(titles, columns.doc_ids(titles))}
+
     dictionary = {}
     for items in titles:
         each_title = {}
@@ -132,6 +163,10 @@ def article_info(titles, title_to_info):
 #
 # TODO Write code for #5 here
 def article_length(article_length, titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        return columns.decode(columns.length_at_most(article_length, columns.doc_ids(titles)))
+
     result = []
     for items in titles:
         if title_to_info[items]['length'] <= article_length:
@@ -151,6 +186,10 @@ def article_length(article_length, titles, title_to_info):
 #
 # TODO Write code for #6 here
 def title_timestamp(titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        return dict(zip(titles, map(columns.timestamps.__getitem__, columns.doc_ids(titles))))
+
     dictionary = {}
     for title in titles:
         dictionary[title] = title_to_info[title]['timestamp']
@@ -172,6 +211,10 @@ def title_timestamp(titles, title_to_info):
 #
 # TODO Write code for #7 here
 def favorite_author(author, titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        return columns.has_author(author, map(columns.title_to_id.__getitem__, titles))
+
     for items in titles:
         if author == title_to_info[items]['author']:
             return True
@@ -188,14 +231,208 @@ def favorite_author(author, titles, title_to_info):
 #
 # Return: searches for articles containing the keyword from entire list of 
 # available articles and adds those articles to list of given titles from basic 
-# search
+# search, skipping articles already in titles
 #
 # TODO Write code for #8 here
 def multiple_keywords(keyword, titles):
-    result = []
-    for items in search(keyword):
-        result.append(items)
-    return titles + result  
+    seen = set(titles)
+    return titles + [title for title in search(keyword) if title not in seen]
+
+
+'''
+Generator variants of functions 3, 5 and 8. They yield titles one at a time
+instead of building lists, accept any iterable of titles, and compose into a
+pipeline that only does the work needed for the titles actually consumed:
+
+    take(20, iter_by_author(author, iter_article_length(5000, iter_search('music'), info), info))
+'''
+
+# Function: iter_search
+#
+# Parameters:
+#   keyword - search word to look for
+#
+# Return: iterator over the titles search(keyword) returns, in the same order
+def iter_search(keyword):
+    yield from default_index().search(keyword)
+
+# Function: iter_article_length
+#
+# Parameters: same as article_length, titles can be any iterable
+#
+# Return: iterator over the titles of articles not exceeding article_length characters
+def iter_article_length(article_length, titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        lengths, title_to_id = columns.lengths, columns.title_to_id
+        return (title for title in titles if lengths[title_to_id[title]] <= article_length)
+    return (title for title in titles if title_to_info[title]['length'] <= article_length)
+
+# Function: iter_by_author
+#
+# Parameters:
+#   author - author name
+#   titles - any iterable of article titles
+#   title_to_info - dictionary mapping article title to a dictionary with the
+#                   following keys: author, timestamp, length of article
+#
+# Return: iterator over the titles of articles written by author
+def iter_by_author(author, titles, title_to_info):
+    columns = _columns_for(title_to_info)
+    if columns is not None:
+        code = columns.author_to_code.get(author)
+        codes, title_to_id = columns.author_codes, columns.title_to_id
+        return (title for title in titles if codes[title_to_id[title]] == code)
+    return (title for title in titles if title_to_info[title]['author'] == author)
+
+# Function: iter_multiple_keywords
+#
+# Parameters: same as multiple_keywords, titles can be any iterable
+#
+# Return: iterator over titles followed by the articles containing keyword that
+# are not already in titles
+def iter_multiple_keywords(keyword, titles):
+    seen = set()
+    for title in titles:
+        seen.add(title)
+        yield title
+    for title in iter_search(keyword):
+        if title not in seen:
+            yield title
+
+# Function: take
+#
+# Parameters:
+#   k - maximum number of titles
+#   titles - any iterable of article titles
+#
+# Return: list of the first k titles, consuming no more of titles than needed
+def take(k, titles):
+    return list(islice(titles, k))
+
+
+# Function: boolean_keywords
+#
+# Parameters:
+#   query - boolean query such as 'music AND canada NOT jazz', see query.py
+#
+# Return: list of titles with articles matching the query
+def boolean_keywords(query):
+    key = ('boolean', ' '.join(query.split()))
+    return _cached(key, lambda: boolean_search(query, default_compact_index()))
+
+
+# Function: articles_by_author
+#
+# Parameters:
+#   author - author name
+#
+# Return: list of titles of every article written by author, read from the
+# author index instead of scanning title_to_info
+def articles_by_author(author):
+    return _cached(('author', author), lambda: _articles_by_author(author))
+
+def _articles_by_author(author):
+    columns = default_columns()
+    return columns.decode(columns.author_docs(author))
+
+
+# Function: combined_search
+#
+# Parameters:
+#   keyword - search word to look for
+#   other_keyword - articles containing this keyword are added, like option 5
+#   max_length - keep articles not exceeding this many characters, like option 2
+#   author - keep articles written by this author
+#   start, end - keep articles whose timestamp is in this inclusive range
+#
+# Return: list of titles of articles passing every given option, in corpus order.
+# Keyword and author bitmaps are built once per keyword and author and kept
+# until the shared indexes are rebuilt. A length or timestamp range is turned
+# into a bitmap only when it holds fewer docs than the result so far, otherwise
+# the result is filtered against the column, so a selective keyword never pays
+# for a range covering most of the corpus.
+def combined_search(keyword, other_keyword=None, max_length=None, author=None, start=None, end=None):
+    key = ('combined', keyword.lower(), other_keyword and other_keyword.lower(), max_length, author, start, end)
+    return _cached(key, lambda: _combined_search(keyword, other_keyword, max_length, author, start, end))
+
+def _keyword_bitmap(keyword):
+    bitmaps = shared('keyword_bitmaps', dict)
+    keyword = keyword.lower()
+    if keyword not in bitmaps:
+        bitmaps[keyword] = Bitmap(default_compact_index().postings(keyword))
+    return bitmaps[keyword]
+
+def _author_bitmap(author):
+    bitmaps = shared('author_bitmaps', dict)
+    if author not in bitmaps:
+        bitmaps[author] = Bitmap(default_columns().author_docs(author))
+    return bitmaps[author]
+
+def _in_range(result, sorted_index, between, low, high):
+    if sorted_index.count(low, high) < len(result):
+        return result & Bitmap(sorted_index.range(low, high))
+    return Bitmap(between(low, high, result.to_array()))
+
+def _combined_search(keyword, other_keyword, max_length, author, start, end):
+    columns = default_columns()
+    result = _keyword_bitmap(keyword)
+    if other_keyword is not None:
+        result = result | _keyword_bitmap(other_keyword)
+    if author is not None:
+        result = result & _author_bitmap(author)
+    if max_length is not None:
+        result = _in_range(result, columns.length_index, columns.length_between, None, max_length)
+    if start is not None or end is not None:
+        result = _in_range(result, columns.timestamp_index, columns.timestamp_between, start, end)
+    return default_compact_index().decode(result)
+
+
+# Function: ranked_search
+#
+# Parameters:
+#   query - one or more search words
+#   k - maximum number of titles to return
+#
+# Return: list of the k titles with the highest BM25 score for the query, best first
+def ranked_search(query, k=10):
+    key = ('ranked', ' '.join(query_terms(query)), k)
+    return _cached(key, lambda: default_ranked_index().ranked_search(query, k))
+
+
+# Function: autocomplete
+#
+# Parameters:
+#   prefix - start of a keyword, as typed
+#   limit - maximum number of keywords to return
+#
+# Return: list of keywords starting with prefix, found in the most articles first
+def autocomplete(prefix, limit=10):
+    return default_prefix_index().complete(prefix, limit)
+
+
+# Function: prefix_search
+#
+# Parameters:
+#   prefix - start of a keyword
+#
+# Return: list of titles with articles containing any keyword starting with
+# prefix, in corpus order
+def prefix_search(prefix):
+    return _cached(('prefix', prefix.lower()), lambda: default_prefix_index().search(prefix))
+
+
+# Function: fuzzy_search
+#
+# Parameters:
+#   keyword - search word to look for, possibly misspelled
+#   max_distance - largest number of edits (1 or 2) between keyword and a match
+#
+# Return: list of titles with articles containing the keywords closest to
+# keyword, in corpus order. An exact match is the only one used when it exists.
+def fuzzy_search(keyword, max_distance=2):
+    key = ('fuzzy', keyword.lower(), max_distance)
+    return _cached(key, lambda: default_fuzzy_index().search(keyword, max_distance))
 
 
 # Prints out articles based on searched keyword and advanced options
@@ -1,4 +1,4 @@
-from search import title_to_info, keyword_to_titles, search, article_info, article_length, title_timestamp, favorite_author, multiple_keywords, display_result
+from search import title_to_info, keyword_to_titles, search, article_info, article_length, title_timestamp, favorite_author, multiple_keywords, display_result, iter_search, iter_article_length, iter_by_author, iter_multiple_keywords, take
 from search_tests_helper import print_basic, print_advanced, print_advanced_option, get_print
 from wiki import article_metadata, title_to_info_map, keyword_to_titles_map
 from unittest.mock import patch
@@ -284,6 +284,33 @@ def test_integration_test2(input_mock):
     assert output == expected
 
 
+def test_multiple_keywords_no_duplicates():
+    # Articles already in the basic search results are not added a second time
+    assert multiple_keywords('dog', deepcopy(DOG)) == DOG
+    expected = ['Guide dog', 'Black dog (ghost)', 'Mexican dog-faced bat', 'Dalmatian (dog)', 'Sun dog']
+    assert multiple_keywords('dog', ['Guide dog']) == expected
+
+def test_streaming_pipeline():
+    info = title_to_info_map()
+    assert list(iter_search('dog')) == search('dog')
+    assert list(iter_search('not a keyword')) == []
+    for title_to_info in [info, deepcopy(info)]:
+        assert list(iter_article_length(5000, iter_search('music'), title_to_info)) == article_length(5000, search('music'), info)
+        author = info[search('music')[0]]['author']
+        assert list(iter_by_author(author, iter_search('music'), title_to_info)) == [title for title in search('music') if info[title]['author'] == author]
+    assert list(iter_multiple_keywords('dog', iter(['Guide dog']))) == multiple_keywords('dog', ['Guide dog'])
+
+    # Only as many titles are pulled from the source as the pipeline needs
+    pulled = []
+    def source():
+        for title in search('music'):
+            pulled.append(title)
+            yield title
+    first = take(2, iter_article_length(10 ** 9, source(), info))
+    assert first == search('music')[:2]
+    assert len(pulled) == 2
+    assert take(5, iter_search('not a keyword')) == []
+
 
 # Write tests above this line. Do not remove.
 
@@ -305,3 +332,5 @@ if __name__ == "__main__":
     test_example_integration_test()
     test_integration_test()
     test_integration_test2()
+    test_multiple_keywords_no_duplicates()
+    test_streaming_pipeline()
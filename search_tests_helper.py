@@ -1,7 +1,12 @@
 import io
 from search import display_result
 import sys
-from wiki import BASIC, ADVANCED, ADVANCED_TO_QUESTION 
+from wiki import BASIC, ADVANCED, ADVANCED_TO_QUESTION, article_metadata
+
+# Fixtures shared by the index and search tests
+METADATA = article_metadata()
+
+DOG = ['Black dog (ghost)', 'Mexican dog-faced bat', 'Dalmatian (dog)', 'Guide dog', 'Sun dog']
 
 def print_basic():
     """
@@ -0,0 +1,256 @@
+import os
+from threading import Event, Lock, Thread
+from index import _normalize
+from storage import load_index, write_index
+from wiki import article_metadata
+
+# Keyword index split into immutable segments, in the style of Lucene.
+#
+# New articles go to a small in-memory segment. Once it holds flush_size
+# articles it is written to disk with storage.write_index() and opened as a
+# MappedIndex, so it never changes again. A merger combines runs of
+# merge_factor neighbouring segments of the same size tier into one bigger
+# segment, so the number of segments stays logarithmic in the corpus size and
+# no merge ever rewrites the whole corpus at once. The MANIFEST file lists the
+# live segments from oldest to newest and is replaced atomically after every
+# flush and merge.
+#
+# Queries take a snapshot of the segment list and fan out over it, oldest
+# first, so titles come back in the order the articles were added. Readers
+# only hold the lock while copying the list, never while a segment is written.
+
+MANIFEST = 'MANIFEST'
+
+class SegmentIndex:
+  """ Keyword index and article metadata stored as immutable segment files under a directory
+  """
+
+  def __init__(self, directory, flush_size=1000, merge_factor=4):
+    """
+    Args:
+      directory - directory holding the segment files, created if missing
+      flush_size - number of articles buffered in memory before a flush
+      merge_factor - number of segments of the same size tier merged at once
+    """
+    self.directory = directory
+    self.flush_size = flush_size
+    self.merge_factor = merge_factor
+    self._lock = Lock()
+    self._flush_lock = Lock()
+    self._merge_lock = Lock()
+    self._buffer = []
+    # In-memory segment: keyword to titles of the buffered articles
+    self._memory = {}
+    # Rows and keywords of the in-memory segment being flushed
+    self._flushing = ([], {})
+    self._segments = []
+    self._titles = set()
+    self._generation = 0
+    self._stop = Event()
+    self._merger = None
+    # Incremented every time an article is added, usable as the version of a QueryCache
+    self.version = 0
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = os.path.join(directory, MANIFEST)
+    if os.path.exists(manifest):
+      with open(manifest) as f:
+        names = f.read().split()
+      for name in names:
+        segment = load_index(os.path.join(directory, name))
+        self._segments.append((name, segment))
+        self._titles.update(segment.title(doc_id) for doc_id in range(segment.num_docs))
+        self._generation = max(self._generation, int(name.split('_')[1].split('.')[0]))
+
+  @classmethod
+  def from_metadata(cls, directory, metadata=None, **options):
+    """Builds a segment index of article metadata
+
+    Args:
+      directory - directory holding the segment files
+      metadata - 2D list of [title, author, timestamp, article length, keywords],
+                 defaults to article_metadata()
+    """
+    index = cls(directory, **options)
+    for items in article_metadata() if metadata is None else metadata:
+      index.add(items)
+    index.flush()
+    return index
+
+  def add(self, items):
+    """Adds one article, flushing the in-memory segment once it is full
+
+    Args:
+      items - list of [title, author, timestamp, article length, keywords]
+    """
+    with self._lock:
+      if items[0] in self._titles:
+        raise KeyError('{} is already indexed'.format(items[0]))
+      self._titles.add(items[0])
+      keywords = list(dict.fromkeys(map(_normalize, items[4])))
+      self._buffer.append([items[0], items[1], items[2], items[3], keywords])
+      for keyword in keywords:
+        self._memory.setdefault(keyword, []).append(items[0])
+      self.version += 1
+      full = len(self._buffer) >= self.flush_size
+    if full:
+      self.flush()
+
+  def _new_name(self):
+    self._generation += 1
+    return 'segment_{:06d}.idx'.format(self._generation)
+
+  def _write_manifest(self):
+    path = os.path.join(self.directory, MANIFEST)
+    with open(path + '.tmp', 'w') as f:
+      f.write('\n'.join(name for name, _ in self._segments))
+    os.replace(path + '.tmp', path)
+
+  def flush(self):
+    """ Writes the in-memory segment to disk as a new immutable segment
+    """
+    with self._flush_lock:
+      with self._lock:
+        rows = self._buffer
+        if not rows:
+          return
+        # Readers keep seeing the rows until the segment replaces them
+        self._flushing = (rows, self._memory)
+        self._buffer, self._memory = [], {}
+        name = self._new_name()
+      write_index(os.path.join(self.directory, name), rows)
+      segment = load_index(os.path.join(self.directory, name))
+      with self._lock:
+        self._segments.append((name, segment))
+        self._flushing = ([], {})
+        self._write_manifest()
+
+  def _tier(self, num_docs):
+    """ Returns the largest t with flush_size * merge_factor ** t <= num_docs, 0 for smaller segments
+    """
+    tier = 0
+    size = self.flush_size * self.merge_factor
+    while size <= num_docs:
+      tier += 1
+      size *= self.merge_factor
+    return tier
+
+  def _pick_merge(self):
+    """ Returns (start, end) of the oldest run of merge_factor neighbouring segments in one tier, or None
+    """
+    tiers = [self._tier(segment.num_docs) for _, segment in self._segments]
+    for start in range(len(tiers) - self.merge_factor + 1):
+      if len(set(tiers[start:start + self.merge_factor])) == 1:
+        return start, start + self.merge_factor
+    return None
+
+  def merge(self):
+    """Merges segments until no tier holds merge_factor neighbouring segments
+
+    Returns the number of merges done.
+    """
+    merges = 0
+    with self._merge_lock:
+      while True:
+        with self._lock:
+          run = self._pick_merge()
+          if run is None:
+            return merges
+          merged = self._segments[run[0]:run[1]]
+          name = self._new_name()
+
+        write_index(os.path.join(self.directory, name), [row for _, segment in merged for row in _rows(segment)])
+        segment = load_index(os.path.join(self.directory, name))
+        # Flushes only append, so the merged run is still at the same position
+        with self._lock:
+          self._segments[run[0]:run[1]] = [(name, segment)]
+          self._write_manifest()
+        # Readers holding an old snapshot keep the mapping alive until they finish
+        for old_name, _ in merged:
+          os.remove(os.path.join(self.directory, old_name))
+        merges += 1
+
+  def start_merging(self, interval=1.0):
+    """ Starts a daemon thread calling merge() every interval seconds until stop_merging()
+    """
+    def run():
+      while not self._stop.wait(interval):
+        self.merge()
+    self._stop.clear()
+    self._merger = Thread(target=run, daemon=True)
+    self._merger.start()
+
+  def stop_merging(self):
+    if self._merger is not None:
+      self._stop.set()
+      self._merger.join()
+      self._merger = None
+
+  def close(self):
+    """ Stops the merger and flushes the in-memory segment
+    """
+    self.stop_merging()
+    self.flush()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def _snapshot(self, keyword):
+    """ Returns the current segments and the titles of buffered articles containing the keyword
+    """
+    with self._lock:
+      return ([segment for _, segment in self._segments],
+              self._flushing[1].get(keyword, []) + self._memory.get(keyword, []))
+
+  @property
+  def num_segments(self):
+    return len(self._segments)
+
+  @property
+  def num_docs(self):
+    return len(self._titles)
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword, in the order they were added
+    """
+    segments, buffered = self._snapshot(_normalize(keyword))
+    titles = []
+    for segment in segments:
+      titles += segment.search(keyword)
+    return titles + buffered
+
+  def search_many(self, keywords):
+    """ Returns dictionary mapping each given keyword to its list of titles
+    """
+    return {keyword: self.search(keyword) for keyword in keywords}
+
+  def keywords(self):
+    """ Returns set of every indexed keyword
+    """
+    with self._lock:
+      segments = [segment for _, segment in self._segments]
+      keywords = set(self._flushing[1]).union(self._memory)
+    for segment in segments:
+      keywords.update(segment.keywords())
+    return keywords
+
+  def keyword_to_titles(self):
+    """ Returns dictionary mapping every keyword to the titles of the articles containing it
+    """
+    return self.search_many(sorted(self.keywords()))
+
+def _rows(segment):
+  """ Returns the [title, author, timestamp, article length, keywords] rows of a segment, in doc ID order
+  """
+  keywords = [[] for _ in range(segment.num_docs)]
+  for keyword in segment.keywords():
+    for doc_id in segment.postings(keyword):
+      keywords[doc_id].append(keyword)
+  rows = []
+  for doc_id in range(segment.num_docs):
+    info = segment.info(doc_id)
+    rows.append([segment.title(doc_id), info['author'], info['timestamp'], info['length'], keywords[doc_id]])
+  return rows
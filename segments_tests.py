@@ -0,0 +1,77 @@
+import os
+import tempfile
+from index import CompactKeywordIndex
+from segments import SegmentIndex, MANIFEST
+from wiki import keyword_to_titles_map
+from search_tests_helper import DOG, METADATA
+
+def test_buffer_and_flush():
+    with tempfile.TemporaryDirectory() as directory:
+        index = SegmentIndex(directory, flush_size=3)
+        index.add(['dogs', 'ann', 1, 10, ['Dog', 'cat']])
+        index.add(['cats', 'bob', 2, 20, ['cat']])
+        assert index.num_segments == 0
+        assert index.search('cat') == ['dogs', 'cats']
+        index.add(['birds', 'ann', 3, 30, ['bird', 'cat']])
+        assert index.num_segments == 1
+        index.add(['fish', 'cy', 4, 40, ['cat', 'fish']])
+        assert index.version == 4
+        assert index.search('CAT') == ['dogs', 'cats', 'birds', 'fish']
+        assert index.search('dog') == ['dogs']
+        assert index.keywords() == {'dog', 'cat', 'bird', 'fish'}
+        try:
+            index.add(['cats', 'bob', 2, 20, []])
+            assert False
+        except KeyError:
+            pass
+        index.close()
+        assert index.num_segments == 2
+
+        reopened = SegmentIndex(directory, flush_size=3)
+        assert reopened.num_docs == 4
+        assert reopened.search('cat') == ['dogs', 'cats', 'birds', 'fish']
+
+def test_tiers():
+    with tempfile.TemporaryDirectory() as directory:
+        index = SegmentIndex(directory, flush_size=7, merge_factor=10)
+        assert [index._tier(size) for size in [0, 7, 69, 70, 699, 700, 6999, 7000]] == [0, 0, 0, 1, 1, 2, 2, 3]
+        index = SegmentIndex(directory, flush_size=1, merge_factor=3)
+        assert index._tier(3 ** 5) == 5
+        assert index._tier(3 ** 5 - 1) == 4
+
+def test_corpus_merging():
+    with tempfile.TemporaryDirectory() as directory:
+        index = SegmentIndex.from_metadata(directory, METADATA, flush_size=5, merge_factor=3)
+        assert index.num_segments == 20
+        assert index.merge() > 0
+        assert index.num_segments < 20
+        assert index.merge() == 0
+        assert sorted(os.listdir(directory)) == sorted(open(os.path.join(directory, MANIFEST)).read().split() + [MANIFEST])
+
+        compact = CompactKeywordIndex.from_metadata(METADATA)
+        assert index.num_docs == compact.num_docs
+        assert index.search('dog') == DOG
+        assert index.keyword_to_titles() == {keyword: compact.search(keyword) for keyword in sorted(compact.keywords())}
+        assert sorted(index.keyword_to_titles()) == sorted(keyword_to_titles_map())
+
+def test_background_merging():
+    with tempfile.TemporaryDirectory() as directory:
+        index = SegmentIndex(directory, flush_size=2, merge_factor=2)
+        index.start_merging(interval=0.001)
+        added = set()
+        for items in METADATA:
+            index.add(items)
+            added.add(items[0])
+            # Reads during merges see every added article exactly once
+            assert index.search('dog') == [title for title in DOG if title in added]
+        index.close()
+        index.merge()
+        assert index.search('dog') == DOG
+        assert index.num_segments <= 7
+
+
+if __name__ == "__main__":
+    test_buffer_and_flush()
+    test_tiers()
+    test_corpus_merging()
+    test_background_merging()
@@ -0,0 +1,178 @@
+from array import array
+import heapq
+from ranking import RankedIndex, collection_statistics
+from wiki import article_metadata
+
+# Index partitioned into shards by doc ID, queried by scatter-gather.
+#
+# Doc IDs follow metadata order and doc ID d goes to shard d % num_shards. Each
+# shard is a RankedIndex over its own articles, built with the statistics of
+# the whole collection so its BM25 scores equal those of an unsharded index.
+# Shards run in worker processes and talk to the coordinator over a
+# multiprocessing Pipe, which is a local socket pair on Linux. The coordinator
+# sends a query to every shard before reading any reply, so the shards work on
+# it in parallel, then merges their sorted answers by global doc ID or score.
+
+class Shard:
+  """ One partition of the index, answering queries in global doc IDs
+  """
+
+  def __init__(self, metadata, doc_ids, term_counts=None, collection=None):
+    """
+    Args:
+      metadata - 2D list of [title, author, timestamp, article length, keywords]
+                 of the shard's articles, in doc ID order
+      doc_ids - global doc ID of each article
+      term_counts - dictionary mapping title to dictionary of keyword to count
+      collection - statistics of the whole collection, see RankedIndex()
+    """
+    self.index = RankedIndex.from_metadata(metadata, term_counts, collection)
+    self.doc_ids = array('I', doc_ids)
+
+  def search(self, keyword):
+    """ Returns sorted list of [global doc ID, title] of articles containing the keyword
+    """
+    return [[self.doc_ids[doc_id], self.index.title(doc_id)] for doc_id in self.index.postings(keyword)]
+
+  def search_many(self, keywords):
+    """ Returns list of search() results, one per keyword
+    """
+    return [self.search(keyword) for keyword in keywords]
+
+  def top_k(self, query, k):
+    """ Returns list of the shard's k best [score, global doc ID, title] for a free text query, best first
+    """
+    return [[score, self.doc_ids[doc_id], self.index.title(doc_id)] for score, doc_id in self.index.planned_top_k(query, k)]
+
+def _serve(connection, metadata, doc_ids, term_counts, collection):
+  """ Worker process loop: builds a Shard, then answers (method, args) requests until it receives None
+  """
+  shard = Shard(metadata, doc_ids, term_counts, collection)
+  while True:
+    request = connection.recv()
+    if request is None:
+      break
+    method, args = request
+    try:
+      connection.send((True, getattr(shard, method)(*args)))
+    except Exception as error:
+      connection.send((False, error))
+  connection.close()
+
+class _LocalShard:
+  """ Shard called in the coordinator's own process, with the same send/receive interface as a worker
+  """
+
+  def __init__(self, *args):
+    self._shard = Shard(*args)
+    self._replies = []
+
+  def send(self, request):
+    method, args = request
+    try:
+      self._replies.append((True, getattr(self._shard, method)(*args)))
+    except Exception as error:
+      self._replies.append((False, error))
+
+  def recv(self):
+    return self._replies.pop(0)
+
+  def close(self):
+    pass
+
+class ShardedIndex:
+  """Coordinator fanning queries out to num_shards shards and merging their answers
+
+  Results are the same as those of a single CompactKeywordIndex or RankedIndex
+  over all the metadata.
+  """
+
+  def __init__(self, metadata=None, num_shards=4, term_counts=None, processes=True):
+    """
+    Args:
+      metadata - 2D list of [title, author, timestamp, article length, keywords],
+                 defaults to article_metadata()
+      num_shards - number of partitions
+      term_counts - dictionary mapping title to dictionary of keyword to count
+      processes - run every shard in its own worker process, False runs them in
+                  this process
+    """
+    metadata = article_metadata() if metadata is None else metadata
+    collection = collection_statistics(metadata)
+    self._connections = []
+    self._workers = []
+    for shard in range(num_shards):
+      doc_ids = range(shard, len(metadata), num_shards)
+      args = ([metadata[doc_id] for doc_id in doc_ids], list(doc_ids), term_counts, collection)
+      if processes:
+        import multiprocessing
+        connection, worker_connection = multiprocessing.Pipe()
+        worker = multiprocessing.Process(target=_serve, args=(worker_connection,) + args, daemon=True)
+        worker.start()
+        worker_connection.close()
+        self._connections.append(connection)
+        self._workers.append(worker)
+      else:
+        self._connections.append(_LocalShard(*args))
+
+  def _scatter(self, method, *args):
+    """ Sends one request to every shard, then returns their replies in shard order
+    """
+    for connection in self._connections:
+      connection.send((method, args))
+    replies = [connection.recv() for connection in self._connections]
+    for ok, reply in replies:
+      if not ok:
+        raise reply
+    return [reply for _, reply in replies]
+
+  def close(self):
+    """ Stops the worker processes
+    """
+    for connection in self._connections:
+      if self._workers:
+        connection.send(None)
+      connection.close()
+    for worker in self._workers:
+      worker.join()
+    self._connections = []
+    self._workers = []
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  @property
+  def num_shards(self):
+    return len(self._connections)
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword, in doc ID order
+    """
+    return [title for _, title in heapq.merge(*self._scatter('search', keyword))]
+
+  def search_many(self, keywords):
+    """ Returns dictionary mapping each given keyword to its list of titles, in one round trip
+    """
+    keywords = list(keywords)
+    replies = self._scatter('search_many', keywords)
+    return {keyword: [title for _, title in heapq.merge(*(reply[position] for reply in replies))]
+            for position, keyword in enumerate(keywords)}
+
+  def top_k(self, query, k=10):
+    """Returns list of the k best [score, doc ID, title] for a free text query, best first
+
+    Every shard returns its own k best, so the global k best are among them.
+    Ties go to the lower doc ID, as in RankedIndex.top_k().
+    """
+    if k <= 0:
+      return []
+    candidates = [result for reply in self._scatter('top_k', query, k) for result in reply]
+    return heapq.nsmallest(k, candidates, key=lambda result: (-result[0], result[1]))
+
+  def ranked_search(self, query, k=10):
+    """ Returns list of titles of the k best articles for a free text query, best first
+    """
+    return [title for _, _, title in self.top_k(query, k)]
@@ -0,0 +1,48 @@
+from index import CompactKeywordIndex
+from ranking import RankedIndex, collection_statistics
+from shards import ShardedIndex
+from search_tests_helper import DOG, METADATA
+
+QUERIES = ['dog', 'music', 'music canada', 'rock jazz music', 'dog soccer travel', 'the and music', 'fish']
+
+def test_collection_statistics():
+    index = RankedIndex.from_metadata(METADATA)
+    shared = RankedIndex.from_metadata(METADATA, collection=collection_statistics(METADATA))
+    for query in QUERIES:
+        assert shared.top_k(query, 20) == index.top_k(query, 20)
+
+def test_local_shards():
+    sharded = ShardedIndex(METADATA, num_shards=3, processes=False)
+    compact = CompactKeywordIndex.from_metadata(METADATA)
+    ranked = RankedIndex.from_metadata(METADATA)
+    assert sharded.num_shards == 3
+    assert sharded.search('DOG') == DOG
+    assert sharded.search('not a keyword') == []
+    for keyword in compact.keywords():
+        assert sharded.search(keyword) == compact.search(keyword)
+    for query in QUERIES:
+        for k in [1, 5, 100]:
+            assert [[score, doc_id] for score, doc_id, _ in sharded.top_k(query, k)] == ranked.top_k(query, k)
+        assert sharded.ranked_search(query) == ranked.ranked_search(query)
+    assert sharded.top_k('dog', 0) == []
+
+def test_worker_processes():
+    compact = CompactKeywordIndex.from_metadata(METADATA)
+    ranked = RankedIndex.from_metadata(METADATA)
+    with ShardedIndex(METADATA, num_shards=4) as sharded:
+        assert sharded.search('dog') == DOG
+        assert sharded.search_many(['music', 'Canada', 'nothing']) == compact.search_many(['music', 'Canada', 'nothing'])
+        for query in QUERIES:
+            assert sharded.ranked_search(query, 10) == ranked.ranked_search(query, 10)
+        try:
+            sharded.top_k(None, 3)
+            assert False
+        except TypeError:
+            pass
+        assert sharded.search('dog') == DOG
+
+
+if __name__ == "__main__":
+    test_collection_statistics()
+    test_local_shards()
+    test_worker_processes()
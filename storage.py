@@ -0,0 +1,256 @@
+from array import array
+from bisect import bisect_left
+import mmap
+import os
+import struct
+import sys
+from index import CompactKeywordIndex, _normalize
+from wiki import article_metadata
+
+# Binary index file, built once with write_index() and opened with load_index().
+#
+# The file starts with a header: 8 byte magic, 1 byte byte order flag, 7 bytes
+# padding, then an (offset, length in bytes) pair for each section in SECTIONS.
+# Every section is a flat array of fixed width numbers starting on an 8 byte
+# boundary, so the loader maps the file and reads each section through a
+# memoryview without copying or parsing anything. Pages are loaded on demand
+# and shared by every process that maps the same file.
+#
+# Build the file with python storage.py index.bin, then set SEARCH_INDEX_FILE
+# (or call index.use_index_file()) and the shared indexes behind search.py are
+# mapped from it instead of being built from the corpus.py literals.
+
+MAGIC = b'SSEIDX01'
+
+# Section name and array typecode, in file order
+SECTIONS = [
+  ('string_offsets', 'Q'),  # start of each string in string_data, plus the end of the last
+  ('string_data', 'B'),     # UTF-8 bytes of every title, author and keyword
+  ('doc_title', 'I'),       # string ID of each doc's title, indexed by doc ID
+  ('doc_author', 'I'),      # string ID of each doc's author
+  ('doc_timestamp', 'q'),
+  ('doc_length', 'q'),
+  ('title_order', 'I'),     # doc IDs sorted by title, for title to doc ID lookups
+  ('term_string', 'I'),     # string ID of each keyword, sorted by keyword
+  ('term_start', 'Q'),      # start of each keyword's postings, plus the end of the last
+  ('postings', 'I'),        # sorted doc IDs of every posting list back to back
+]
+
+_HEADER = struct.Struct('<8sB7x' + 'QQ' * len(SECTIONS))
+
+class IndexFormatError(ValueError):
+  pass
+
+def write_index(path, metadata=None):
+  """Writes the binary index of article metadata to path
+
+  Args:
+    path - file to write
+    metadata - 2D list of [title, author, timestamp, article length, keywords],
+               defaults to article_metadata()
+  """
+  metadata = article_metadata() if metadata is None else metadata
+  index = CompactKeywordIndex.from_metadata(metadata)
+  info = {items[0]: items for items in metadata}
+
+  strings = {}
+  def string_id(string):
+    return strings.setdefault(string, len(strings))
+
+  titles = [index.title(doc_id) for doc_id in range(index.num_docs)]
+  sections = {
+    'doc_title': array('I', map(string_id, titles)),
+    'doc_author': array('I', (string_id(info[title][1]) for title in titles)),
+    'doc_timestamp': array('q', (int(info[title][2]) for title in titles)),
+    'doc_length': array('q', (int(info[title][3]) for title in titles)),
+    'title_order': array('I', sorted(range(index.num_docs), key=titles.__getitem__)),
+    'term_string': array('I'),
+    'term_start': array('Q', [0]),
+    'postings': array('I'),
+  }
+  for keyword in sorted(index.keywords()):
+    sections['term_string'].append(string_id(keyword))
+    sections['postings'].extend(index.postings(keyword))
+    sections['term_start'].append(len(sections['postings']))
+
+  encoded = [string.encode('utf-8') for string in strings]
+  sections['string_data'] = array('B', b''.join(encoded))
+  sections['string_offsets'] = array('Q', [0])
+  for string in encoded:
+    sections['string_offsets'].append(sections['string_offsets'][-1] + len(string))
+
+  positions = []
+  offset = _HEADER.size
+  for name, _ in SECTIONS:
+    size = len(sections[name]) * sections[name].itemsize
+    positions += [offset, size]
+    offset += (size + 7) // 8 * 8
+
+  with open(path, 'wb') as f:
+    f.write(_HEADER.pack(MAGIC, sys.byteorder == 'little', *positions))
+    for name, _ in SECTIONS:
+      data = sections[name].tobytes()
+      f.write(data + b'\0' * (-len(data) % 8))
+
+def load_index(path):
+  """ Returns a MappedIndex over the binary index file at path
+  """
+  return MappedIndex(path)
+
+class _StringColumn:
+  """ Sequence of the strings behind an array of string IDs, decoded on access
+  """
+
+  def __init__(self, index, string_ids):
+    self._index = index
+    self._string_ids = string_ids
+
+  def __len__(self):
+    return len(self._string_ids)
+
+  def __getitem__(self, position):
+    return self._index._string(self._string_ids[position])
+
+class _Permuted:
+  """ Sequence of values[order[i]]
+  """
+
+  def __init__(self, values, order):
+    self._values = values
+    self._order = order
+
+  def __len__(self):
+    return len(self._order)
+
+  def __getitem__(self, position):
+    return self._values[self._order[position]]
+
+class MappedIndex:
+  """Read only keyword index and article metadata backed by a memory mapped file
+
+  Offers the same lookups as CompactKeywordIndex. Opening only reads the
+  header; keywords and titles are found by binary search over the mapped
+  sections and posting lists are returned as memoryviews into the file.
+  """
+
+  def __init__(self, path):
+    with open(path, 'rb') as f:
+      if os.fstat(f.fileno()).st_size < _HEADER.size:
+        raise IndexFormatError('{} is too short to be an index file'.format(path))
+      self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    self._view = view = memoryview(self._map)
+    self._sections = {}
+    try:
+      header = _HEADER.unpack_from(view)
+      if header[0] != MAGIC:
+        raise IndexFormatError('{} is not an index file'.format(path))
+      if header[1] != (sys.byteorder == 'little'):
+        raise IndexFormatError('{} was written on a machine with a different byte order'.format(path))
+
+      for position, (name, typecode) in enumerate(SECTIONS):
+        offset, size = header[2 + 2 * position], header[3 + 2 * position]
+        if offset + size > len(view):
+          raise IndexFormatError('{} is truncated'.format(path))
+        self._sections[name] = view[offset:offset + size].cast(typecode)
+    except Exception:
+      self.close()
+      raise
+
+    self._titles = _StringColumn(self, self._sections['doc_title'])
+    self._terms = _StringColumn(self, self._sections['term_string'])
+    self._sorted_titles = _StringColumn(self, _Permuted(self._sections['doc_title'], self._sections['title_order']))
+
+  def close(self):
+    """ Unmaps the file, posting lists returned by postings() must have been released first
+    """
+    for section in self._sections.values():
+      section.release()
+    self._sections = {}
+    self._view.release()
+    self._map.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *args):
+    self.close()
+
+  def _string(self, string_id):
+    offsets = self._sections['string_offsets']
+    return bytes(self._sections['string_data'][offsets[string_id]:offsets[string_id + 1]]).decode('utf-8')
+
+  def _term_position(self, keyword):
+    position = bisect_left(self._terms, keyword)
+    if position < len(self._terms) and self._terms[position] == keyword:
+      return position
+    return None
+
+  @property
+  def num_docs(self):
+    return len(self._titles)
+
+  def __len__(self):
+    return len(self._terms)
+
+  def __contains__(self, keyword):
+    return self._term_position(_normalize(keyword)) is not None
+
+  def keywords(self):
+    """ Returns list of every indexed keyword, sorted
+    """
+    return list(self._terms)
+
+  def doc_id(self, title):
+    """ Returns the doc ID of a title, or None if the title is not indexed
+    """
+    position = bisect_left(self._sorted_titles, title)
+    if position < len(self._sorted_titles) and self._sorted_titles[position] == title:
+      return self._sections['title_order'][position]
+    return None
+
+  def title(self, doc_id):
+    """ Returns the title with the given doc ID
+    """
+    return self._titles[doc_id]
+
+  def decode(self, doc_ids):
+    """ Returns list of titles for the given doc IDs, in the same order
+    """
+    return [self._titles[doc_id] for doc_id in doc_ids]
+
+  def postings(self, keyword):
+    """ Returns the sorted doc IDs of articles containing the keyword, as a memoryview into the file
+    """
+    position = self._term_position(_normalize(keyword))
+    if position is None:
+      return self._sections['postings'][0:0]
+    start = self._sections['term_start']
+    return self._sections['postings'][start[position]:start[position + 1]]
+
+  def search(self, keyword):
+    """ Returns list of titles with articles containing the keyword, in doc ID order
+    """
+    return self.decode(self.postings(keyword))
+
+  def search_many(self, keywords):
+    """ Returns dictionary mapping each given keyword to its list of titles
+    """
+    return {keyword: self.search(keyword) for keyword in keywords}
+
+  def info(self, doc_id):
+    """ Returns dictionary with the author, timestamp and length of a doc
+    """
+    return {'author': self._string(self._sections['doc_author'][doc_id]),
+            'timestamp': self._sections['doc_timestamp'][doc_id],
+            'length': self._sections['doc_length'][doc_id]}
+
+  def title_to_info(self):
+    """ Returns dictionary mapping every article title to its author, timestamp and length
+    """
+    return {self.title(doc_id): self.info(doc_id) for doc_id in range(self.num_docs)}
+
+if __name__ == '__main__':
+  # Build step: python storage.py index.bin
+  if len(sys.argv) != 2:
+    sys.exit('usage: python storage.py OUTPUT_FILE')
+  write_index(sys.argv[1])
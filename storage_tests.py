@@ -0,0 +1,78 @@
+import os
+import tempfile
+from index import CompactKeywordIndex, default_compact_index, default_index, use_index_file
+from metadata import default_columns
+from query import boolean_search
+from search import search, combined_search, boolean_keywords
+from storage import write_index, load_index, IndexFormatError, MappedIndex
+from wiki import title_to_info_map
+from search_tests_helper import DOG, METADATA
+
+fake_metadata = [['an article title', 'andrea', 1234567890, 103, ['some', 'words', 'that', 'make', 'up', 'sentence']],
+                 ['another article title', 'helloworld', 987123456, 8029, ['more', 'words', 'could', 'make', 'sentences']],
+                 ['títle ünicode', 'andrea', 5, 7, []]]
+
+def test_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.bin')
+        write_index(path, METADATA)
+        compact = CompactKeywordIndex.from_metadata(METADATA)
+
+        with load_index(path) as index:
+            assert index.num_docs == len(METADATA)
+            assert len(index) == len(compact)
+            assert index.keywords() == sorted(compact.keywords())
+            for keyword in compact.keywords():
+                assert list(index.postings(keyword)) == list(compact.postings(keyword))
+            assert index.search('DOG') == DOG
+            assert index.search('not a keyword') == []
+            assert 'dog' in index and 'not a keyword' not in index
+            assert index.title_to_info() == title_to_info_map()
+            assert index.doc_id('Sun dog') == compact.doc_id('Sun dog')
+            assert index.doc_id('not a title') is None
+            assert boolean_search('music AND canada NOT jazz', index) == boolean_search('music AND canada NOT jazz', compact)
+
+def test_small_index():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.bin')
+        write_index(path, fake_metadata)
+
+        with load_index(path) as index:
+            assert index.search('words') == ['an article title', 'another article title']
+            assert index.doc_id('títle ünicode') == 2
+            assert index.info(2) == {'author': 'andrea', 'timestamp': 5, 'length': 7}
+            assert index.keywords() == ['could', 'make', 'more', 'sentence', 'sentences', 'some', 'that', 'up', 'words']
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        # Not an index, empty, or cut short: always IndexFormatError
+        for contents in [b'not an index file at all, just some bytes' * 10, b'', data[:10], data[:len(data) // 2]]:
+            with open(path, 'wb') as f:
+                f.write(contents)
+            try:
+                load_index(path)
+                assert False
+            except IndexFormatError:
+                pass
+
+def test_shared_index_from_file():
+    expected = [search('dog'), combined_search('music', max_length=30000), boolean_keywords('music AND canada')]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'index.bin')
+        write_index(path, METADATA)
+        use_index_file(path)
+        try:
+            assert isinstance(default_compact_index(), MappedIndex)
+            assert default_index() is default_compact_index()
+            assert default_columns().titles == [default_compact_index().title(doc_id) for doc_id in range(len(METADATA))]
+            assert search('dog') == DOG
+            assert [search('dog'), combined_search('music', max_length=30000), boolean_keywords('music AND canada')] == expected
+        finally:
+            use_index_file(None)
+    assert not isinstance(default_compact_index(), MappedIndex)
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_small_index()
+    test_shared_index_from_file()
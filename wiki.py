@@ -1,93 +1,279 @@
-from constants import ADVANCED, ADVANCED_TO_QUESTION, BASIC, WIKI_API, ARTICLES, METADATA, TITLE_TO_INFO, KEYWORD_TO_TITLES
-import json
+from constants import ADVANCED, ADVANCED_TO_QUESTION, BASIC, WIKI_API, STOPWORDS
+from collections import Counter
+from itertools import repeat
 import re
-import requests
+import time
+
+# The corpus in corpus.py, the requests library and the worker pools are only
+# imported when first needed, so importing this module for the prompts or a
+# single accessor stays cheap.
 
 threshold = 5
 
-def _find_keywords(article):
-  keywords = []
-  count = {}
-  final_count = {}
+# Runs of word characters, the same tokens re.sub('\W+', ' ', article).split(' ') produced
+_WORD = re.compile(r'\w+')
 
-  article = re.sub('\W+',' ', article).split(' ')
+def _keyword_counts(article, cutoff=None, min_length=3, stopwords=()):
+  """Returns dictionary mapping each keyword of article to the number of times it appears
 
-  for word in article:
-    count[word.lower()] = count[word.lower()] + 1 if word.lower() in count.keys() else 1
+  Keywords are lowercased words appearing more than cutoff times, in order of
+  first appearance. Tokens are pulled out with a single precompiled regex pass
+  and counted with a Counter.
 
-  for key, value in count.items():
-    if value > threshold and len(key) > 2:
-      keywords.append(key)
-      final_count[key] = value
+  Args:
+    article - plain text of the article
+    cutoff - a word must appear more than this many times, defaults to the
+             module level threshold
+    min_length - shortest word length kept
+    stopwords - collection of lowercased words never returned as keywords, for
+                example STOPWORDS
+  """
+  if cutoff is None:
+    cutoff = threshold
+  count = Counter(map(str.lower, _WORD.findall(article)))
+  return {word: value for word, value in count.items()
+          if value > cutoff and len(word) >= min_length and word not in stopwords}
+
+def _find_keywords(article, cutoff=None, min_length=3, stopwords=()):
+  """ Returns list of the keywords of article, see _keyword_counts()
+  """
+  return list(_keyword_counts(article, cutoff, min_length, stopwords))
+
+def _token_positions(article):
+  """ Returns dictionary mapping each lowercased word of article to the list of its token positions
+  """
+  positions = {}
+  for position, word in enumerate(map(str.lower, _WORD.findall(article))):
+    positions.setdefault(word, []).append(position)
+  return positions
+
+def _keyword_counts_chunk(articles, cutoff):
+  """ Returns list of keyword count dictionaries for a chunk of articles, run inside worker processes
+  """
+  return [_keyword_counts(article, cutoff) for article in articles]
+
+def extract_keywords(articles, processes=1, chunk_size=64):
+  """ Returns list of keyword lists, one per article, see extract_keyword_counts()
+  """
+  return [list(counts) for counts in extract_keyword_counts(articles, processes, chunk_size)]
+
+def extract_keyword_counts(articles, processes=1, chunk_size=64):
+  """Returns list of keyword count dictionaries, one per article, in the same order as articles
 
+  With more than one process the articles are split into chunks of chunk_size
+  and handed to a ProcessPoolExecutor. Results are collected in chunk order, so
+  the output is identical to the serial path whatever order workers finish in.
+
+  Args:
+    articles - list of article extracts
+    processes - number of worker processes, None uses every core and 1 runs serially
+    chunk_size - number of articles sent to a worker at a time
+  """
+  articles = list(articles)
+  if processes == 1 or len(articles) <= chunk_size:
+    return _keyword_counts_chunk(articles, threshold)
+
+  from concurrent.futures import ProcessPoolExecutor
+  chunks = [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
+  keywords = []
+  with ProcessPoolExecutor(processes) as pool:
+    for chunk_keywords in pool.map(_keyword_counts_chunk, chunks, repeat(threshold)):
+      keywords.extend(chunk_keywords)
   return keywords
 
-def _create_id_to_metadata(info):
-  """Creates a dictionary of article ID to title, author, timestamp, num_characters, and list of keywords
+def _session(max_workers):
+  """ Returns a requests session whose connection pool can serve max_workers threads at once
+  """
+  import requests
+  session = requests.Session()
+  adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+  session.mount('http://', adapter)
+  session.mount('https://', adapter)
+  return session
+
+def _get_json(session, url, params, retries, backoff):
+  """Returns the decoded JSON body of a GET request, or None if it could not be fetched
+
+  Connection errors, 429 and 5xx responses and 200 responses whose body is not
+  JSON (a proxy or error page) are retried with exponential backoff, any other
+  status is treated as final.
+  """
+  import requests
+  for attempt in range(retries + 1):
+    try:
+      resp = session.get(url, params=params, timeout=30)
+    except requests.RequestException:
+      resp = None
+
+    if resp is not None:
+      if resp.status_code == 200:
+        try:
+          return resp.json()
+        except ValueError:
+          pass
+      elif resp.status_code != 429 and resp.status_code < 500:
+        return None
+
+    if attempt < retries:
+      time.sleep(backoff * 2 ** attempt)
+  return None
+
+def _fetch_batch(session, article_ids, api, retries, backoff):
+  """Returns dictionary mapping article ID to extract for one batch of page IDs
+
+  The batch is sent as a single pipe separated pageids request. When the API
+  holds back some extracts it answers with a continue block, which is sent back
+  until every page of the batch has been returned.
+  """
+  extracts = {}
+  url = api.format('|'.join(article_ids))
+  params = {}
+  while True:
+    body = _get_json(session, url, params, retries, backoff)
+    if body is None:
+      return extracts
+
+    for page in body.get('query', {}).get('pages', []):
+      if page.get('extract') is not None:
+        extracts[str(page.get('pageid'))] = page.get('extract')
+
+    if 'continue' not in body:
+      return extracts
+    params = body.get('continue')
+
+def fetch_extracts(article_ids, max_workers=16, batch_size=20, api=WIKI_API, retries=3, backoff=0.5):
+  """Fetches article extracts from Wikipedia in batches, concurrently
+
+  IDs are grouped into batches of batch_size and each batch is one pageids
+  request followed by its continuations. The API sends full extracts one per
+  response, so a batch still costs about one request per article that has an
+  extract; missing pages are all reported in the first response. Batches run
+  on a bounded pool of max_workers threads sharing one pooled HTTP session.
+
+  Args:
+    article_ids - list of Wikipedia page IDs
+    max_workers - maximum number of requests in flight
+    batch_size - number of page IDs per pageids request
+    api - URL template with one {} for the pipe separated page IDs, defaults to WIKI_API
+    retries - number of retries for failed requests
+    backoff - seconds to wait before the first retry, doubled on every retry
+
+  Returns: [extracts, missing] where extracts maps article ID to extract and
+  missing lists the IDs, in the given order, that no extract came back for
+  """
+  from concurrent.futures import ThreadPoolExecutor
+  article_ids = [str(article_id) for article_id in article_ids]
+  batches = [article_ids[i:i + batch_size] for i in range(0, len(article_ids), batch_size)]
+  extracts = {}
+
+  def fetch(batch):
+    # A batch that fails in any other way only loses its own IDs, which are
+    # reported as missing, instead of aborting every other batch
+    try:
+      return _fetch_batch(session, batch, api, retries, backoff)
+    except Exception:
+      return {}
+
+  with _session(max_workers) as session, ThreadPoolExecutor(max_workers) as pool:
+    for batch_extracts in pool.map(fetch, batches):
+      extracts.update(batch_extracts)
+
+  missing = [article_id for article_id in article_ids if article_id not in extracts]
+  return [extracts, missing]
+
+def _create_id_to_metadata(info, max_workers=16, batch_size=20, api=WIKI_API, processes=1):
+  """Creates a dictionary of article ID to title, author, timestamp, num_characters, list of keywords
+  and term_counts, a dictionary of keyword to number of occurrences used for ranking
 
   Args:
     info - JSON of information from BigQuery
+    max_workers - maximum number of requests to Wikipedia in flight
+    batch_size - number of page IDs per pageids request
+    api - URL template for fetching a batch of articles, defaults to WIKI_API
+    processes - number of processes extracting keywords, None uses every core
   """
   id_to_metadata = {}
-  id_set = set()
-  
+  extracts, missing = fetch_extracts([item.get('id') for item in info], max_workers, batch_size, api)
+  fetched = list(extracts)
+  counts = dict(zip(fetched, extract_keyword_counts([extracts[article_id] for article_id in fetched], processes)))
+
   for item in info:
     article_id = item.get('id')
-    #if article_id in id_set:
-    #  print(article_id)
-    id_set.add(article_id)
     # Delete the id from the dict
     del item['id']
-  
-    #print(article_id)
-    # Make a request to Wikipedia
-    resp = requests.get(WIKI_API.format(article_id))
 
-    if resp.status_code == 200:
-      item['keywords'] = _find_keywords(resp.json().get('query').get('pages')[0].get('extract'))
+    if str(article_id) in counts:
+      item['keywords'] = list(counts[str(article_id)])
+      item['term_counts'] = counts[str(article_id)]
       id_to_metadata[article_id] = item
   
+  if missing:
+    print('Missing articles: ' + str(missing))
   return id_to_metadata
 
-def _metadata_list(info):
-  """Creates a list of title, author, timestamp, num_characters, and list of keywords
+def _metadata_list(info, max_workers=16, batch_size=20, api=WIKI_API, processes=1, positions=False):
+  """Creates a list of title, author, timestamp, num_characters, list of keywords and term_counts,
+  a dictionary of keyword to number of occurrences used for ranking
 
   Args:
     info - JSON of information from BigQuery
+    max_workers - maximum number of requests to Wikipedia in flight
+    batch_size - number of page IDs per pageids request
+    api - URL template for fetching a batch of articles, defaults to WIKI_API
+    processes - number of processes extracting keywords, None uses every core
+    positions - also keep positions, a dictionary of every word to its token
+                positions, for positional.PositionalIndex
   """
-  metadata = []
-  
-  for item in info:
-    # Make a request to Wikipedia
-    article_id = item.get('id')
-    resp = requests.get(WIKI_API.format(article_id))
+  extracts, missing = fetch_extracts([item.get('id') for item in info], max_workers, batch_size, api)
+  metadata = [item for item in info if str(item.get('id')) in extracts]
+  counts = extract_keyword_counts([extracts[str(item.get('id'))] for item in metadata], processes)
 
-    if resp.status_code == 200:
-      item['keywords'] = _find_keywords(resp.json().get('query').get('pages')[0].get('extract'))
-      metadata.append(item)
+  for item, item_counts in zip(metadata, counts):
+    item['keywords'] = list(item_counts)
+    item['term_counts'] = item_counts
+    if positions:
+      item['positions'] = _token_positions(extracts[str(item.get('id'))])
   
+  if missing:
+    print('Missing articles: ' + str(missing))
   print(metadata)
   return metadata
 
+_titles = None
+
+def _corpus():
+  """ Returns the corpus module, importing it on the first call
+  """
+  import corpus
+  return corpus
+
+def articles():
+  """ Returns a list of article records (title, contributor_username, id, timestamp, num_characters)
+  """
+  return _corpus().ARTICLES
+
 def article_titles():
   """ Returns a list of article titles
   """
-  return list(map(lambda article: article.get('title'), ARTICLES))
+  global _titles
+  if _titles is None:
+    _titles = tuple(map(lambda article: article.get('title'), articles()))
+  return list(_titles)
 
 def article_metadata():
   """ Returns a list of article metadata (list of lists)
   """
-  return METADATA
+  return _corpus().METADATA
 
 def title_to_info_map():
   """ Returns a mapping of article title to metadata mapping
   """
-  return TITLE_TO_INFO
+  return _corpus().TITLE_TO_INFO
 
 def keyword_to_titles_map():
   """ Returns a mapping of keyword to article titles with keyword
   """
-  return KEYWORD_TO_TITLES
+  return _corpus().KEYWORD_TO_TITLES
 
 def _count_for_titles():
   """ Returns titles that have words in other titles
@@ -0,0 +1,208 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from urllib.parse import urlparse, parse_qs
+from wiki import fetch_extracts, extract_keywords, _metadata_list, _create_id_to_metadata, _find_keywords, STOPWORDS, threshold
+import json
+import re
+from copy import deepcopy
+
+# Canned extracts served by the stub Wikipedia API below
+EXTRACTS = {
+    '1': 'Dogs dogs dogs dogs dogs dogs and cats.',
+    '2': 'Music music music music music music rock rock rock rock rock rock.',
+    '3': 'Soccer soccer soccer soccer soccer soccer team.',
+}
+
+class StubWikiHandler(BaseHTTPRequestHandler):
+    # Number of 503 responses to send for a request whose first page ID is the key
+    failures = {}
+    # Number of 200 responses with a body that is not JSON, keyed the same way
+    garbage = {}
+    # Page IDs whose requests are answered with JSON that is not an API response
+    malformed = set()
+    # Most extracts returned per response, the rest are sent after a continue.
+    # The real API sends a single full text extract per response.
+    extracts_per_response = 1
+    # Page ID lists of every request answered
+    requests = []
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        article_ids = query['pageids'][0].split('|')
+        if self.failures.get(article_ids[0], 0) > 0:
+            self.failures[article_ids[0]] -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.garbage.get(article_ids[0], 0) > 0:
+            self.garbage[article_ids[0]] -= 1
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'<html>Bad gateway</html>')
+            return
+        if article_ids[0] in self.malformed:
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'["not", "a", "query"]')
+            return
+        self.requests.append(article_ids)
+
+        # Like the real API, pages already sent are skipped using the excontinue offset
+        offset = int(query.get('excontinue', ['0'])[0])
+        pages = []
+        sent = 0
+        for position, article_id in enumerate(article_ids):
+            if article_id not in EXTRACTS:
+                pages.append({'pageid': int(article_id), 'missing': True})
+            elif position >= offset and sent < self.extracts_per_response:
+                pages.append({'pageid': int(article_id), 'extract': EXTRACTS[article_id]})
+                sent += 1
+            else:
+                pages.append({'pageid': int(article_id)})
+        response = {'query': {'pages': pages}}
+        remaining = [article_id for article_id in article_ids[offset:] if article_id in EXTRACTS][sent:]
+        if remaining:
+            response['continue'] = {'excontinue': article_ids.index(remaining[0]), 'continue': '||'}
+
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def start_stub_server():
+    """
+    Starts the stub API on a free local port and returns (server, url template)
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubWikiHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{}/w/api.php?pageids={{}}'.format(server.server_port)
+
+def test_fetch_extracts():
+    server, api = start_stub_server()
+    try:
+        StubWikiHandler.failures = {'2': 2}
+        extracts, missing = fetch_extracts(['1', '2', '3', '404'], max_workers=4, batch_size=1, api=api, backoff=0)
+        assert extracts == EXTRACTS
+        assert missing == ['404']
+
+        # Giving up after the retries are used
+        StubWikiHandler.failures = {'2': 5}
+        extracts, missing = fetch_extracts(['1', '2'], max_workers=2, batch_size=1, api=api, retries=1, backoff=0)
+        assert extracts == {'1': EXTRACTS['1']}
+        assert missing == ['2']
+
+        # A 200 response that is not JSON is retried, and giving up on it only loses its batch
+        StubWikiHandler.failures = {}
+        StubWikiHandler.garbage = {'2': 1}
+        extracts, missing = fetch_extracts(['1', '2', '3'], max_workers=2, batch_size=1, api=api, backoff=0)
+        assert extracts == EXTRACTS
+        StubWikiHandler.garbage = {'2': 5}
+        extracts, missing = fetch_extracts(['1', '2', '3'], max_workers=2, batch_size=1, api=api, retries=1, backoff=0)
+        assert extracts == {'1': EXTRACTS['1'], '3': EXTRACTS['3']}
+        assert missing == ['2']
+
+        StubWikiHandler.garbage = {}
+        StubWikiHandler.malformed = {'3'}
+        extracts, missing = fetch_extracts(['1', '2', '3'], max_workers=2, batch_size=1, api=api, backoff=0)
+        assert extracts == {'1': EXTRACTS['1'], '2': EXTRACTS['2']}
+        assert missing == ['3']
+    finally:
+        server.shutdown()
+        StubWikiHandler.failures = {}
+        StubWikiHandler.garbage = {}
+        StubWikiHandler.malformed = set()
+
+def test_fetch_extract_batches():
+    server, api = start_stub_server()
+    try:
+        StubWikiHandler.requests = []
+        extracts, missing = fetch_extracts(['1', '404', '2', '3'], max_workers=2, batch_size=4, api=api, backoff=0)
+        assert extracts == EXTRACTS
+        assert missing == ['404']
+        # One batch, answered one extract at a time
+        assert StubWikiHandler.requests == [['1', '404', '2', '3']] * 3
+
+        StubWikiHandler.requests = []
+        extracts, missing = fetch_extracts([1, 2, 3, 7], max_workers=2, batch_size=2, api=api, backoff=0)
+        assert extracts == EXTRACTS
+        assert missing == ['7']
+        assert sorted(StubWikiHandler.requests) == [['1', '2'], ['1', '2'], ['3', '7']]
+    finally:
+        server.shutdown()
+        StubWikiHandler.requests = []
+
+def test_metadata_from_stub():
+    server, api = start_stub_server()
+    try:
+        info = [{'id': '3', 'title': 'Soccer'}, {'id': '404', 'title': 'Missing'}, {'id': '1', 'title': 'Dog'}]
+        assert _metadata_list(info, max_workers=2, api=api) == [{'id': '3', 'title': 'Soccer', 'keywords': ['soccer'], 'term_counts': {'soccer': 6}},
+                                                              {'id': '1', 'title': 'Dog', 'keywords': ['dogs'], 'term_counts': {'dogs': 6}}]
+
+        info = [{'id': '2', 'title': 'Music'}, {'id': '404', 'title': 'Missing'}]
+        assert _create_id_to_metadata(info, max_workers=2, api=api) == {'2': {'title': 'Music', 'keywords': ['music', 'rock'], 'term_counts': {'music': 6, 'rock': 6}}}
+
+        info = [{'id': '3', 'title': 'Soccer'}]
+        positions = _metadata_list(info, max_workers=2, api=api, positions=True)[0]['positions']
+        assert positions == {'soccer': [0, 1, 2, 3, 4, 5], 'team': [6]}
+    finally:
+        server.shutdown()
+
+def _find_keywords_reference(article):
+    """ The original keyword extractor, with its pattern now written as a raw string
+    """
+    keywords = []
+    count = {}
+    final_count = {}
+
+    article = re.sub(r'\W+',' ', article).split(' ')
+
+    for word in article:
+        count[word.lower()] = count[word.lower()] + 1 if word.lower() in count.keys() else 1
+
+    for key, value in count.items():
+        if value > threshold and len(key) > 2:
+            keywords.append(key)
+            final_count[key] = value
+
+    return keywords
+
+def test_find_keywords():
+    article = 'The dog, the DOG; the dog. The dog! the Dog? the dog_house dog\nand cats and and and and and and'
+    assert _find_keywords(article) == ['the', 'dog', 'and']
+    assert _find_keywords(article) == _find_keywords_reference(article)
+    assert _find_keywords(article, stopwords=STOPWORDS) == ['dog']
+    assert _find_keywords(article, cutoff=6) == ['and']
+    assert _find_keywords(article, cutoff=0, min_length=4) == ['dog_house', 'cats']
+    assert _find_keywords('') == []
+
+    for extract in EXTRACTS.values():
+        assert _find_keywords(extract) == _find_keywords_reference(extract)
+
+def test_extract_keywords():
+    articles = [extract * (i % 3 + 1) for i in range(40) for extract in EXTRACTS.values()]
+    serial = extract_keywords(articles)
+    assert serial == [_find_keywords(article) for article in articles]
+    assert extract_keywords(articles, processes=3, chunk_size=7) == serial
+    assert extract_keywords([], processes=2) == []
+
+def test_metadata_with_processes():
+    server, api = start_stub_server()
+    try:
+        info = [{'id': article_id, 'title': article_id} for article_id in ['3', '404', '1', '2']]
+        assert _metadata_list(deepcopy(info), api=api, processes=2) == _metadata_list(deepcopy(info), api=api)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    test_fetch_extracts()
+    test_fetch_extract_batches()
+    test_metadata_from_stub()
+    test_find_keywords()
+    test_extract_keywords()
+    test_metadata_with_processes()